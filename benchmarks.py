@@ -0,0 +1,351 @@
+"""Benchmark helpers module"""
+
+import argparse
+import functools
+import gc
+import json
+import math
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+from modules.crypto_utils import CryptoUtils
+from modules.csv_utils import CSVUtils
+from modules.data_processing import DataProcessor
+from modules.date_time_utils import DateTimeUtils
+from modules.file_operations import FileOps
+from modules.json_utils import JSONUtils
+from modules.math_utils import MathUtils
+from modules.string_utils import StringUtils
+from modules import vector_backend
+
+logger = logging.getLogger(__name__)
+
+# Each timing round calls the benchmark often enough to last at least this long,
+# so sub-millisecond cases are not dominated by timer and scheduler noise
+MIN_ROUND_SECONDS = 0.02
+
+def _round(func: Callable, loops: int) -> float:
+    """Per-call seconds of one timing round"""
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return (time.perf_counter() - start) / loops
+
+def _allocations(func: Callable) -> Tuple[int, int]:
+    """(tracemalloc peak, blocks still held afterwards) of one call"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak, max(blocks, 0)
+
+def measure_many(cases: List[Tuple[Callable, int]], repeat: int = 5,
+                 min_time: float = MIN_ROUND_SECONDS) -> List[Dict[str, Any]]:
+    """Time (func, items) cases, interleaving their rounds, and record their allocations
+    
+    Each case is first called once to calibrate the number of loops per round
+    (at least min_time per round), then the cases take turns running one round
+    each, so a burst of machine noise cannot slow every round of one case. The
+    reported seconds is the best per-call time. peak_bytes is the tracemalloc
+    peak during one extra call, and retained_blocks is the number of memory
+    blocks that call allocated and still held when it returned (its result plus
+    anything it cached).
+    """
+    gc.collect()
+    loops = []
+    for func, _ in cases:
+        start = time.perf_counter()
+        func()
+        first = time.perf_counter() - start
+        loops.append(max(1, math.ceil(min_time / first)) if first > 0 else 1000)
+    timings = [[] for _ in cases]
+    for _ in range(repeat):
+        for index, (func, _) in enumerate(cases):
+            timings[index].append(_round(func, loops[index]))
+    results = []
+    for (func, items), case_loops, case_timings in zip(cases, loops, timings):
+        peak, blocks = _allocations(func)
+        best = min(case_timings)
+        results.append({
+            'seconds': best,
+            'items_per_sec': items / best if items and best else None,
+            'peak_bytes': peak,
+            'retained_blocks': blocks,
+            'loops': case_loops
+        })
+    return results
+
+def measure(func: Callable, *args, repeat: int = 5, items: int = 0, min_time: float = MIN_ROUND_SECONDS,
+            **kwargs) -> Dict[str, Any]:
+    """Time func(*args, **kwargs) and record its allocations (see measure_many)"""
+    return measure_many([(functools.partial(func, *args, **kwargs), items)], repeat, min_time)[0]
+
+def format_results(results: List[Dict]) -> str:
+    """Format benchmark results as a table"""
+    lines = [f"{'benchmark':<40} {'size':>10} {'ms':>10} {'items/s':>14} {'peak KiB':>10} {'retained':>9}"]
+    for r in results:
+        rate = f"{r['items_per_sec']:,.0f}" if r.get('items_per_sec') else '-'
+        line = (f"{r['name']:<40} {r['size']:>10} {r['seconds'] * 1000:>10.3f} {rate:>14} "
+                f"{r['peak_bytes'] / 1024:>10.1f} {r.get('retained_blocks', '-'):>9}")
+        if 'ratio' in r:
+            line += f"  x{r['ratio']:.2f}" + ('  REGRESSION' if r.get('regression') else '')
+        lines.append(line)
+    return '\n'.join(lines)
+
+def _recursive_flatten(nested_list: List) -> List:
+    """Original recursive flatten_list, kept as the benchmark reference"""
+    result = []
+    for item in nested_list:
+        if isinstance(item, list):
+            result.extend(_recursive_flatten(item))
+        else:
+            result.append(item)
+    return result
+
+def bench_flatten(sizes=(1000, 100000)) -> List[Dict]:
+    """Compare recursive and iterative flatten on wide and deep inputs"""
+    processor = DataProcessor()
+    results = []
+    for size in sizes:
+        wide = [[i, [i, i]] for i in range(size // 3)]
+        depth = min(size, sys.getrecursionlimit() // 2)
+        deep = [0]
+        for i in range(depth):
+            deep = [i, deep]
+        cases = [
+            ('flatten wide (recursive)', _recursive_flatten, wide, size),
+            ('flatten wide (iterative)', processor.flatten_list, wide, size),
+            ('flatten wide (lazy, consumed)', lambda d: sum(1 for _ in processor.iter_flatten(d)), wide, size),
+            ('flatten deep (recursive)', _recursive_flatten, deep, depth),
+            ('flatten deep (iterative)', processor.flatten_list, deep, depth),
+        ]
+        timed = measure_many([(functools.partial(func, data), count) for _, func, data, count in cases])
+        results.extend({'name': name, 'size': count, **r} for (name, _, _, count), r in zip(cases, timed))
+    return results
+
+# Original regex implementations, kept as the benchmark reference
+_REGEX_TRANSFORMS = {
+    'slug_format': lambda text: re.sub(r'[^\w\s-]', '', text).strip().lower().replace(' ', '-'),
+    'snake_case': lambda text: re.sub(r'(?<!^)(?=[A-Z])', '_', text).lower(),
+    'remove_special_chars': lambda text: re.sub(r'[^a-zA-Z0-9\s]', '', text),
+}
+
+def bench_string_transforms(sizes=(10000, 100000), distinct: int = 500) -> List[Dict]:
+    """Compare regex, translate-table and memoized batch string transforms on repetitive column names"""
+    string_utils = StringUtils()
+    vocabulary = [f"Column Name {i} (Total%) HTTPStatus" for i in range(distinct)]
+    results = []
+    for size in sizes:
+        texts = [random.choice(vocabulary) for _ in range(size)]
+        for transform in StringUtils._TRANSFORMS:
+            func = getattr(string_utils, transform)
+            cases = [
+                ('per call', lambda: [func(t) for t in texts]),
+                ('batch memo', lambda: list(string_utils.transform_many(texts, transform))),
+            ]
+            if transform in _REGEX_TRANSFORMS:
+                regex = _REGEX_TRANSFORMS[transform]
+                cases.insert(0, ('regex', lambda: [regex(t) for t in texts]))
+            timed = measure_many([(run, size) for _, run in cases], repeat=3)
+            results.extend({'name': f"{transform} ({label})", 'size': size, **r} for (label, _), r in zip(cases, timed))
+    return results
+
+def bench_statistics(sizes=(10, 100, 1000, 10000, 100000)) -> List[Dict]:
+    """Compare Python and NumPy statistics backends on lists and buffers to locate the crossover"""
+    math_utils = MathUtils()
+    backends = ['python', 'numpy'] if vector_backend.HAS_NUMPY else ['python']
+    operations = ['average', 'median', 'standard_deviation', 'sum_of_squares']
+    results = []
+    for size in sizes:
+        values = [random.random() for _ in range(size)]
+        inputs = {'list': values, 'buffer': memoryview(array('d', values))}
+        names, cases = [], []
+        for operation in operations:
+            func = getattr(math_utils, operation)
+            for kind, data in inputs.items():
+                for backend in backends:
+                    names.append(f"{operation} ({kind}, {backend})")
+                    cases.append((functools.partial(func, data, backend=backend), size))
+        results.extend({'name': name, 'size': size, **r} for name, r in zip(names, measure_many(cases)))
+    return results
+
+def _records(size: int) -> List[Dict]:
+    """Synthetic records for data/CSV/JSON benchmarks"""
+    rng = random.Random(size)
+    cities = ['Paris', 'Berlin', 'Tokyo', 'Lima', 'Oslo', 'Cairo']
+    return [{'id': str(i), 'city': rng.choice(cities), 'score': str(rng.randint(0, 100))} for i in range(size)]
+
+def bench_suite(sizes=(10000,)) -> List[Dict]:
+    """Hot paths of every utility module, one row per module.operation and size"""
+    file_ops, crypto, csv_utils, json_utils = FileOps(), CryptoUtils(), CSVUtils(), JSONUtils()
+    processor, string_utils, math_utils, dates = DataProcessor(), StringUtils(), MathUtils(), DateTimeUtils()
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            rng = random.Random(size)
+            records = _records(size)
+            text = '\n'.join(f"line {i} of the benchmark file" for i in range(size))
+            text_path = os.path.join(workdir, 'bench.txt')
+            append_path = os.path.join(workdir, 'append.txt')
+            csv_path = os.path.join(workdir, 'bench.csv')
+            json_path = os.path.join(workdir, 'bench.json')
+            file_ops.create_file(text_path, text)
+            csv_utils.write_csv(csv_path, records)
+            json_utils.save_json(json_path, records)
+            words = [f"Column Name {rng.randint(0, 500)} (Total%)" for _ in range(size)]
+            start = datetime(2020, 1, 1)
+            dates_text = [(start + timedelta(seconds=rng.randint(0, 10 ** 8))).strftime('%Y-%m-%d %H:%M:%S')
+                          for _ in range(size)]
+            numbers = [rng.random() for _ in range(size)]
+            
+            def append_lines():
+                for i in range(size // 10):
+                    file_ops.append_to_file(append_path, f"appended line {i}\n")
+            cases = [
+                ('file.create_file', lambda: file_ops.create_file(text_path, text), size),
+                ('file.read_file', lambda: file_ops.read_file(text_path), size),
+                ('file.append_to_file', append_lines, size // 10),
+                ('crypto.sha256_hash', lambda: crypto.sha256_hash(text), size),
+                ('crypto.hash_file', lambda: crypto.hash_file(text_path), size),
+                ('csv.write_csv', lambda: csv_utils.write_csv(csv_path, records), size),
+                ('csv.read_csv', lambda: csv_utils.read_csv(csv_path), size),
+                ('json.save_json', lambda: json_utils.save_json(json_path, records), size),
+                ('json.load_json', lambda: json_utils.load_json(json_path), size),
+                ('data.filter_by_key', lambda: processor.filter_by_key(records, 'city', 'Oslo'), size),
+                ('data.group_by_key', lambda: processor.group_by_key(records, 'city'), size),
+                ('data.sort_by_key', lambda: processor.sort_by_key(records, 'score'), size),
+                ('string.slug_format', lambda: [string_utils.slug_format(w) for w in words], size),
+                ('string.transform_many', lambda: list(string_utils.transform_many(words, 'slug_format')), size),
+                ('string.word_frequency', lambda: string_utils.word_frequency(text), size),
+                ('date.parse_column', lambda: dates.parse_column(dates_text, '%Y-%m-%d %H:%M:%S'), size),
+                ('date.strptime (reference)', lambda: [datetime.strptime(d, '%Y-%m-%d %H:%M:%S') for d in dates_text],
+                 size),
+                ('math.average', lambda: math_utils.average(numbers), size),
+                ('math.median', lambda: math_utils.median(numbers), size),
+                ('math.standard_deviation', lambda: math_utils.standard_deviation(numbers), size),
+                ('math.is_prime_batch', lambda: math_utils.is_prime_batch(range(size)), size),
+            ]
+            timed = measure_many([(run, count) for _, run, count in cases])
+            results.extend({'name': name, 'size': size, **r} for (name, _, _), r in zip(cases, timed))
+    return results
+
+BENCHMARKS = {
+    'suite': bench_suite,
+    'flatten': bench_flatten,
+    'statistics': bench_statistics,
+    'strings': bench_string_transforms,
+}
+
+def save_results(results: List[Dict], filepath: str) -> None:
+    """Write results and environment metadata as JSON"""
+    payload = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'created': datetime.now().isoformat(timespec='seconds')
+        },
+        'results': results
+    }
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+
+def load_results(filepath: str) -> List[Dict]:
+    """Read results saved by save_results"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)['results']
+
+def compare_results(results: List[Dict], baseline: List[Dict], threshold: float = 0.25,
+                    noise_floor: float = 1e-5) -> List[Dict]:
+    """Annotate results with their time ratio to the baseline and flag regressions
+    
+    A result regresses when it is slower than the baseline by more than
+    threshold (relative) and by more than noise_floor seconds per call.
+    """
+    reference = {(r['name'], r['size']): r for r in baseline}
+    for result in results:
+        base = reference.get((result['name'], result['size']))
+        if base is None or not base['seconds']:
+            continue
+        result['ratio'] = result['seconds'] / base['seconds']
+        result['regression'] = (result['ratio'] > 1 + threshold
+                                and result['seconds'] - base['seconds'] > noise_floor)
+    return results
+
+def best_results(results: List[Dict], rerun: List[Dict]) -> List[Dict]:
+    """Per (name, size), the faster of two runs of the same benchmarks"""
+    faster = {(r['name'], r['size']): r for r in rerun}
+    merged = []
+    for result in results:
+        other = faster.get((result['name'], result['size']))
+        merged.append(other if other is not None and other['seconds'] < result['seconds'] else result)
+    return merged
+
+def _run(names: List[str], sizes: Optional[str]) -> List[Dict]:
+    """Run benchmarks by name with optional comma-separated sizes"""
+    results = []
+    for name in names:
+        if sizes:
+            results.extend(BENCHMARKS[name](sizes=tuple(int(size) for size in sizes.split(','))))
+        else:
+            results.extend(BENCHMARKS[name]())
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmarks from the command line; exits 1 when a regression is flagged"""
+    parser = argparse.ArgumentParser(prog='bench', description='Run the BIG Utility benchmarks')
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help=f"benchmarks to run ({', '.join(BENCHMARKS)}; default: suite)")
+    parser.add_argument('--sizes', default=None, help='comma-separated data sizes (default: per benchmark)')
+    parser.add_argument('--save', metavar='FILE', help='write results to a JSON file')
+    parser.add_argument('--baseline', metavar='FILE', help='compare against results saved with --save')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='slowdown ratio above baseline flagged as a regression (default: 0.25)')
+    parser.add_argument('--noise-floor', type=float, default=1e-5,
+                        help='seconds per call a slowdown must also exceed (default: 0.00001)')
+    parser.add_argument('--confirm', type=int, default=2,
+                        help='re-measure up to N times while regressions are flagged, keeping best times (default: 2)')
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    
+    names = args.names or ['suite']
+    results = _run(names, args.sizes)
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        compare_results(results, baseline, args.threshold, args.noise_floor)
+        for _ in range(args.confirm):
+            if not any(r.get('regression') for r in results):
+                break
+            # Noise only ever slows a run down, so a real regression survives re-measuring
+            results = compare_results(best_results(results, _run(names, args.sizes)), baseline,
+                                      args.threshold, args.noise_floor)
+    print(format_results(results))
+    if args.save:
+        save_results(results, args.save)
+        print(f"Saved results to {args.save}")
+    regressions = [r for r in results if r.get('regression')]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Precomputed calendar tables module"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+MIN_YEAR, MAX_YEAR = 1, 9999
+SECONDS_PER_DAY = 86400
+# Days from 0001-01-01 to 1970-01-01
+_EPOCH_ORDINAL = 719162
+
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def _is_leap(year: int) -> bool:
+    """Gregorian leap year rule"""
+    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+
+# All tables are indexed by year (0..MAX_YEAR + 1) or by (leap flag, month 1..12)
+LEAP_YEARS = bytearray(_is_leap(y) for y in range(MAX_YEAR + 2))
+DAYS_IN_MONTH = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+DAYS_BEFORE_MONTH = tuple(
+    tuple(sum(months[1:m]) for m in range(13)) for months in DAYS_IN_MONTH
+)
+# Day number (days since 1970-01-01) of January 1st of each year
+YEAR_START_DAYS = array('q', (
+    (y - 1) * 365 + (y - 1) // 4 - (y - 1) // 100 + (y - 1) // 400 - _EPOCH_ORDINAL
+    for y in range(MAX_YEAR + 2)
+))
+# 53-week ISO years start on a Thursday, or on a Wednesday in leap years
+ISO_WEEKS_IN_YEAR = bytearray(
+    53 if (YEAR_START_DAYS[y] + 3) % 7 == 3 or ((YEAR_START_DAYS[y] + 3) % 7 == 2 and LEAP_YEARS[y]) else 52
+    for y in range(MAX_YEAR + 2)
+)
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """Day number (days since 1970-01-01) of a date; ValueError for invalid dates like datetime()"""
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"year {year} is out of range")
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12")
+    leap = LEAP_YEARS[year]
+    if not 1 <= day <= DAYS_IN_MONTH[leap][month]:
+        raise ValueError("day is out of range for month")
+    return YEAR_START_DAYS[year] + DAYS_BEFORE_MONTH[leap][month] + day - 1
+
+def civil_from_days(days: int) -> Tuple[int, int, int]:
+    """(year, month, day) of a day number"""
+    year = bisect_right(YEAR_START_DAYS, days) - 1
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise ValueError(f"day number {days} is out of range")
+    day_of_year = days - YEAR_START_DAYS[year]
+    before = DAYS_BEFORE_MONTH[LEAP_YEARS[year]]
+    month = bisect_right(before, day_of_year, 1) - 1
+    return year, month, day_of_year - before[month] + 1
+
+def weekday(days: int) -> int:
+    """Weekday of a day number (Monday == 0); 1970-01-01 was a Thursday"""
+    return (days + 3) % 7
+
+def iso_week(days: int) -> int:
+    """ISO-8601 week number of a day number"""
+    year = bisect_right(YEAR_START_DAYS, days) - 1
+    week = (days - YEAR_START_DAYS[year] - (days + 3) % 7 + 10) // 7
+    if week < 1:
+        return ISO_WEEKS_IN_YEAR[year - 1]
+    if week > ISO_WEEKS_IN_YEAR[year]:
+        return 1
+    return week
+
+def epoch_from_datetime(dt: datetime) -> int:
+    """Epoch seconds of a datetime (naive values are read as UTC; microseconds dropped)"""
+    offset = dt.utcoffset()
+    seconds = days_from_civil(dt.year, dt.month, dt.day) * SECONDS_PER_DAY + dt.hour * 3600 + dt.minute * 60 + dt.second
+    return seconds - int(offset.total_seconds()) if offset else seconds
+
+def datetime_from_epoch(seconds: int) -> datetime:
+    """Naive datetime of epoch seconds"""
+    days, rest = divmod(seconds, SECONDS_PER_DAY)
+    hour, rest = divmod(rest, 3600)
+    return datetime(*civil_from_days(days), hour, *divmod(rest, 60))
\ No newline at end of file
@@ -39,7 +39,7 @@ class CLIInterface:
             except KeyboardInterrupt:
                 self.exit_program()
             except Exception as e:
-                logger.error(f"Error: {e}")
+                logger.error("Error: %s", e)
     
     def show_help(self):
         """Show help"""
@@ -0,0 +1,236 @@
+"""Batch and daemon command execution module"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Generator results are materialized; this bounds infinite ones (e.g. iter_primes)
+MAX_ITER_ITEMS = 100000
+
+# Methods commands may not call: demo() prints to stdout, which would corrupt --batch NDJSON output
+EXCLUDED_METHODS = frozenset({'demo'})
+
+def _json_default(obj: Any) -> Any:
+    """JSON encoding for the non-JSON types utility methods return"""
+    if isinstance(obj, (set, frozenset, tuple, array)):
+        return list(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode('utf-8', errors='replace')
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return str(obj)
+
+def encode(response: Dict[str, Any]) -> str:
+    """One NDJSON line"""
+    return json.dumps(response, default=_json_default, separators=(',', ':')) + '\n'
+
+class CommandExecutor:
+    """Runs JSON commands against a BigUtility
+    
+    A command is {"id": ..., "command": "math_utils.factorial", "args": [...],
+    "kwargs": {...}} (or "utility" and "method" keys instead of "command"),
+    and the response is {"id": ..., "ok": true, "result": ...} or
+    {"id": ..., "ok": false, "error": "..."}. Only public methods of the
+    registered utilities, minus EXCLUDED_METHODS, can be called.
+    """
+    
+    def __init__(self, utility: Any, utilities: Iterable[str]):
+        self.utility = utility
+        self.utilities = frozenset(utilities)
+    
+    def resolve(self, command: Dict[str, Any]):
+        """The bound method a command refers to"""
+        if 'command' in command:
+            utility_name, _, method_name = str(command['command']).partition('.')
+        else:
+            utility_name, method_name = command.get('utility', ''), command.get('method', '')
+        if utility_name not in self.utilities:
+            raise ValueError(f"Unknown utility: {utility_name}")
+        if not method_name or method_name.startswith('_') or method_name in EXCLUDED_METHODS:
+            raise ValueError(f"Invalid method: {method_name}")
+        method = getattr(getattr(self.utility, utility_name), method_name, None)
+        if not callable(method):
+            raise ValueError(f"Unknown method: {utility_name}.{method_name}")
+        return method
+    
+    def execute(self, command: Any) -> Dict[str, Any]:
+        """Run one decoded command and build its response"""
+        command_id = command.get('id') if isinstance(command, dict) else None
+        try:
+            if not isinstance(command, dict):
+                raise ValueError("Command must be a JSON object")
+            method = self.resolve(command)
+            result = method(*command.get('args', ()), **command.get('kwargs', {}))
+            if hasattr(result, '__next__'):
+                result = list(islice(result, MAX_ITER_ITEMS + 1))
+                if len(result) > MAX_ITER_ITEMS:
+                    raise ValueError(f"Result iterator yields more than {MAX_ITER_ITEMS} items")
+            return {'id': command_id, 'ok': True, 'result': result}
+        except Exception as e:
+            return {'id': command_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    
+    def execute_line(self, line: str) -> Optional[str]:
+        """Run one NDJSON line and return the encoded response (None for blank lines)"""
+        if not line.strip():
+            return None
+        try:
+            command = json.loads(line)
+        except ValueError as e:
+            return encode({'id': None, 'ok': False, 'error': f"Invalid JSON: {e}"})
+        return encode(self.execute(command))
+    
+    def iter_responses(self, lines: Iterable[str], workers: int = 1) -> Iterator[str]:
+        """Execute lines lazily, yielding responses in input order
+        
+        With workers > 1, commands run on a thread pool with a bounded number
+        in flight, so unbounded input (e.g. stdin) is streamed, not buffered.
+        """
+        if workers <= 1:
+            for line in lines:
+                response = self.execute_line(line)
+                if response is not None:
+                    yield response
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for line in lines:
+                in_flight.append(pool.submit(self.execute_line, line))
+                if len(in_flight) >= workers * 4:
+                    response = in_flight.popleft().result()
+                    if response is not None:
+                        yield response
+            while in_flight:
+                response = in_flight.popleft().result()
+                if response is not None:
+                    yield response
+    
+    def run_batch(self, infile: TextIO, outfile: TextIO, workers: int = 1) -> int:
+        """Stream NDJSON commands from infile to responses on outfile; returns the response count"""
+        count = 0
+        for response in self.iter_responses(infile, workers):
+            outfile.write(response)
+            outfile.flush()
+            count += 1
+        return count
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """One client connection: NDJSON commands in, NDJSON responses out
+    
+    This thread only reads lines; each command runs on the server's bounded
+    pool, and a writer thread sends responses back in order as they finish.
+    An idle connection therefore holds no pool worker.
+    """
+    
+    def handle(self):
+        server = self.server
+        pending: queue.Queue = queue.Queue(maxsize=server.window)
+        writer = threading.Thread(target=self._write_responses, args=(pending,), daemon=True)
+        writer.start()
+        try:
+            for raw in self.rfile:
+                pending.put(server.pool.submit(server.executor.execute_line, raw.decode('utf-8', errors='replace')))
+        finally:
+            pending.put(None)
+            writer.join()
+    
+    def _write_responses(self, pending: queue.Queue) -> None:
+        """Write responses in command order; after a write error, keep draining so the reader never blocks"""
+        connected = True
+        while True:
+            future = pending.get()
+            if future is None:
+                return
+            response = future.result()
+            if response is None or not connected:
+                continue
+            try:
+                self.wfile.write(response.encode('utf-8'))
+                self.wfile.flush()
+            except OSError:
+                connected = False
+
+def _socket_in_use(socket_path: str) -> bool:
+    """Whether a live server accepts connections on a Unix socket"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket daemon: one reader thread per connection, commands run on a fixed-size worker pool"""
+    
+    daemon_threads = True
+    
+    def __init__(self, socket_path: str, executor: CommandExecutor, workers: int = 8):
+        try:
+            mode = os.lstat(socket_path).st_mode
+        except FileNotFoundError:
+            mode = None
+        if mode is not None:
+            # Only ever replace a stale socket, never a regular file or a running daemon
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            if _socket_in_use(socket_path):
+                raise FileExistsError(f"A server is already listening on {socket_path}")
+            os.remove(socket_path)
+        self.executor = executor
+        self.window = workers * 4
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='command-worker')
+        super().__init__(socket_path, _CommandHandler)
+    
+    def server_bind(self):
+        super().server_bind()
+        # The daemon can delete and write files, so only the owner may connect
+        os.chmod(self.server_address, 0o600)
+    
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False)
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+def serve(socket_path: str, executor: CommandExecutor, workers: int = 8) -> None:
+    """Run the command daemon until interrupted"""
+    with CommandServer(socket_path, executor, workers) as server:
+        logger.info("Serving commands on %s with %s workers", socket_path, workers)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+def send_commands(socket_path: str, commands: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Client: pipeline commands over one daemon connection and yield decoded responses as they arrive"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        
+        def write_all():
+            # Writing from a separate thread keeps both socket buffers draining
+            with sock.makefile('wb') as out:
+                for command in commands:
+                    out.write(encode(command).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+        writer = threading.Thread(target=write_all, daemon=True)
+        writer.start()
+        with sock.makefile('rb') as stream:
+            for line in stream:
+                yield json.loads(line)
+        writer.join()
\ No newline at end of file
@@ -22,7 +22,7 @@ class ConfigManager:
                     return json.load(f)
             return {}
         except Exception as e:
-            logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             return {}
     
     def save(self) -> bool:
@@ -30,10 +30,10 @@ class ConfigManager:
         try:
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
-            logger.info(f"Saved config to {self.config_file}")
+            logger.info("Saved config to %s", self.config_file)
             return True
         except Exception as e:
-            logger.error(f"Failed to save config: {e}")
+            logger.error("Failed to save config: %s", e)
             return False
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -59,7 +59,7 @@ class ConfigManager:
             config[keys[-1]] = value
             return self.save()
         except Exception as e:
-            logger.error(f"Failed to set config: {e}")
+            logger.error("Failed to set config: %s", e)
             return False
     
     def demo(self):
@@ -55,7 +55,7 @@ class CryptoUtils:
                     hash_func.update(chunk)
             return hash_func.hexdigest()
         except Exception as e:
-            logger.error(f"Failed to hash file: {e}")
+            logger.error("Failed to hash file: %s", e)
             return ""
     
     def demo(self):
@@ -16,7 +16,7 @@ class CSVUtils:
                 reader = csv.DictReader(f)
                 return list(reader)
         except Exception as e:
-            logger.error(f"Failed to read CSV: {e}")
+            logger.error("Failed to read CSV: %s", e)
             return []
     
     def write_csv(self, filepath: str, data: List[Dict], fieldnames: List[str] = None) -> bool:
@@ -32,10 +32,10 @@ class CSVUtils:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(data)
-            logger.info(f"Saved CSV to {filepath}")
+            logger.info("Saved CSV to %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to write CSV: {e}")
+            logger.error("Failed to write CSV: %s", e)
             return False
     
     def get_column(self, data: List[Dict], column: str) -> List:
@@ -1,8 +1,10 @@
 """Data processing module"""
 
-from typing import List, Dict, Any
+from collections.abc import Iterable as IterableABC, Mapping
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import statistics
 import logging
+from modules.sketches import HyperLogLog, SpaceSaving, QuantileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +14,42 @@ class DataProcessor:
     def flatten_list(self, nested_list: List) -> List:
         """Flatten nested list"""
         result = []
-        for item in nested_list:
-            if isinstance(item, list):
-                result.extend(self.flatten_list(item))
+        append = result.append
+        stack = [iter(nested_list)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, list):
+                    stack.append(iter(item))
+                    break
+                append(item)
             else:
-                result.append(item)
+                stack.pop()
         return result
     
+    def iter_flatten(self, nested: Iterable, flatten_tuples: bool = False, flatten_iterables: bool = False,
+                     max_depth: Optional[int] = None) -> Iterator:
+        """Lazily flatten nested data at any depth without recursion
+        
+        Lists are always flattened; tuples and (with flatten_iterables) any other
+        iterable are flattened on request. Strings, bytes and mappings are atoms.
+        max_depth limits how many nesting levels are expanded.
+        """
+        if flatten_iterables:
+            nested_types, atom_types = IterableABC, (str, bytes, bytearray, Mapping)
+        else:
+            nested_types, atom_types = ((list, tuple) if flatten_tuples else list), ()
+        limit = float('inf') if max_depth is None else max_depth
+        
+        stack = [iter(nested)]
+        while stack:
+            for item in stack[-1]:
+                if isinstance(item, nested_types) and not isinstance(item, atom_types) and len(stack) <= limit:
+                    stack.append(iter(item))
+                    break
+                yield item
+            else:
+                stack.pop()
+    
     def remove_duplicates(self, items: List) -> List:
         """Remove duplicates from list"""
         return list(dict.fromkeys(items))
@@ -64,6 +95,27 @@ class DataProcessor:
         """Get unique values for a key"""
         return list(set(item.get(key) for item in data))
     
+    def approx_unique_count(self, data: Iterable[Dict], key: str, precision: int = 14) -> int:
+        """Estimate distinct values for a key in fixed memory (HyperLogLog)"""
+        return HyperLogLog(precision).update(item.get(key) for item in data).count()
+    
+    def approx_top_values(self, data: Iterable[Dict], key: str, k: int = 10,
+                          capacity: int = 1000) -> List[Tuple[Any, int]]:
+        """Estimate the k most frequent values for a key in fixed memory (Space-Saving)"""
+        summary = SpaceSaving(max(k, capacity)).update(item.get(key) for item in data)
+        return [(value, count) for value, count, _ in summary.top(k)]
+    
+    def approx_quantiles(self, data: Iterable[Dict], key: str,
+                         quantiles: Iterable[float] = (0.5, 0.9, 0.99), k: int = 200) -> Dict[float, Any]:
+        """Estimate quantiles of a numeric key in fixed memory (KLL sketch)"""
+        quantiles = list(quantiles)
+        sketch = QuantileSketch(k)
+        for item in data:
+            value = item.get(key)
+            if value is not None:
+                sketch.add(value)
+        return dict(zip(quantiles, sketch.quantiles(quantiles)))
+    
     def transpose_matrix(self, matrix: List[List]) -> List[List]:
         """Transpose a matrix"""
         return [list(row) for row in zip(*matrix)]
@@ -91,4 +143,8 @@ class DataProcessor:
         
         data = [{'name': 'Alice', 'age': 30}, {'name': 'Bob', 'age': 25}]
         filtered = self.filter_by_key(data, 'name', 'Alice')
-        print(f"✓ Filter by name=Alice: {filtered}")
\ No newline at end of file
+        print(f"✓ Filter by name=Alice: {filtered}")
+        
+        events = [{'user': i % 250, 'latency': i % 97} for i in range(10000)]
+        print(f"✓ Approx unique users: {self.approx_unique_count(events, 'user')}")
+        print(f"✓ Approx p50/p99 latency: {self.approx_quantiles(events, 'latency', (0.5, 0.99))}")
\ No newline at end of file
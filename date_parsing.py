@@ -0,0 +1,119 @@
+"""Fast date/time parsing module"""
+
+import functools
+import re
+from datetime import datetime
+from typing import Callable, Optional
+import logging
+from modules.memoize import memoized
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATE_FORMAT = '%Y-%m-%d'
+DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Same field patterns as the stdlib _strptime module, so compiled parsers accept exactly what strptime accepts
+_FIELD_PATTERNS = {
+    'd': r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    'f': r"(?P<f>[0-9]{1,6})",
+    'H': r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    'm': r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    'M': r"(?P<M>[0-5]\d|\d)",
+    'S': r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    'y': r"(?P<y>\d\d)",
+    'Y': r"(?P<Y>\d\d\d\d)",
+}
+
+def _is_digits(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is ASCII digits"""
+    part = text[start:end]
+    return part.isascii() and part.isdigit()
+
+def _parse_default_date(text: str) -> Optional[datetime]:
+    """Fast path for zero-padded '%Y-%m-%d'; None when the shape does not match"""
+    if (len(text) == 10 and text[4] == '-' and text[7] == '-'
+            and _is_digits(text, 0, 4) and _is_digits(text, 5, 7) and _is_digits(text, 8, 10)):
+        return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    return None
+
+def _parse_default_datetime(text: str) -> Optional[datetime]:
+    """Fast path for zero-padded '%Y-%m-%d %H:%M:%S'; None when the shape does not match"""
+    if (len(text) == 19 and text[4] == '-' and text[7] == '-' and text[10] == ' '
+            and text[13] == ':' and text[16] == ':'
+            and _is_digits(text, 0, 4) and _is_digits(text, 5, 7) and _is_digits(text, 8, 10)
+            and _is_digits(text, 11, 13) and _is_digits(text, 14, 16) and _is_digits(text, 17, 19)):
+        return datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                        int(text[11:13]), int(text[14:16]), int(text[17:19]))
+    return None
+
+_FAST_PARSERS = {DEFAULT_DATE_FORMAT: _parse_default_date, DEFAULT_DATETIME_FORMAT: _parse_default_datetime}
+
+def fast_parser(fmt: str) -> Optional[Callable[[str], Optional[datetime]]]:
+    """Hand-written parser for a default format (None for other formats); it returns None on a shape mismatch"""
+    return _FAST_PARSERS.get(fmt)
+
+@functools.lru_cache(maxsize=64)
+def compile_format(fmt: str) -> Optional[Callable[[str], Optional[datetime]]]:
+    """Compile a strptime format made only of numeric fields into a regex parser
+    
+    Returns None for formats using other directives (names, %z, %p...), which
+    are left to strptime. The parser returns None when the text does not match.
+    """
+    parts = []
+    index = 0
+    while index < len(fmt):
+        char = fmt[index]
+        if char == '%':
+            if index + 1 >= len(fmt):
+                return None
+            directive = fmt[index + 1]
+            if directive == '%':
+                parts.append('%')
+            elif directive in _FIELD_PATTERNS and f"(?P<{directive}>" not in ''.join(parts):
+                parts.append(_FIELD_PATTERNS[directive])
+            else:
+                return None
+            index += 2
+        else:
+            parts.append(r'\s+' if char.isspace() else re.escape(char))
+            index += 1
+    regex = re.compile(''.join(parts), re.IGNORECASE)
+    
+    def parse(text: str) -> Optional[datetime]:
+        """Parse text, or None when it does not match the format"""
+        match = regex.fullmatch(text)
+        if match is None:
+            return None
+        fields = match.groupdict()
+        if 'Y' in fields:
+            year = int(fields['Y'])
+        elif 'y' in fields:
+            year = int(fields['y'])
+            year += 1900 if year >= 69 else 2000
+        else:
+            year = 1900
+        microsecond = int(fields['f'].ljust(6, '0')) if 'f' in fields else 0
+        return datetime(year, int(fields.get('m', 1)), int(fields.get('d', 1)), int(fields.get('H', 0)),
+                        int(fields.get('M', 0)), int(fields.get('S', 0)), microsecond)
+    return parse
+
+def _parse_uncached(text: str, fmt: str) -> datetime:
+    """Parse text with the fastest parser available for fmt"""
+    fast = _FAST_PARSERS.get(fmt)
+    result = fast(text) if fast else None
+    if result is None:
+        parser = compile_format(fmt)
+        if parser is not None:
+            result = parser(text)
+    # strptime handles everything else and raises the usual ValueError for bad input
+    return result if result is not None else datetime.strptime(text, fmt)
+
+_parse_cached = memoized(maxsize=8192, name='date_time_utils.parse')(_parse_uncached)
+
+def parse_datetime(text: str, fmt: str = DEFAULT_DATETIME_FORMAT, cache: bool = True) -> datetime:
+    """Drop-in replacement for datetime.strptime with fast paths and a memo cache for repeated strings"""
+    return _parse_cached(text, fmt) if cache else _parse_uncached(text, fmt)
+
+def parse_iso(text: str) -> datetime:
+    """Parse an ISO-8601 date or datetime (datetime.fromisoformat)"""
+    return datetime.fromisoformat(text)
\ No newline at end of file
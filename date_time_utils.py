@@ -1,8 +1,14 @@
 """Date and time utilities module"""
 
+from array import array
 from datetime import datetime, timedelta, timezone
 import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 import logging
+from modules import calendar_tables as cal
+from modules.date_parsing import DEFAULT_DATE_FORMAT, DEFAULT_DATETIME_FORMAT, fast_parser, parse_datetime, parse_iso
+from modules.time_windows import TimeWindowAggregator, aggregate_windows
+from modules.memoize import cache_stats
 
 logger = logging.getLogger(__name__)
 
@@ -19,30 +25,39 @@ class DateTimeUtils:
     
     def days_between(self, date1: str, date2: str, fmt: str = '%Y-%m-%d') -> int:
         """Calculate days between two dates"""
-        d1 = datetime.strptime(date1, fmt)
-        d2 = datetime.strptime(date2, fmt)
+        d1 = parse_datetime(date1, fmt)
+        d2 = parse_datetime(date2, fmt)
         return abs((d2 - d1).days)
     
     def add_days(self, date_str: str, days: int, fmt: str = '%Y-%m-%d') -> str:
         """Add days to a date"""
-        date = datetime.strptime(date_str, fmt)
+        date = parse_datetime(date_str, fmt)
         new_date = date + timedelta(days=days)
         return new_date.strftime(fmt)
     
     def add_hours(self, datetime_str: str, hours: int) -> str:
         """Add hours to datetime"""
-        dt = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
+        dt = parse_datetime(datetime_str, '%Y-%m-%d %H:%M:%S')
         new_dt = dt + timedelta(hours=hours)
         return new_dt.strftime('%Y-%m-%d %H:%M:%S')
     
     def get_day_of_week(self, date_str: str) -> str:
         """Get day of week"""
-        date = datetime.strptime(date_str, '%Y-%m-%d')
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        return days[date.weekday()]
+        date = parse_datetime(date_str, '%Y-%m-%d')
+        return cal.WEEKDAY_NAMES[date.weekday()]
+    
+    def parse(self, text: str, fmt: Optional[str] = None) -> datetime:
+        """Parse a date/time string (ISO-8601 when fmt is None)"""
+        return parse_iso(text) if fmt is None else parse_datetime(text, fmt)
+    
+    def parse_cache_stats(self) -> Dict[str, Dict]:
+        """Get hit/miss statistics of the parsed-string memo cache"""
+        return cache_stats('date_time_utils.')
     
     def is_leap_year(self, year: int) -> bool:
         """Check if year is leap year"""
+        if 0 <= year <= cal.MAX_YEAR:
+            return bool(cal.LEAP_YEARS[year])
         return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
     
     def get_timestamp(self) -> int:
@@ -55,19 +70,96 @@ class DateTimeUtils:
     
     def datetime_to_timestamp(self, datetime_str: str) -> int:
         """Convert datetime to timestamp"""
-        dt = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
+        dt = parse_datetime(datetime_str, '%Y-%m-%d %H:%M:%S')
         return int(dt.timestamp())
     
     def get_week_number(self, date_str: str) -> int:
         """Get week number of year"""
-        date = datetime.strptime(date_str, '%Y-%m-%d')
-        return date.isocalendar()[1]
+        date = parse_datetime(date_str, '%Y-%m-%d')
+        return cal.iso_week(cal.days_from_civil(date.year, date.month, date.day))
     
     def get_days_in_month(self, year: int, month: int) -> int:
         """Get number of days in month"""
-        if month == 2:
-            return 29 if self.is_leap_year(year) else 28
-        return 31 if month in [1,3,5,7,8,10,12] else 30
+        if not 1 <= month <= 12:
+            raise ValueError("month must be in 1..12")
+        return cal.DAYS_IN_MONTH[self.is_leap_year(year)][month]
+    
+    def parse_column(self, values: Iterable[str], fmt: str = DEFAULT_DATE_FORMAT) -> array:
+        """Parse a column of date strings to epoch seconds (naive times read as UTC)"""
+        fast = fast_parser(fmt)
+        result = array('q')
+        seen: Dict[str, int] = {}
+        for value in values:
+            seconds = seen.get(value)
+            if seconds is None:
+                dt = fast(value) if fast else None
+                if dt is None:
+                    dt = parse_datetime(value, fmt, cache=False)
+                seconds = seen[value] = cal.epoch_from_datetime(dt)
+            result.append(seconds)
+        return result
+    
+    def format_column(self, epochs: Iterable[int], fmt: str = DEFAULT_DATE_FORMAT) -> List[str]:
+        """Format epoch seconds back to strings"""
+        result = []
+        seen: Dict[int, str] = {}
+        for seconds in epochs:
+            text = seen.get(seconds)
+            if text is None:
+                days, rest = divmod(seconds, cal.SECONDS_PER_DAY)
+                year, month, day = cal.civil_from_days(days)
+                if fmt == DEFAULT_DATE_FORMAT and year >= 1000:
+                    text = f"{year}-{month:02d}-{day:02d}"
+                elif fmt == DEFAULT_DATETIME_FORMAT and year >= 1000:
+                    hour, rest = divmod(rest, 3600)
+                    text = f"{year}-{month:02d}-{day:02d} {hour:02d}:{rest // 60:02d}:{rest % 60:02d}"
+                else:
+                    text = cal.datetime_from_epoch(seconds).strftime(fmt)
+                seen[seconds] = text
+            result.append(text)
+        return result
+    
+    def add_days_column(self, epochs: Iterable[int], days: int) -> array:
+        """Add days to a column of epoch seconds"""
+        delta = days * cal.SECONDS_PER_DAY
+        return array('q', [seconds + delta for seconds in epochs])
+    
+    def add_hours_column(self, epochs: Iterable[int], hours: int) -> array:
+        """Add hours to a column of epoch seconds"""
+        delta = hours * 3600
+        return array('q', [seconds + delta for seconds in epochs])
+    
+    def days_between_column(self, epochs1: Iterable[int], epochs2: Iterable[int]) -> array:
+        """Whole days between paired columns of epoch seconds (same rounding as days_between)"""
+        day = cal.SECONDS_PER_DAY
+        return array('q', [abs((b - a) // day) for a, b in zip(epochs1, epochs2)])
+    
+    def day_of_week_column(self, epochs: Iterable[int]) -> array:
+        """Weekday numbers (Monday == 0) of a column; names are in calendar_tables.WEEKDAY_NAMES"""
+        day = cal.SECONDS_PER_DAY
+        return array('b', [(seconds // day + 3) % 7 for seconds in epochs])
+    
+    def week_number_column(self, epochs: Iterable[int]) -> array:
+        """ISO week numbers of a column of epoch seconds"""
+        day = cal.SECONDS_PER_DAY
+        iso_week = cal.iso_week
+        return array('b', [iso_week(seconds // day) for seconds in epochs])
+    
+    def window_aggregator(self, size: Union[int, str] = '1h', slide: Optional[Union[int, str]] = None,
+                          allowed_lateness: Union[int, str] = 0, fmt: str = DEFAULT_DATETIME_FORMAT) -> TimeWindowAggregator:
+        """Create a streaming tumbling (or sliding, when slide is given) window aggregator"""
+        return TimeWindowAggregator(size, slide, allowed_lateness, fmt)
+    
+    def aggregate_by_window(self, records: Iterable[Dict], time_key: str, size: Union[int, str] = '1h',
+                            value_key: Optional[str] = None, group_key: Optional[str] = None,
+                            slide: Optional[Union[int, str]] = None, allowed_lateness: Union[int, str] = 0,
+                            fmt: str = DEFAULT_DATETIME_FORMAT) -> Iterator[Dict[str, Any]]:
+        """Roll up dict records into per-window (and per-group) count/sum/min/max/mean
+        
+        Naive timestamps (datetimes and formatted strings) are bucketed as UTC,
+        whereas datetime_to_timestamp reads them as local time.
+        """
+        return aggregate_windows(records, time_key, size, value_key, group_key, slide, allowed_lateness, fmt)
     
     def demo(self):
         """Demo date/time utilities"""
@@ -80,4 +172,12 @@ class DateTimeUtils:
         print(f"✓ Current timestamp: {self.get_timestamp()}")
         print(f"✓ Is 2025 leap year? {self.is_leap_year(2025)}")
         print(f"✓ Days in Feb 2024: {self.get_days_in_month(2024, 2)}")
-        print(f"✓ Week number of 2025-01-01: {self.get_week_number('2025-01-01')}")
\ No newline at end of file
+        print(f"✓ Week number of 2025-01-01: {self.get_week_number('2025-01-01')}")
+        column = self.parse_column(['2025-01-01', '2025-03-15', '2025-12-31'])
+        print(f"✓ Column +30 days: {self.format_column(self.add_days_column(column, 30))}")
+        print(f"✓ Column ISO weeks: {list(self.week_number_column(column))}")
+        events = [{'time': '2025-01-01 10:05:00', 'value': 3}, {'time': '2025-01-01 10:40:00', 'value': 5},
+                  {'time': '2025-01-01 11:10:00', 'value': 4}]
+        hourly = [(self.format_column([w['start']], DEFAULT_DATETIME_FORMAT)[0], w['count'], w['sum'])
+                  for w in self.aggregate_by_window(events, 'time', '1h', value_key='value')]
+        print(f"✓ Hourly windows (start, count, sum): {hourly}")
\ No newline at end of file
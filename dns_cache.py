@@ -0,0 +1,132 @@
+"""DNS resolution cache module"""
+
+import asyncio
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DNSCache:
+    """getaddrinfo cache with positive/negative TTLs and coalesced lookups
+    
+    getaddrinfo does not report record TTLs, so successful lookups live for ttl
+    seconds and failures for negative_ttl. Concurrent lookups of one name, from
+    threads or coroutines, share a single resolver call on the worker pool.
+    """
+    
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0, max_entries: int = 4096,
+                 max_workers: int = 8, family: int = socket.AF_INET):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.family = family
+        self._entries: 'OrderedDict[str, Tuple[float, Optional[List[str]]]]' = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='dns')
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+    
+    def _lookup(self, host: str) -> Optional[List[str]]:
+        """Resolve host with getaddrinfo and cache the outcome
+        
+        Unexpected exceptions reach the current waiters through the future but
+        are not cached: the in-flight entry is always cleared, so the next call
+        resolves again.
+        """
+        try:
+            try:
+                infos = socket.getaddrinfo(host, None, self.family, socket.SOCK_STREAM)
+                addresses = list(dict.fromkeys(info[4][0] for info in infos))
+                expires = time.monotonic() + self.ttl
+            except (OSError, UnicodeError) as e:
+                logger.debug("Failed to resolve %s: %s", host, e)
+                addresses = None
+                expires = time.monotonic() + self.negative_ttl
+            with self._lock:
+                if addresses is None:
+                    self.errors += 1
+                self._entries[host] = (expires, addresses)
+                self._entries.move_to_end(host)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return addresses
+        finally:
+            with self._lock:
+                self._inflight.pop(host, None)
+    
+    def _submit(self, host: str) -> Tuple[bool, object]:
+        """(True, addresses) on a cache hit, else (False, future of the shared lookup)"""
+        key = host.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    if entry[1] is None:
+                        self.negative_hits += 1
+                    else:
+                        self.hits += 1
+                    return True, entry[1]
+                del self._entries[key]
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return False, future
+            self.misses += 1
+            future = self._inflight[key] = self._executor.submit(self._lookup, key)
+            return False, future
+    
+    def resolve(self, host: str, timeout: Optional[float] = None) -> Optional[List[str]]:
+        """Addresses of host, or None if it does not resolve"""
+        cached, value = self._submit(host)
+        return value if cached else value.result(timeout)
+    
+    async def resolve_async(self, host: str) -> Optional[List[str]]:
+        """Coroutine version of resolve"""
+        cached, value = self._submit(host)
+        return value if cached else await asyncio.wrap_future(value)
+    
+    def resolve_many(self, hosts: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """Resolve many hosts in parallel on the worker pool"""
+        pending = {host: self._submit(host) for host in hosts}
+        return {host: value if cached else value.result() for host, (cached, value) in pending.items()}
+    
+    def gethostbyname(self, host: str) -> Optional[str]:
+        """First address of host, or None"""
+        addresses = self.resolve(host)
+        return addresses[0] if addresses else None
+    
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Drop one cached host, or all of them"""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(host.lower(), None)
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and cache size"""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'errors': self.errors,
+                'hit_rate': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+                'size': len(self._entries)
+            }
+    
+    def close(self) -> None:
+        """Shut down the worker pool"""
+        self._executor.shutdown(wait=False)
\ No newline at end of file
@@ -18,10 +18,10 @@ class FileOps:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             with open(filepath, 'w') as f:
                 f.write(content)
-            logger.info(f"Created file: {filepath}")
+            logger.info("Created file: %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to create file: {e}")
+            logger.error("Failed to create file: %s", e)
             return False
     
     def read_file(self, filepath: str) -> Optional[str]:
@@ -30,7 +30,7 @@ class FileOps:
             with open(filepath, 'r') as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Failed to read file: {e}")
+            logger.error("Failed to read file: %s", e)
             return None
     
     def append_to_file(self, filepath: str, content: str) -> bool:
@@ -38,40 +38,40 @@ class FileOps:
         try:
             with open(filepath, 'a') as f:
                 f.write(content)
-            logger.info(f"Appended to file: {filepath}")
+            logger.info("Appended to file: %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to append: {e}")
+            logger.error("Failed to append: %s", e)
             return False
     
     def delete_file(self, filepath: str) -> bool:
         """Delete a file"""
         try:
             os.remove(filepath)
-            logger.info(f"Deleted file: {filepath}")
+            logger.info("Deleted file: %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete: {e}")
+            logger.error("Failed to delete: %s", e)
             return False
     
     def copy_file(self, src: str, dst: str) -> bool:
         """Copy a file"""
         try:
             shutil.copy2(src, dst)
-            logger.info(f"Copied {src} to {dst}")
+            logger.info("Copied %s to %s", src, dst)
             return True
         except Exception as e:
-            logger.error(f"Failed to copy: {e}")
+            logger.error("Failed to copy: %s", e)
             return False
     
     def move_file(self, src: str, dst: str) -> bool:
         """Move a file"""
         try:
             shutil.move(src, dst)
-            logger.info(f"Moved {src} to {dst}")
+            logger.info("Moved %s to %s", src, dst)
             return True
         except Exception as e:
-            logger.error(f"Failed to move: {e}")
+            logger.error("Failed to move: %s", e)
             return False
     
     def get_file_size(self, filepath: str) -> Optional[int]:
@@ -79,7 +79,7 @@ class FileOps:
         try:
             return os.path.getsize(filepath)
         except Exception as e:
-            logger.error(f"Failed to get size: {e}")
+            logger.error("Failed to get size: %s", e)
             return None
     
     def list_files(self, directory: str, pattern: str = "*") -> List[str]:
@@ -87,27 +87,27 @@ class FileOps:
         try:
             return glob.glob(os.path.join(directory, pattern))
         except Exception as e:
-            logger.error(f"Failed to list files: {e}")
+            logger.error("Failed to list files: %s", e)
             return []
     
     def create_directory(self, dirpath: str) -> bool:
         """Create a directory"""
         try:
             Path(dirpath).mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created directory: {dirpath}")
+            logger.info("Created directory: %s", dirpath)
             return True
         except Exception as e:
-            logger.error(f"Failed to create directory: {e}")
+            logger.error("Failed to create directory: %s", e)
             return False
     
     def delete_directory(self, dirpath: str) -> bool:
         """Delete a directory"""
         try:
             shutil.rmtree(dirpath)
-            logger.info(f"Deleted directory: {dirpath}")
+            logger.info("Deleted directory: %s", dirpath)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete directory: {e}")
+            logger.error("Failed to delete directory: %s", e)
             return False
     
     def file_exists(self, filepath: str) -> bool:
@@ -122,10 +122,10 @@ class FileOps:
         """Rename a file"""
         try:
             os.rename(old_name, new_name)
-            logger.info(f"Renamed {old_name} to {new_name}")
+            logger.info("Renamed %s to %s", old_name, new_name)
             return True
         except Exception as e:
-            logger.error(f"Failed to rename: {e}")
+            logger.error("Failed to rename: %s", e)
             return False
     
     def demo(self):
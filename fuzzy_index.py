@@ -0,0 +1,180 @@
+"""Fuzzy string search module"""
+
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Levenshtein distance if it is <= max_distance, else None
+    
+    Only the diagonal band of width 2*max_distance+1 is computed, and the
+    computation stops as soon as a whole row exceeds max_distance.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+    size = len(a)
+    big = max_distance + 1
+    previous = [j if j <= max_distance else big for j in range(size + 1)]
+    for i, cb in enumerate(b, 1):
+        lo, hi = max(1, i - max_distance), min(size, i + max_distance)
+        current = [big] * (size + 1)
+        current[0] = i if i <= max_distance else big
+        row_min = current[0]
+        for j in range(lo, hi + 1):
+            value = previous[j - 1] + (a[j - 1] != cb)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if value > big:
+                value = big
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+    return previous[size] if previous[size] <= max_distance else None
+
+class NGramIndex:
+    """Inverted n-gram index for top-k fuzzy lookups by edit distance or Jaccard similarity
+    
+    Candidates are generated only from the rarest query grams that any match
+    must share (prefix filtering), then verified exactly.
+    """
+    
+    def __init__(self, strings: Iterable[str] = (), n: int = 3, case_insensitive: bool = True):
+        if n < 1:
+            raise ValueError("n must be positive")
+        self.n = n
+        self.case_insensitive = case_insensitive
+        self.strings: List[str] = []
+        self._keys: List[str] = []
+        self._postings: Dict[str, array] = {}
+        self.update(strings)
+    
+    def _normalize(self, text: str) -> str:
+        """Apply case folding"""
+        return text.lower() if self.case_insensitive else text
+    
+    def grams(self, text: str) -> Set[str]:
+        """Distinct padded n-grams of a (normalized) string"""
+        pad = '\x02' * (self.n - 1)
+        padded = pad + text + pad
+        return {padded[i:i + self.n] for i in range(len(padded) - self.n + 1)}
+    
+    def add(self, text: str) -> int:
+        """Index a string and return its id"""
+        string_id = len(self.strings)
+        key = self._normalize(text)
+        self.strings.append(text)
+        self._keys.append(key)
+        postings = self._postings
+        for gram in self.grams(key):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('I')
+            posting.append(string_id)
+        return string_id
+    
+    def update(self, strings: Iterable[str]) -> 'NGramIndex':
+        """Index many strings"""
+        for text in strings:
+            self.add(text)
+        return self
+    
+    def _candidates(self, query_grams: Set[str], required: int) -> Set[int]:
+        """Ids sharing at least one of the len - required + 1 rarest query grams"""
+        postings = self._postings
+        ranked = sorted(query_grams, key=lambda g: len(postings.get(g, ())))
+        candidates: Set[int] = set()
+        for gram in ranked[:len(ranked) - required + 1]:
+            candidates.update(postings.get(gram, ()))
+        return candidates
+    
+    def search(self, query: str, k: int = 10, max_distance: int = 2) -> List[Tuple[str, int]]:
+        """Top-k (string, edit_distance) matches within max_distance, closest first"""
+        key = self._normalize(query)
+        query_grams = self.grams(key)
+        # q-gram lemma: each edit destroys at most n of the query's grams
+        required = len(query_grams) - max_distance * self.n
+        if required > 0:
+            candidates = self._candidates(query_grams, required)
+        else:
+            candidates = range(len(self.strings))
+        keys = self._keys
+        best: List[Tuple[int, int]] = []
+        bound = max_distance
+        for string_id in candidates:
+            distance = bounded_levenshtein(key, keys[string_id], bound)
+            if distance is None:
+                continue
+            entry = (-distance, -string_id)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+            if len(best) == k:
+                bound = -best[0][0]
+        return [(self.strings[-i], -d) for d, i in sorted(best, reverse=True)]
+    
+    def search_jaccard(self, query: str, k: int = 10, min_similarity: float = 0.5) -> List[Tuple[str, float]]:
+        """Top-k (string, jaccard_similarity) matches of n-gram sets, most similar first"""
+        if not 0 < min_similarity <= 1:
+            raise ValueError("min_similarity must be in (0, 1]")
+        key = self._normalize(query)
+        query_grams = self.grams(key)
+        size = len(query_grams)
+        # J >= t implies |shared| >= t * |query grams|
+        candidates = self._candidates(query_grams, max(1, math.ceil(min_similarity * size)))
+        best: List[Tuple[float, int]] = []
+        threshold = min_similarity
+        for string_id in candidates:
+            candidate_grams = self.grams(self._keys[string_id])
+            other = len(candidate_grams)
+            # Size filter: J <= min(a, b) / max(a, b)
+            if min(size, other) < threshold * max(size, other):
+                continue
+            shared = len(query_grams & candidate_grams)
+            similarity = shared / (size + other - shared)
+            if similarity < threshold:
+                continue
+            entry = (similarity, -string_id)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+            if len(best) == k:
+                threshold = max(threshold, best[0][0])
+        return [(self.strings[-i], s) for s, i in sorted(best, reverse=True)]
+
+class AnagramIndex:
+    """Groups strings by character-count signature (case and spaces ignored, as in is_anagram)"""
+    
+    def __init__(self, strings: Iterable[str] = ()):
+        self.groups: Dict[str, List[str]] = {}
+        for text in strings:
+            self.add(text)
+    
+    @staticmethod
+    def signature(text: str) -> str:
+        """Character-count signature (sorted characters)"""
+        return ''.join(sorted(text.replace(" ", "").lower()))
+    
+    def add(self, text: str) -> None:
+        """Index a string"""
+        self.groups.setdefault(self.signature(text), []).append(text)
+    
+    def anagrams_of(self, text: str) -> List[str]:
+        """Indexed strings that are anagrams of text"""
+        return list(self.groups.get(self.signature(text), []))
+    
+    def anagram_groups(self, min_size: int = 2) -> List[List[str]]:
+        """Groups of mutually anagrammatic strings"""
+        return [group for group in self.groups.values() if len(group) >= min_size]
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""On-disk HTTP response cache module"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+import requests
+from requests.structures import CaseInsensitiveDict
+import logging
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_STATUSES = (200, 203, 300, 301, 404, 410)
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Cache-Control directives as a lowercase name -> argument dict"""
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds of an HTTP date header, or None"""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def freshness_lifetime(headers: Dict[str, str], default_ttl: float = 0) -> float:
+    """Seconds a stored response stays fresh in a private cache (RFC 9111 max-age, then Expires)"""
+    directives = parse_cache_control(headers.get('Cache-Control'))
+    if 'no-cache' in directives:
+        return 0
+    if (directives.get('max-age') or '').isdigit():
+        return int(directives['max-age'])
+    expires = _http_date(headers.get('Expires'))
+    if expires is not None:
+        date = _http_date(headers.get('Date')) or time.time()
+        return max(expires - date, 0)
+    return default_ttl
+
+def vary_values(vary: Optional[str], request_headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Request header values selected by a response's Vary header (lowercase names)"""
+    names = (name.strip().lower() for name in (vary or '').split(','))
+    return {name: request_headers.get(name) for name in names if name}
+
+class HTTPCache:
+    """LRU-bounded on-disk cache of GET responses with ETag/Last-Modified revalidation
+    
+    Entries are keyed on the prepared URL (query parameters included) and hold
+    one variant per URL: a stored response is only used when the request
+    headers named in its Vary header match. Requests carrying credentials
+    (Authorization, auth= or cookies) bypass the cache, and responses with
+    Vary: * are not stored.
+    
+    Each entry is one file (a JSON metadata line followed by the body) written
+    to a temp file and renamed into place, so concurrent processes never see a
+    partial entry. Reads bump the file's mtime. A running size total triggers
+    eviction, which rescans the directory and removes the least recently used
+    entries (down to 90% of max_bytes) under an advisory lock; writes from
+    other processes are counted at the next rescan.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int = 256 << 20, default_ttl: float = 0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        os.makedirs(directory, exist_ok=True)
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+    
+    def _path(self, key: str) -> str:
+        """Entry file of a cache key"""
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.entry')
+    
+    def load(self, url: str, request_headers: Optional[Dict[str, str]] = None) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """(metadata, body) of a stored response matching the request's Vary headers, or None"""
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url:
+            return None
+        request_headers = CaseInsensitiveDict(request_headers)
+        if any(request_headers.get(name) != value for name, value in meta.get('vary', {}).items()):
+            return None
+        return meta, body
+    
+    def store(self, url: str, status_code: int, headers: Dict[str, str], body: bytes,
+              encoding: Optional[str] = None, request_headers: Optional[Dict[str, str]] = None) -> bool:
+        """Atomically write a response entry, evicting once the running size total exceeds max_bytes"""
+        vary = CaseInsensitiveDict(headers).get('Vary')
+        if vary is not None and vary.strip() == '*':
+            return False
+        meta = {
+            'url': url,
+            'status_code': status_code,
+            'headers': headers,
+            'encoding': encoding,
+            'vary': vary_values(vary, CaseInsensitiveDict(request_headers)),
+            'stored_at': time.time()
+        }
+        path = self._path(url)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(meta).encode('utf-8') + b'\n')
+                f.write(body)
+                written = f.tell()
+            try:
+                replaced = os.stat(path).st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.error("Failed to store cached response: %s", e)
+            return False
+        with self._size_lock:
+            if self._size is not None:
+                self._size += written - replaced
+            over = self._size is None or self._size > self.max_bytes
+        if over:
+            self.evict()
+        return True
+    
+    def is_fresh(self, meta: Dict[str, Any]) -> bool:
+        """Whether a stored response can be served without revalidation"""
+        age = time.time() - meta['stored_at']
+        return age < freshness_lifetime(CaseInsensitiveDict(meta['headers']), self.default_ttl)
+    
+    def evict(self) -> int:
+        """Once the cache exceeds max_bytes, remove least recently used entries down to 90% of it"""
+        lock = open(os.path.join(self.directory, '.lock'), 'a')
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.entry'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            removed = 0
+            if total > self.max_bytes:
+                # Evicting below the bound leaves headroom, so rescans happen once per ~10% of writes
+                target = self.max_bytes * 9 // 10
+                entries.sort()
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        os.remove(path)
+                        removed += 1
+                    except OSError:
+                        pass
+                    total -= size
+            with self._size_lock:
+                self._size = total
+            return removed
+        finally:
+            lock.close()
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.entry'):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+        with self._size_lock:
+            self._size = None
+    
+    def fetch(self, client: Any, url: str, headers: Optional[Dict[str, str]] = None,
+              params: Any = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """GET url through an HTTPClient, serving fresh entries locally and revalidating stale ones
+        
+        The result has the make_request shape plus 'cache': 'hit', 'revalidated',
+        'miss' or 'bypass' (requests with credentials are never cached).
+        """
+        # Prepare once, with everything that shapes the request, to get the final URL and effective headers
+        prepared = client.session(url).prepare_request(requests.Request(
+            'GET', url, headers=headers, params=params, auth=kwargs.get('auth'), cookies=kwargs.get('cookies')))
+        key = prepared.url
+        request_headers = dict(headers or {})
+        # Auth handlers such as digest only add Authorization after a challenge, so auth= alone bypasses too
+        if kwargs.get('auth') is not None or 'Authorization' in prepared.headers or 'Cookie' in prepared.headers:
+            return self._send(client, key, request_headers, kwargs, 'bypass')
+        cached = self.load(key, prepared.headers)
+        if cached is not None:
+            meta, body = cached
+            if self.is_fresh(meta):
+                return self._result(meta, body, 'hit')
+            stored = CaseInsensitiveDict(meta['headers'])
+            if 'ETag' in stored:
+                request_headers['If-None-Match'] = stored['ETag']
+            if 'Last-Modified' in stored:
+                request_headers['If-Modified-Since'] = stored['Last-Modified']
+        try:
+            response = client.request('GET', key, headers=request_headers, **kwargs)
+        except Exception as e:
+            logger.error("Request failed: %s", e)
+            return None
+        if response.status_code == 304 and cached is not None:
+            meta, body = cached
+            merged = CaseInsensitiveDict(meta['headers'])
+            merged.update({k: v for k, v in response.headers.items() if k.lower() != 'content-length'})
+            meta['headers'] = dict(merged)
+            self.store(key, meta['status_code'], meta['headers'], body, meta['encoding'], prepared.headers)
+            return self._result(meta, body, 'revalidated')
+        directives = parse_cache_control(response.headers.get('Cache-Control'))
+        if response.status_code in CACHEABLE_STATUSES and 'no-store' not in directives:
+            self.store(key, response.status_code, dict(response.headers), response.content, response.encoding,
+                       prepared.headers)
+        return self._response(response, 'miss')
+    
+    def _send(self, client: Any, url: str, headers: Dict[str, str], kwargs: Dict[str, Any],
+              source: str) -> Optional[Dict[str, Any]]:
+        """GET without touching the cache"""
+        try:
+            return self._response(client.request('GET', url, headers=headers, **kwargs), source)
+        except Exception as e:
+            logger.error("Request failed: %s", e)
+            return None
+    
+    @staticmethod
+    def _response(response: requests.Response, source: str) -> Dict[str, Any]:
+        """make_request-shaped dict of a live response"""
+        return {
+            'status_code': response.status_code,
+            'content': response.text,
+            'headers': dict(response.headers),
+            'elapsed': response.elapsed.total_seconds(),
+            'cache': source
+        }
+    
+    @staticmethod
+    def _result(meta: Dict[str, Any], body: bytes, source: str) -> Dict[str, Any]:
+        """make_request-shaped dict of a stored response"""
+        return {
+            'status_code': meta['status_code'],
+            'content': body.decode(meta['encoding'] or 'utf-8', errors='replace'),
+            'headers': meta['headers'],
+            'elapsed': 0.0,
+            'cache': source
+        }
\ No newline at end of file
@@ -0,0 +1,148 @@
+"""Pooled HTTP client module"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import logging
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def _host_key(url: str) -> str:
+    """scheme://host[:port] of a URL"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+def response_to_dict(response: requests.Response) -> Dict[str, Any]:
+    """The dict shape returned by NetworkUtils.make_request"""
+    return {
+        'status_code': response.status_code,
+        'content': response.text,
+        'headers': dict(response.headers),
+        'elapsed': response.elapsed.total_seconds()
+    }
+
+class HTTPClient:
+    """Thread-safe HTTP client with one keep-alive connection pool per host
+    
+    Each scheme://host gets its own requests.Session whose adapter keeps up to
+    pool_size connections alive and retries connection errors and the
+    RETRY_STATUSES with exponential backoff (backoff_factor * 2 ** attempt).
+    Read errors and retry statuses are only retried for retry_methods, the
+    idempotent methods by default; pass e.g. {'POST'} | Retry.DEFAULT_ALLOWED_METHODS
+    to opt non-idempotent requests in.
+    """
+    
+    def __init__(self, pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.3,
+                 status_forcelist: Iterable[int] = RETRY_STATUSES, timeout: float = 10,
+                 max_workers: int = 8, headers: Optional[Dict[str, str]] = None,
+                 retry_methods: Iterable[str] = Retry.DEFAULT_ALLOWED_METHODS):
+        self.pool_size = pool_size
+        self.retry = Retry(total=retries, connect=retries, read=retries, status=retries,
+                           backoff_factor=backoff_factor, status_forcelist=tuple(status_forcelist),
+                           allowed_methods=frozenset(m.upper() for m in retry_methods), raise_on_status=False)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.headers = dict(headers or {})
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+    
+    def session(self, url: str) -> requests.Session:
+        """The pooled session for a URL's host"""
+        key = _host_key(url)
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = requests.Session()
+                    session.headers.update(self.headers)
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=self.retry)
+                    session.mount(key + '/', adapter)
+                    self._sessions[key] = session
+        return session
+    
+    def request(self, method: str, url: str, timeout: Optional[float] = None, stream: bool = False,
+                **kwargs) -> requests.Response:
+        """Send a request over the host's pooled session"""
+        return self.session(url).request(method, url, timeout=timeout or self.timeout, stream=stream, **kwargs)
+    
+    def fetch(self, method: str, url: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """Send a request and return its response dict, or None on failure"""
+        try:
+            return response_to_dict(self.request(method, url, **kwargs))
+        except Exception as e:
+            logger.error("Request failed: %s", e)
+            return None
+    
+    def _fetch_spec(self, spec: Union[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Fetch a batch entry: a URL or a dict with 'url', optional 'method' and request kwargs"""
+        if isinstance(spec, str):
+            return self.fetch('GET', spec)
+        kwargs = dict(spec)
+        return self.fetch(kwargs.pop('method', 'GET'), kwargs.pop('url'), **kwargs)
+    
+    def iter_batch(self, specs: Iterable[Union[str, Dict[str, Any]]],
+                   max_workers: Optional[int] = None) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+        """Run requests concurrently on a bounded thread pool, yielding (index, result) as they finish
+        
+        specs is consumed lazily with at most twice max_workers requests in flight.
+        """
+        max_workers = max_workers or self.max_workers
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            in_flight = {}
+            for index, spec in enumerate(specs):
+                in_flight[pool.submit(self._fetch_spec, spec)] = index
+                if len(in_flight) >= max_workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future.result()
+            for future in as_completed(in_flight):
+                yield in_flight[future], future.result()
+    
+    def batch(self, specs: Iterable[Union[str, Dict[str, Any]]],
+              max_workers: Optional[int] = None) -> List[Optional[Dict[str, Any]]]:
+        """Run requests concurrently and return their results in input order (None for failures)"""
+        specs = list(specs)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        for index, result in self.iter_batch(specs, max_workers):
+            results[index] = result
+        return results
+    
+    def stream(self, url: str, method: str = 'GET', chunk_size: int = 1 << 16, **kwargs) -> Iterator[bytes]:
+        """Lazily yield the response body in chunks without loading it into memory"""
+        with self.request(method, url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+    
+    def download(self, url: str, filepath: str, chunk_size: int = 1 << 16, **kwargs) -> Optional[int]:
+        """Stream a response body to a file and return the number of bytes written"""
+        try:
+            written = 0
+            with open(filepath, 'wb') as f:
+                for chunk in self.stream(url, chunk_size=chunk_size, **kwargs):
+                    f.write(chunk)
+                    written += len(chunk)
+            logger.info("Downloaded %s to %s (%s bytes)", url, filepath, written)
+            return written
+        except Exception as e:
+            logger.error("Failed to download %s: %s", url, e)
+            return None
+    
+    def close(self) -> None:
+        """Close all pooled connections"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+    
+    def __enter__(self) -> 'HTTPClient':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""Per-method instrumentation module"""
+
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; a final +Inf bucket is implied
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Where each method's processed bytes come from, per utility class: ('text', position, keyword) is a
+# str/bytes argument, ('result',) the returned content, and ('read', ...) / ('written', ...) a path
+# argument whose file size is taken before / after the call. Unlisted methods have no bytes metric.
+BYTES_PROCESSED = {
+    'FileOps': {
+        'create_file': (('text', 1, 'content'),),
+        'read_file': (('result',),),
+        'append_to_file': (('text', 1, 'content'),),
+        'copy_file': (('read', 0, 'src'),),
+        'move_file': (('read', 0, 'src'),),
+    },
+    'CryptoUtils': {
+        'md5_hash': (('text', 0, 'text'),),
+        'sha1_hash': (('text', 0, 'text'),),
+        'sha256_hash': (('text', 0, 'text'),),
+        'sha512_hash': (('text', 0, 'text'),),
+        'hmac_sha256': (('text', 0, 'message'),),
+        'base64_encode': (('text', 0, 'text'),),
+        'base64_decode': (('text', 0, 'text'),),
+        'hash_file': (('read', 0, 'filepath'),),
+    },
+    'JSONUtils': {
+        'to_json': (('result',),),
+        'from_json': (('text', 0, 'json_str'),),
+        'save_json': (('written', 0, 'filepath'),),
+        'load_json': (('read', 0, 'filepath'),),
+        'is_valid_json': (('text', 0, 'json_str'),),
+        'pretty_print_json': (('text', 0, 'json_str'),),
+    },
+    'CSVUtils': {
+        'read_csv': (('read', 0, 'filepath'),),
+        'write_csv': (('written', 0, 'filepath'),),
+    },
+}
+
+def content_bytes(value: Any) -> int:
+    """UTF-8 size of str content, or the size of bytes-like content (0 for anything else)"""
+    if isinstance(value, str):
+        # isascii() is O(1), so ASCII text is measured without encoding it
+        return len(value) if value.isascii() else len(value.encode('utf-8', 'surrogatepass'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    return 0
+
+def file_bytes(path: Any) -> int:
+    """Size of a regular file (0 if path is not one)"""
+    try:
+        return os.path.getsize(path) if os.path.isfile(path) else 0
+    except (OSError, TypeError, ValueError):
+        return 0
+
+def _argument(args: Tuple, kwargs: Dict[str, Any], position: int, keyword: str) -> Any:
+    """A call's argument by keyword or position (None if not passed)"""
+    if keyword in kwargs:
+        return kwargs[keyword]
+    return args[position] if position < len(args) else None
+
+def _succeeded(result: Any) -> bool:
+    """Whether a utility call did its I/O (they return None, False or '' after logging a failure)"""
+    return not (result is None or result is False or result == '')
+
+class MethodStats:
+    """Counters and latency histogram of one instrumented method"""
+    
+    __slots__ = ('calls', 'errors', 'total_seconds', 'buckets', 'bytes', 'peak_bytes', 'peak_samples')
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.peak_samples = 0
+    
+    def observe(self, seconds: float, failed: bool, size: int = 0, peak: Optional[int] = None) -> None:
+        """Record one call processing size bytes (peak is None when no reliable memory peak was taken)"""
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.bytes += size
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if peak is not None:
+            self.peak_samples += 1
+            if peak > self.peak_bytes:
+                self.peak_bytes = peak
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile (None for the +Inf bucket or no calls)"""
+        if not self.calls:
+            return None
+        rank = self.calls * q / 100
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return None
+
+class Instrumentation:
+    """Opt-in wrappers recording calls, errors, latency, bytes processed and tracemalloc peaks
+    
+    Only instrumented instances get wrappers (set as instance attributes), so
+    uninstrumented objects run with no overhead at all. Only the outermost
+    instrumented call on a thread is recorded; calls a method makes to other
+    instrumented methods are part of its time, not counted again. Bytes are
+    counted for the methods listed in BYTES_PROCESSED, from the content and
+    files they actually read, write or hash.
+    
+    With trace_memory the peak memory growth of each call is recorded too.
+    tracemalloc's peak is process-wide, so a peak is only kept for calls that
+    no other instrumented call overlapped (peak_samples counts those), and
+    tracemalloc slows every allocation down, so it is off by default.
+    """
+    
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stats: Dict[Tuple[str, str], MethodStats] = {}
+        self._instrumented: Dict[int, Tuple[Any, List[str]]] = {}
+        self._measured = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Outermost calls in progress on all threads, and a counter of those started
+        self._active = 0
+        self._started = 0
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+    
+    def _wrap(self, method: Callable, stats: MethodStats, measures: Tuple = ()) -> Callable:
+        """Timing wrapper around a bound method"""
+        local = self._local
+        
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if getattr(local, 'depth', 0):
+                # Nested call: already timed as part of the outer one
+                return method(*args, **kwargs)
+            local.depth = 1
+            try:
+                return self._timed(method, stats, measures, args, kwargs)
+            finally:
+                local.depth = 0
+        return wrapper
+    
+    def _timed(self, method: Callable, stats: MethodStats, measures: Tuple, args: Tuple,
+               kwargs: Dict[str, Any]) -> Any:
+        """Run an outermost call and record it"""
+        # Files read are sized up front: move_file, for one, removes its source
+        read = sum(file_bytes(_argument(args, kwargs, *measure[1:])) for measure in measures if measure[0] == 'read')
+        with self._lock:
+            self._active += 1
+            self._started += 1
+            started = self._started
+            alone = self._active == 1
+        base = 0
+        if self.trace_memory and alone:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        failed = True
+        result = None
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            size = self._processed(measures, args, kwargs, result, read) if measures and not failed else 0
+            peak = tracemalloc.get_traced_memory()[1] - base if self.trace_memory and alone else None
+            with self._lock:
+                self._active -= 1
+                if started != self._started:
+                    # Another call ran meanwhile and shares the process-wide peak
+                    peak = None
+                stats.observe(elapsed, failed, size, peak)
+    
+    @staticmethod
+    def _processed(measures: Tuple, args: Tuple, kwargs: Dict[str, Any], result: Any, read: int) -> int:
+        """Bytes a successful call processed, per its BYTES_PROCESSED entry"""
+        size = 0
+        for kind, *where in measures:
+            if kind == 'text':
+                size += content_bytes(_argument(args, kwargs, *where))
+            elif kind == 'result':
+                size += content_bytes(result)
+            elif kind == 'written' and _succeeded(result):
+                size += file_bytes(_argument(args, kwargs, *where))
+        return size + read if _succeeded(result) else size
+    
+    def instrument(self, obj: Any, name: str) -> Any:
+        """Wrap every public method of obj, recording stats under (name, method)"""
+        if id(obj) in self._instrumented:
+            return obj
+        wrapped = []
+        measured = BYTES_PROCESSED.get(type(obj).__name__, {})
+        for attr in dir(type(obj)):
+            # Only methods: properties are skipped without being evaluated
+            class_attr = getattr(type(obj), attr, None)
+            if attr.startswith('_') or not callable(class_attr) or isinstance(class_attr, type):
+                continue
+            method = getattr(obj, attr)
+            stats = self.stats.setdefault((name, attr), MethodStats())
+            if attr in measured:
+                self._measured.add((name, attr))
+            setattr(obj, attr, self._wrap(method, stats, measured.get(attr, ())))
+            wrapped.append(attr)
+        self._instrumented[id(obj)] = (obj, wrapped)
+        return obj
+    
+    def uninstrument(self, obj: Any) -> None:
+        """Remove the wrappers from obj (recorded stats are kept)"""
+        _, wrapped = self._instrumented.pop(id(obj), (None, []))
+        for attr in wrapped:
+            obj.__dict__.pop(attr, None)
+    
+    def uninstrument_all(self) -> None:
+        """Remove all wrappers, and stop tracemalloc if this instance started it"""
+        for obj, _ in list(self._instrumented.values()):
+            self.uninstrument(obj)
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+    
+    def reset(self) -> None:
+        """Zero all recorded stats"""
+        with self._lock:
+            for stats in self.stats.values():
+                stats.__init__()
+    
+    def _called(self) -> List[Tuple[Tuple[str, str], MethodStats]]:
+        """Stats of methods called at least once, sorted by total time"""
+        with self._lock:
+            called = [(key, stats) for key, stats in self.stats.items() if stats.calls]
+        return sorted(called, key=lambda item: item[1].total_seconds, reverse=True)
+    
+    def report(self) -> str:
+        """Text table of per-method stats, slowest total first"""
+        lines = [f"{'method':<40} {'calls':>8} {'errors':>7} {'total ms':>10} {'mean ms':>9} "
+                 f"{'p50<=ms':>8} {'p99<=ms':>8} {'bytes':>12} {'peak KiB':>9}"]
+        for (utility, method), stats in self._called():
+            p50, p99 = stats.percentile(50), stats.percentile(99)
+            size = f"{stats.bytes:,}" if (utility, method) in self._measured else '-'
+            peak = f"{stats.peak_bytes / 1024:.1f}" if stats.peak_samples else '-'
+            lines.append(
+                f"{utility + '.' + method:<40} {stats.calls:>8} {stats.errors:>7} "
+                f"{stats.total_seconds * 1000:>10.3f} {stats.total_seconds / stats.calls * 1000:>9.3f} "
+                f"{p50 * 1000 if p50 is not None else float('inf'):>8.2f} "
+                f"{p99 * 1000 if p99 is not None else float('inf'):>8.2f} {size:>12} {peak:>9}")
+        return '\n'.join(lines)
+    
+    def prometheus(self, prefix: str = 'bigutility') -> str:
+        """Prometheus text exposition format of all recorded stats"""
+        called = self._called()
+        lines = []
+        
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+        family('method_calls_total', 'counter', 'Calls per utility method.')
+        for (utility, method), stats in called:
+            lines.append(f'{prefix}_method_calls_total{{utility="{utility}",method="{method}"}} {stats.calls}')
+        family('method_errors_total', 'counter', 'Calls that raised an exception.')
+        for (utility, method), stats in called:
+            lines.append(f'{prefix}_method_errors_total{{utility="{utility}",method="{method}"}} {stats.errors}')
+        family('method_latency_seconds', 'histogram', 'Call latency.')
+        for (utility, method), stats in called:
+            labels = f'utility="{utility}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_method_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_method_latency_seconds_sum{{{labels}}} {stats.total_seconds}')
+            lines.append(f'{prefix}_method_latency_seconds_count{{{labels}}} {stats.calls}')
+        family('method_bytes_total', 'counter', 'Bytes of content and files read, written or hashed.')
+        for (utility, method), stats in called:
+            if (utility, method) in self._measured:
+                lines.append(f'{prefix}_method_bytes_total{{utility="{utility}",method="{method}"}} {stats.bytes}')
+        if self.trace_memory:
+            family('method_peak_bytes', 'gauge', 'Largest memory growth traced during a call no other call overlapped.')
+            for (utility, method), stats in called:
+                if stats.peak_samples:
+                    lines.append(f'{prefix}_method_peak_bytes{{utility="{utility}",method="{method}"}} {stats.peak_bytes}')
+        return '\n'.join(lines) + '\n'
\ No newline at end of file
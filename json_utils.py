@@ -14,7 +14,7 @@ class JSONUtils:
         try:
             return json.dumps(obj, indent=indent)
         except Exception as e:
-            logger.error(f"Failed to convert to JSON: {e}")
+            logger.error("Failed to convert to JSON: %s", e)
             return ""
     
     def from_json(self, json_str: str) -> Any:
@@ -22,7 +22,7 @@ class JSONUtils:
         try:
             return json.loads(json_str)
         except Exception as e:
-            logger.error(f"Failed to parse JSON: {e}")
+            logger.error("Failed to parse JSON: %s", e)
             return None
     
     def save_json(self, filepath: str, data: Any) -> bool:
@@ -30,10 +30,10 @@ class JSONUtils:
         try:
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=2)
-            logger.info(f"Saved JSON to {filepath}")
+            logger.info("Saved JSON to %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to save JSON: {e}")
+            logger.error("Failed to save JSON: %s", e)
             return False
     
     def load_json(self, filepath: str) -> Any:
@@ -42,7 +42,7 @@ class JSONUtils:
             with open(filepath, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            logger.error(f"Failed to load JSON: {e}")
+            logger.error("Failed to load JSON: %s", e)
             return None
     
     def is_valid_json(self, json_str: str) -> bool:
@@ -0,0 +1,154 @@
+"""Multi-keyword matching module (Aho-Corasick)"""
+
+import json
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _fold(text: str) -> str:
+    """Lowercase text without changing its length, so match offsets stay valid"""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+def _is_word_char(c: str) -> bool:
+    """Check if a character is part of a word"""
+    return c.isalnum() or c == '_'
+
+class KeywordMatcher:
+    """Aho-Corasick automaton finding every occurrence of many keywords in one linear pass"""
+    
+    def __init__(self, keywords: Iterable[str] = (), case_insensitive: bool = False, whole_word: bool = False):
+        self.case_insensitive = case_insensitive
+        self.whole_word = whole_word
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[Tuple[int, ...]] = [()]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._built = True
+        for keyword in keywords:
+            self.add(keyword)
+        self.build()
+    
+    def add(self, keyword: str) -> None:
+        """Add a keyword (the automaton is rebuilt lazily on the next search)"""
+        if not keyword:
+            raise ValueError("Keywords must not be empty")
+        index = len(self.keywords)
+        self.keywords.append(keyword)
+        state = 0
+        for c in (_fold(keyword) if self.case_insensitive else keyword):
+            next_state = self._goto[state].get(c)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][c] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append(())
+            state = next_state
+        self._terminal[state] += (index,)
+        self._built = False
+    
+    def build(self) -> 'KeywordMatcher':
+        """Compute failure links and merged outputs breadth-first"""
+        if self._built:
+            return self
+        goto, fail = self._goto, self._fail
+        out = self._out = list(self._terminal)
+        queue = deque()
+        for state in goto[0].values():
+            fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for c, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and c not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(c, 0)
+                out[child] = out[child] + out[fail[child]]
+        self._built = True
+        return self
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Lazily yield (start, end, keyword) for every occurrence, ordered by end offset"""
+        self.build()
+        goto, fail, out, keywords = self._goto, self._fail, self._out, self.keywords
+        lengths = [len(k) for k in keywords]
+        scan = _fold(text) if self.case_insensitive else text
+        whole_word = self.whole_word
+        size = len(text)
+        state = 0
+        for i, c in enumerate(scan):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            if out[state]:
+                end = i + 1
+                for index in out[state]:
+                    start = end - lengths[index]
+                    if whole_word and ((start > 0 and _is_word_char(text[start - 1]))
+                                       or (end < size and _is_word_char(text[end]))):
+                        continue
+                    yield start, end, keywords[index]
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """Get all (start, end, keyword) occurrences"""
+        return list(self.iter_matches(text))
+    
+    def contains_any(self, text: str) -> bool:
+        """Check if any keyword occurs (stops at the first match)"""
+        return next(self.iter_matches(text), None) is not None
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """Count occurrences per keyword"""
+        counts: Dict[str, int] = {}
+        for _, _, keyword in self.iter_matches(text):
+            counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
+    
+    def to_dict(self) -> Dict:
+        """Serialize the built automaton to a JSON-compatible dict"""
+        self.build()
+        return {
+            'case_insensitive': self.case_insensitive,
+            'whole_word': self.whole_word,
+            'keywords': self.keywords,
+            'goto': self._goto,
+            'fail': self._fail,
+            'terminal': [list(t) for t in self._terminal],
+            'out': [list(o) for o in self._out]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KeywordMatcher':
+        """Restore an automaton from to_dict output without rebuilding it"""
+        matcher = cls(case_insensitive=data['case_insensitive'], whole_word=data['whole_word'])
+        matcher.keywords = data['keywords']
+        matcher._goto = data['goto']
+        matcher._fail = data['fail']
+        matcher._terminal = [tuple(t) for t in data['terminal']]
+        matcher._out = [tuple(o) for o in data['out']]
+        return matcher
+    
+    def save(self, filepath: str) -> bool:
+        """Save the automaton to a JSON file"""
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, separators=(',', ':'))
+            logger.info("Saved keyword matcher to %s", filepath)
+            return True
+        except Exception as e:
+            logger.error("Failed to save keyword matcher: %s", e)
+            return False
+    
+    @classmethod
+    def load(cls, filepath: str) -> 'KeywordMatcher':
+        """Load an automaton saved with save()"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
\ No newline at end of file
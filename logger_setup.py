@@ -1,36 +1,123 @@
 """Logging configuration module"""
 
+import atexit
+import gzip
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
+import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime
 
-def setup_logger(name, log_file=None):
-    """Setup logger with file and console handlers"""
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
-    # Create formatters
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file is None:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / f"bigutil_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+# Loggers configured by setup_logger, and the listeners draining their queues
+_configured = {}
+_listeners = {}
+_lock = threading.Lock()
+
+def _namer(name):
+    """Rotated files get a .gz suffix"""
+    return name + '.gz'
+
+def _rotator(source, dest):
+    """Gzip the log into dest and remove it
     
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    Runs synchronously so backups are shifted only after the previous one is
+    complete (with use_queue this is the listener thread, not the caller's).
+    The temp file's name does not start with the log's name, so backup
+    cleanup never matches it.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)), prefix='.rotating-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, open(source, 'rb') as f_in, gzip.GzipFile(fileobj=raw, mode='wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(tmp, dest)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.remove(source)
+
+def _file_handler(log_file, rotation, max_bytes, backup_count, when, compress):
+    """Plain, size-rotating or time-rotating file handler"""
+    if rotation is None:
+        return logging.FileHandler(log_file)
+    if rotation == 'size':
+        handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+    elif rotation == 'time':
+        handler = logging.handlers.TimedRotatingFileHandler(log_file, when=when, backupCount=backup_count)
+    else:
+        raise ValueError(f"Unknown rotation: {rotation}")
+    if compress:
+        handler.namer = _namer
+        handler.rotator = _rotator
+    return handler
+
+def setup_logger(name, log_file=None, use_queue=True, rotation=None, max_bytes=10 * 1024 * 1024,
+                 backup_count=5, when='midnight', compress=True, console_level=logging.INFO):
+    """Setup logger with file and console handlers
     
-    return logger
\ No newline at end of file
+    Calling it again for the same name returns the configured logger without
+    adding handlers. With use_queue the logger only enqueues records, and a
+    QueueListener thread does the formatting and I/O. rotation is None,
+    'size' (max_bytes) or 'time' (when); rotated files are gzipped during
+    rollover when compress is set.
+    """
+    with _lock:
+        if name in _configured:
+            return _configured[name]
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        
+        # Create formatters
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(console_level)
+        console_handler.setFormatter(formatter)
+        
+        # File handler
+        if log_file is None:
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+            if rotation is None:
+                log_file = log_dir / f"bigutil_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+            else:
+                log_file = log_dir / "bigutil.log"
+        
+        file_handler = _file_handler(log_file, rotation, max_bytes, backup_count, when, compress)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        
+        if use_queue:
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler,
+                                                      respect_handler_level=True)
+            listener.start()
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            _listeners[name] = (listener, queue_handler)
+            logger.addHandler(queue_handler)
+        else:
+            logger.addHandler(console_handler)
+            logger.addHandler(file_handler)
+        
+        _configured[name] = logger
+        return logger
+
+def shutdown_logging():
+    """Flush queued records and stop listener threads"""
+    with _lock:
+        for name, (listener, queue_handler) in _listeners.items():
+            _configured.pop(name).removeHandler(queue_handler)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        _listeners.clear()
+
+atexit.register(shutdown_logging)
\ No newline at end of file
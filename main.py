@@ -7,46 +7,129 @@ Created: 2025-11-19
 """
 
 import sys
+import atexit
+import importlib
 import logging
+import threading
+import time
 from pathlib import Path
 
-# Import all modules
-from modules.file_operations import FileOps
-from modules.data_processing import DataProcessor
-from modules.string_utils import StringUtils
-from modules.math_utils import MathUtils
-from modules.date_time_utils import DateTimeUtils
-from modules.system_utils import SystemUtils
-from modules.network_utils import NetworkUtils
-from modules.crypto_utils import CryptoUtils
-from modules.json_utils import JSONUtils
-from modules.csv_utils import CSVUtils
-from modules.cli_interface import CLIInterface
-from modules.config_manager import ConfigManager
 from modules.logger_setup import setup_logger
 
-# Setup logging
-logger = setup_logger(__name__)
+# Handlers (and the logs/ directory) are set up by main(), not on import
+logger = logging.getLogger(__name__)
+
+# Utility attribute -> (module, class); modules are imported on first access
+UTILITIES = {
+    'file_ops': ('modules.file_operations', 'FileOps'),
+    'data_processor': ('modules.data_processing', 'DataProcessor'),
+    'string_utils': ('modules.string_utils', 'StringUtils'),
+    'math_utils': ('modules.math_utils', 'MathUtils'),
+    'date_time_utils': ('modules.date_time_utils', 'DateTimeUtils'),
+    'system_utils': ('modules.system_utils', 'SystemUtils'),
+    'network_utils': ('modules.network_utils', 'NetworkUtils'),
+    'crypto_utils': ('modules.crypto_utils', 'CryptoUtils'),
+    'json_utils': ('modules.json_utils', 'JSONUtils'),
+    'csv_utils': ('modules.csv_utils', 'CSVUtils'),
+    'config_manager': ('modules.config_manager', 'ConfigManager'),
+}
+
+# Serializes lazy creation, so concurrent first accesses share one instance
+_load_lock = threading.RLock()
 
 class BigUtility:
-    """Main utility class orchestrating all functionality"""
+    """Main utility class orchestrating all functionality
+    
+    Utilities are created on first attribute access, so a command only pays
+    for the modules (and third-party imports) it actually uses.
+    """
     
     def __init__(self):
-        self.file_ops = FileOps()
-        self.data_processor = DataProcessor()
-        self.string_utils = StringUtils()
-        self.math_utils = MathUtils()
-        self.date_time_utils = DateTimeUtils()
-        self.system_utils = SystemUtils()
-        self.network_utils = NetworkUtils()
-        self.crypto_utils = CryptoUtils()
-        self.json_utils = JSONUtils()
-        self.csv_utils = CSVUtils()
-        self.config_manager = ConfigManager()
-        logger.info("BIG Utility initialized successfully")
+        self.startup_profile = {}
+        self.instrumentation = None
+        logger.debug("BIG Utility initialized successfully")
+    
+    def __getattr__(self, name):
+        """Import and create a utility on first access (thread-safe)"""
+        if name not in UTILITIES:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with _load_lock:
+            if name in self.__dict__:
+                return self.__dict__[name]
+            module_name, class_name = UTILITIES[name]
+            started = time.perf_counter()
+            module = importlib.import_module(module_name)
+            imported = time.perf_counter()
+            utility = getattr(module, class_name)()
+            self.startup_profile[name] = {'import': imported - started, 'init': time.perf_counter() - imported}
+            if self.instrumentation is not None:
+                self.instrumentation.instrument(utility, name)
+            setattr(self, name, utility)
+            return utility
+    
+    def enable_instrumentation(self, trace_memory=False):
+        """Record per-method calls, errors, latency, bytes processed and (optionally) memory peaks of every utility"""
+        if self.instrumentation is None:
+            from modules.instrumentation import Instrumentation
+            self.instrumentation = Instrumentation(trace_memory)
+            for name in UTILITIES:
+                if name in self.__dict__:
+                    self.instrumentation.instrument(self.__dict__[name], name)
+        return self.instrumentation
+    
+    def disable_instrumentation(self):
+        """Remove the instrumentation wrappers"""
+        if self.instrumentation is not None:
+            self.instrumentation.uninstrument_all()
+            self.instrumentation = None
+    
+    def write_metrics(self, fmt='text', stream=None):
+        """Write instrumentation data as a text report or Prometheus exposition"""
+        if self.instrumentation is None:
+            return
+        stream = stream or sys.stderr
+        if fmt == 'prometheus':
+            stream.write(self.instrumentation.prometheus())
+        else:
+            stream.write(self.instrumentation.report() + '\n')
+    
+    def command_executor(self):
+        """Executor for JSON commands addressed to this utility's modules"""
+        from modules.command_server import CommandExecutor
+        return CommandExecutor(self, UTILITIES)
+    
+    def run_batch(self, path=None, workers=1):
+        """Run NDJSON commands from a file (or stdin) and stream responses to stdout"""
+        executor = self.command_executor()
+        if path is None or path == '-':
+            return executor.run_batch(sys.stdin, sys.stdout, workers)
+        with open(path, 'r', encoding='utf-8') as f:
+            return executor.run_batch(f, sys.stdout, workers)
+    
+    def serve(self, socket_path, workers=8):
+        """Serve NDJSON commands on a Unix socket until interrupted"""
+        from modules.command_server import serve
+        self.load_all()
+        serve(socket_path, self.command_executor(), workers)
+    
+    def load_all(self):
+        """Create every utility now"""
+        for name in UTILITIES:
+            getattr(self, name)
+    
+    def print_startup_profile(self):
+        """Load all utilities and report import/init time per module"""
+        self.load_all()
+        print(f"{'utility':<18}{'import ms':>12}{'init ms':>12}")
+        total = 0.0
+        for name, timing in self.startup_profile.items():
+            total += timing['import'] + timing['init']
+            print(f"{name:<18}{timing['import'] * 1000:>12.2f}{timing['init'] * 1000:>12.2f}")
+        print(f"{'total':<18}{total * 1000:>24.2f}")
     
     def run_cli(self):
         """Run the CLI interface"""
+        from modules.cli_interface import CLIInterface
         cli = CLIInterface(self)
         cli.run()
     
@@ -115,17 +198,72 @@ class BigUtility:
         print("DEMONSTRATION COMPLETE!")
         print("="*60 + "\n")
 
+def _option(name, default=None):
+    """Value following a command-line flag"""
+    if name in sys.argv:
+        index = sys.argv.index(name)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return default
+
+def _pop_option(name, default=None):
+    """Remove a flag and its value from sys.argv, returning the value"""
+    if name not in sys.argv:
+        return default
+    index = sys.argv.index(name)
+    value = sys.argv[index + 1] if index + 1 < len(sys.argv) else default
+    del sys.argv[index:index + 2]
+    return value
+
+def _pop_flag(name):
+    """Remove a boolean flag from sys.argv, returning whether it was given"""
+    if name not in sys.argv:
+        return False
+    sys.argv.remove(name)
+    return True
+
 def main():
     """Main entry point"""
+    setup_logger(__name__)
     utility = BigUtility()
+    # Metrics options apply to every mode, so take them out before dispatching
+    metrics_format = _pop_option("--metrics")
+    metrics_file = _pop_option("--metrics-file")
+    trace_memory = _pop_flag("--trace-memory")
+    if metrics_format not in (None, 'text', 'prometheus'):
+        print(f"Unknown metrics format: {metrics_format} (use text or prometheus)", file=sys.stderr)
+        sys.exit(2)
+    if metrics_format is not None:
+        # Instrument every utility; the report goes to stderr (or --metrics-file) on exit
+        utility.enable_instrumentation(trace_memory)
+        
+        def dump_metrics():
+            if metrics_file:
+                with open(metrics_file, 'w') as f:
+                    utility.write_metrics(metrics_format, f)
+            else:
+                utility.write_metrics(metrics_format)
+        atexit.register(dump_metrics)
     
     if len(sys.argv) > 1:
         if sys.argv[1] == "--demo":
             utility.demo_all_features()
         elif sys.argv[1] == "--cli":
             utility.run_cli()
+        elif sys.argv[1] == "--startup-profile":
+            utility.print_startup_profile()
+        elif sys.argv[1] == "--bench":
+            from modules.benchmarks import main as run_benchmarks
+            sys.exit(run_benchmarks(sys.argv[2:]))
+        elif sys.argv[1] == "--batch":
+            path = sys.argv[2] if len(sys.argv) > 2 and not sys.argv[2].startswith('--') else None
+            utility.run_batch(path, int(_option("--workers", 1)))
+        elif sys.argv[1] == "--serve" and len(sys.argv) > 2:
+            utility.serve(sys.argv[2], int(_option("--workers", 8)))
         else:
-            print("Usage: python main.py [--demo|--cli]")
+            print("Usage: python main.py [--demo|--cli|--startup-profile|--bench [NAME...] [--sizes N,N] "
+                  "[--save FILE] [--baseline FILE]|--batch [FILE] [--workers N]|--serve SOCKET [--workers N]] "
+                  "[--metrics text|prometheus [--metrics-file FILE] [--trace-memory]]")
     else:
         utility.demo_all_features()
 
@@ -1,11 +1,52 @@
 """Math utilities module"""
 
 import math
-from typing import List, Union
+from collections.abc import Sized
+from itertools import count, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import logging
+from modules.memoize import memoized, cache_stats, clear_caches
+from modules.primes import PrimeSieve
+from modules.streaming_stats import RunningStats, P2Quantile
+from modules import vector_backend
 
 logger = logging.getLogger(__name__)
 
+# Shared prime sieve; its cache grows on demand and is reused by every MathUtils
+_prime_sieve = PrimeSieve()
+
+# Larger arguments are computed without caching: their results are big integers
+# (n! has ~n*log2(n) bits, F(n) ~0.69*n bits) that would pin memory in the cache
+MEMO_MAX_FACTORIAL = 1000
+MEMO_MAX_FIBONACCI = 10000
+
+@memoized(maxsize=256, name='math_utils.factorial')
+def _factorial(n: int) -> int:
+    """Memoized factorial"""
+    return math.factorial(n)
+
+def _fast_doubling(n: int) -> int:
+    """nth Fibonacci number by fast doubling: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)^2 + F(k+1)^2"""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+@memoized(maxsize=1024, name='math_utils.fibonacci')
+def _fibonacci_number(n: int) -> int:
+    """Memoized nth Fibonacci number"""
+    return _fast_doubling(n)
+
+@memoized(maxsize=4096, name='math_utils.is_prime')
+def _is_prime(n: int) -> bool:
+    """Memoized primality check"""
+    return _prime_sieve.is_prime(n)
+
 class MathUtils:
     """Mathematical utilities"""
     
@@ -13,25 +54,56 @@ class MathUtils:
         """Calculate factorial"""
         if n < 0:
             raise ValueError("Factorial not defined for negative numbers")
-        return math.factorial(n)
+        if n > MEMO_MAX_FACTORIAL:
+            return math.factorial(n)
+        return _factorial(n)
     
     def fibonacci(self, n: int) -> List[int]:
         """Generate fibonacci sequence"""
         if n <= 0:
             return []
-        fib = [0, 1]
-        for _ in range(2, n):
-            fib.append(fib[-1] + fib[-2])
-        return fib[:n]
+        return list(islice(self.iter_fibonacci(), n))
+    
+    def fibonacci_number(self, n: int) -> int:
+        """Get the nth fibonacci number (F(0) = 0) in O(log n) multiplications"""
+        if n < 0:
+            raise ValueError("Fibonacci not defined for negative numbers")
+        if n > MEMO_MAX_FIBONACCI:
+            return _fast_doubling(n)
+        return _fibonacci_number(n)
+    
+    def iter_fibonacci(self) -> Iterator[int]:
+        """Lazily generate the fibonacci sequence"""
+        a, b = 0, 1
+        while True:
+            yield a
+            a, b = b, a + b
+    
+    def iter_primes(self, start: int = 2) -> Iterator[int]:
+        """Lazily generate primes from start onwards, sieving one segment at a time"""
+        span = 2 * _prime_sieve.segment_size
+        for low in count(start, span):
+            yield from _prime_sieve.primes(low, low + span)
     
     def is_prime(self, n: int) -> bool:
-        """Check if number is prime"""
-        if n < 2:
-            return False
-        for i in range(2, int(math.sqrt(n)) + 1):
-            if n % i == 0:
+        """Check if number is prime (sieve lookup for small n, Miller-Rabin for large n)"""
+        if isinstance(n, float):
+            if not n.is_integer():
                 return False
-        return True
+            n = int(n)
+        return _is_prime(n)
+    
+    def is_prime_batch(self, numbers: Iterable[int]) -> List[bool]:
+        """Check many numbers for primality at once"""
+        return _prime_sieve.is_prime_batch(numbers)
+    
+    def primes_in_range(self, start: int, stop: int) -> Iterator[int]:
+        """Generate primes in [start, stop) with a segmented sieve"""
+        return _prime_sieve.primes(start, stop)
+    
+    def count_primes(self, start: int, stop: int) -> int:
+        """Count primes in [start, stop) with a segmented sieve"""
+        return _prime_sieve.count(start, stop)
     
     def gcd(self, a: int, b: int) -> int:
         """Calculate greatest common divisor"""
@@ -51,27 +123,58 @@ class MathUtils:
             raise ValueError("Square root not defined for negative numbers")
         return math.sqrt(n)
     
-    def average(self, numbers: List[Union[int, float]]) -> float:
+    def average(self, numbers: Iterable[Union[int, float]], backend: str = 'auto') -> float:
         """Calculate average"""
-        return sum(numbers) / len(numbers) if numbers else 0
+        if vector_backend.select_backend('average', numbers, backend) == 'numpy':
+            return vector_backend.average(numbers)
+        if not isinstance(numbers, Sized):
+            stats = self.running_stats(numbers)
+            return stats.mean if stats.count else 0
+        numbers = vector_backend.to_python(numbers)
+        return vector_backend.fsum(numbers) / len(numbers) if len(numbers) else 0
     
-    def median(self, numbers: List[Union[int, float]]) -> float:
+    def median(self, numbers: Iterable[Union[int, float]], backend: str = 'auto') -> float:
         """Calculate median"""
+        if vector_backend.select_backend('median', numbers, backend) == 'numpy':
+            return vector_backend.median(numbers)
         sorted_nums = sorted(numbers)
         n = len(sorted_nums)
         if n % 2 == 1:
             return sorted_nums[n // 2]
         return (sorted_nums[n//2 - 1] + sorted_nums[n//2]) / 2
     
-    def standard_deviation(self, numbers: List[Union[int, float]]) -> float:
-        """Calculate standard deviation"""
-        avg = self.average(numbers)
-        variance = sum((x - avg) ** 2 for x in numbers) / len(numbers)
-        return math.sqrt(variance)
+    def standard_deviation(self, numbers: Iterable[Union[int, float]], backend: str = 'auto') -> float:
+        """Calculate standard deviation (single pass, accepts any iterable)"""
+        if vector_backend.select_backend('standard_deviation', numbers, backend) == 'numpy':
+            return vector_backend.standard_deviation(numbers)
+        return self.running_stats(numbers).stdev()
+    
+    def running_stats(self, numbers: Iterable[Union[int, float]] = ()) -> RunningStats:
+        """Build a mergeable count/mean/variance/min/max accumulator in one pass"""
+        return RunningStats().update(numbers)
     
-    def sum_of_squares(self, numbers: List[Union[int, float]]) -> Union[int, float]:
+    def merge_stats(self, *stats: RunningStats) -> RunningStats:
+        """Combine accumulators from threads, processes or shards"""
+        merged = RunningStats()
+        for s in stats:
+            merged.merge(s)
+        return merged
+    
+    def approx_quantile(self, numbers: Iterable[Union[int, float]], q: float) -> Optional[float]:
+        """Estimate a quantile in constant memory (P-square)"""
+        return P2Quantile(q).update(numbers).value()
+    
+    def approx_median(self, numbers: Iterable[Union[int, float]]) -> Optional[float]:
+        """Estimate the median in constant memory (P-square)"""
+        return self.approx_quantile(numbers, 0.5)
+    
+    def sum_of_squares(self, numbers: Iterable[Union[int, float]], backend: str = 'auto') -> Union[int, float]:
         """Calculate sum of squares"""
-        return sum(x ** 2 for x in numbers)
+        if vector_backend.select_backend('sum_of_squares', numbers, backend) == 'numpy':
+            result = vector_backend.sum_of_squares(numbers)
+            if result is not None:
+                return result
+        return vector_backend.fsum(x * x for x in vector_backend.to_python(numbers))
     
     def is_perfect_square(self, n: int) -> bool:
         """Check if number is perfect square"""
@@ -84,11 +187,22 @@ class MathUtils:
         """Calculate sum of digits"""
         return sum(int(d) for d in str(abs(n)))
     
+    def cache_stats(self) -> Dict[str, Dict]:
+        """Get hit/miss statistics of the memoized MathUtils functions"""
+        return cache_stats('math_utils.')
+    
+    def clear_caches(self) -> None:
+        """Clear the memoized MathUtils functions"""
+        clear_caches('math_utils.')
+    
     def demo(self):
         """Demo math utilities"""
         print(f"✓ Factorial of 5: {self.factorial(5)}")
         print(f"✓ Fibonacci (10): {self.fibonacci(10)}")
+        print(f"✓ Fibonacci #1000 has {len(str(self.fibonacci_number(1000)))} digits")
         print(f"✓ Is 17 prime? {self.is_prime(17)}")
+        print(f"✓ Is 2^61-1 prime? {self.is_prime(2**61 - 1)}")
+        print(f"✓ Primes below 1,000,000: {self.count_primes(0, 1000000)}")
         print(f"✓ GCD(48, 18): {self.gcd(48, 18)}")
         print(f"✓ LCM(12, 18): {self.lcm(12, 18)}")
         print(f"✓ Average [1,2,3,4,5]: {self.average([1,2,3,4,5])}")
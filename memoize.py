@@ -0,0 +1,43 @@
+"""Bounded memoization module"""
+
+import functools
+from typing import Callable, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_registry: Dict[str, Callable] = {}
+
+def memoized(maxsize: int = 1024, name: Optional[str] = None) -> Callable:
+    """Decorator adding a bounded, thread-safe LRU cache registered for hit-rate reporting
+    
+    Keys are typed, so 7 and 7.0 are cached separately.
+    """
+    def decorator(func: Callable) -> Callable:
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(func)
+        _registry[name or f"{func.__module__}.{func.__qualname__}"] = cached
+        return cached
+    return decorator
+
+def cache_stats(prefix: str = '') -> Dict[str, Dict]:
+    """Hits, misses, hit rate and size of every registered cache whose name starts with prefix"""
+    stats = {}
+    for name, cached in _registry.items():
+        if not name.startswith(prefix):
+            continue
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+            'size': info.currsize,
+            'maxsize': info.maxsize
+        }
+    return stats
+
+def clear_caches(prefix: str = '') -> None:
+    """Clear every registered cache whose name starts with prefix"""
+    for name, cached in _registry.items():
+        if name.startswith(prefix):
+            cached.cache_clear()
\ No newline at end of file
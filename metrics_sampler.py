@@ -0,0 +1,193 @@
+"""Background system metrics sampler module"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+import psutil
+import logging
+
+logger = logging.getLogger(__name__)
+
+GB = 1024 ** 3
+MB = 1024 ** 2
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Linearly interpolated q-th percentile (0..100) of values"""
+    if not values:
+        return None
+    if not 0 <= q <= 100:
+        raise ValueError("q must be in 0..100")
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+class MetricsSampler:
+    """Daemon thread sampling CPU, memory, disk and process stats into a fixed-size ring buffer
+    
+    Each sample is a flat dict of numeric metrics plus a 'time' key; reads only
+    copy from the buffer and never wait on psutil. top_processes > 0 also records
+    the busiest processes in each sample, which costs a full process scan.
+    """
+    
+    def __init__(self, interval: float = 1.0, capacity: int = 600, disk_path: str = '/', top_processes: int = 0):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.capacity = capacity
+        self.disk_path = disk_path
+        self.top_processes = top_processes
+        self._samples: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = psutil.Process(os.getpid())
+        self._cpu_times: Optional[tuple] = None
+    
+    def _cpu_percent(self) -> float:
+        """System CPU usage since the previous call
+        
+        Uses this sampler's own cpu_times baseline instead of psutil.cpu_percent(None),
+        whose shared baseline would skew every other caller's readings.
+        """
+        times = psutil.cpu_times()
+        # guest time is already included in user/nice on Linux
+        total = sum(times) - getattr(times, 'guest', 0) - getattr(times, 'guest_nice', 0)
+        idle = times.idle + getattr(times, 'iowait', 0)
+        previous, self._cpu_times = self._cpu_times, (total, idle)
+        if previous is None or total <= previous[0]:
+            return 0.0
+        busy = 1 - (idle - previous[1]) / (total - previous[0])
+        return round(min(max(busy, 0.0), 1.0) * 100, 1)
+    
+    def _collect(self) -> Dict[str, Any]:
+        """Take one sample (cpu_percent values cover the time since the previous sample)"""
+        mem = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        sample = {
+            'time': time.time(),
+            'cpu_percent': self._cpu_percent(),
+            'memory_percent': mem.percent,
+            'memory_used_gb': mem.used / GB,
+            'memory_available_gb': mem.available / GB,
+            'disk_percent': disk.percent,
+            'disk_free_gb': disk.free / GB,
+            'process_count': len(psutil.pids())
+        }
+        try:
+            with self._process.oneshot():
+                sample['process_cpu_percent'] = self._process.cpu_percent(interval=None)
+                sample['process_rss_mb'] = self._process.memory_info().rss / MB
+                sample['process_threads'] = self._process.num_threads()
+        except psutil.Error as e:
+            logger.error("Failed to sample process stats: %s", e)
+        if self.top_processes:
+            sample['top_processes'] = self._top_processes()
+        return sample
+    
+    def _top_processes(self) -> List[Dict[str, Any]]:
+        """Busiest processes by CPU since the previous sample"""
+        processes = []
+        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            info = proc.info
+            if info['cpu_percent'] is not None:
+                processes.append(info)
+        processes.sort(key=lambda info: info['cpu_percent'], reverse=True)
+        return processes[:self.top_processes]
+    
+    def sample_now(self) -> Dict[str, Any]:
+        """Take a sample immediately and store it"""
+        sample = self._collect()
+        with self._lock:
+            self._samples.append(sample)
+        return sample
+    
+    def _run(self) -> None:
+        """Sampling loop"""
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_now()
+            except Exception as e:
+                logger.error("Failed to sample metrics: %s", e)
+    
+    def start(self) -> 'MetricsSampler':
+        """Start the sampling thread (no-op if already running)"""
+        if self.running:
+            return self
+        # Prime the CPU counters so the first real sample covers a full interval
+        self._cpu_percent()
+        self._process.cpu_percent(interval=None)
+        if self.top_processes:
+            self._top_processes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='metrics-sampler', daemon=True)
+        self._thread.start()
+        logger.info("Started metrics sampler every %ss", self.interval)
+        return self
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the sampling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def __enter__(self) -> 'MetricsSampler':
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recent sample, or None before the first one"""
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+    
+    def samples(self, window: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Samples from the last window seconds (all buffered samples when None), oldest first"""
+        with self._lock:
+            samples = list(self._samples)
+        if window is None:
+            return samples
+        cutoff = time.time() - window
+        index = len(samples)
+        while index and samples[index - 1]['time'] >= cutoff:
+            index -= 1
+        return samples[index:]
+    
+    def values(self, metric: str, window: Optional[float] = None) -> List[float]:
+        """Values of one metric over a window"""
+        return [sample[metric] for sample in self.samples(window) if metric in sample]
+    
+    def average(self, metric: str, window: Optional[float] = None) -> Optional[float]:
+        """Mean of a metric over a window"""
+        values = self.values(metric, window)
+        return sum(values) / len(values) if values else None
+    
+    def percentile(self, metric: str, q: float, window: Optional[float] = None) -> Optional[float]:
+        """q-th percentile of a metric over a window"""
+        return percentile(self.values(metric, window), q)
+    
+    def summary(self, window: Optional[float] = None, percentiles: tuple = (50, 95)) -> Dict[str, Dict[str, float]]:
+        """min/mean/max and percentiles of every numeric metric over a window"""
+        samples = self.samples(window)
+        result = {}
+        if not samples:
+            return result
+        for metric, value in samples[-1].items():
+            if metric == 'time' or not isinstance(value, (int, float)):
+                continue
+            values = [sample[metric] for sample in samples if metric in sample]
+            stats = {'min': min(values), 'mean': sum(values) / len(values), 'max': max(values)}
+            for q in percentiles:
+                stats[f"p{q}"] = percentile(values, q)
+            result[metric] = stats
+        return result
\ No newline at end of file
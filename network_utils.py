@@ -1,15 +1,29 @@
 """Network utilities module"""
 
 import socket
-import requests
 import logging
-from typing import Optional, Dict
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Optional, Dict, Tuple, Union
+from modules import port_scanner
+from modules.dns_cache import DNSCache
 
 logger = logging.getLogger(__name__)
 
 class NetworkUtils:
     """Network utilities"""
     
+    def __init__(self):
+        self._http = None
+        self.dns = DNSCache()
+        self.response_cache = None
+    
+    @property
+    def http(self):
+        """Pooled HTTP client (requests is only imported on first use)"""
+        if self._http is None:
+            from modules.http_pool import HTTPClient
+            self._http = HTTPClient()
+        return self._http
+    
     def get_local_ip(self) -> str:
         """Get local IP address"""
         try:
@@ -24,6 +38,7 @@ class NetworkUtils:
     def get_public_ip(self) -> Optional[str]:
         """Get public IP address"""
         try:
+            import requests
             response = requests.get('https://api.ipify.org', timeout=5)
             return response.text
         except:
@@ -32,49 +47,83 @@ class NetworkUtils:
     def is_internet_available(self) -> bool:
         """Check if internet is available"""
         try:
+            import requests
             requests.head('https://www.google.com', timeout=3)
             return True
         except:
             return False
     
     def ping_host(self, host: str) -> bool:
-        """Ping a host"""
+        """Ping a host (checks that it resolves, through the DNS cache)"""
         try:
-            socket.gethostbyname(host)
-            return True
-        except:
+            return self.dns.resolve(host) is not None
+        except Exception as e:
+            logger.error("Failed to resolve %s: %s", host, e)
             return False
     
     def get_host_ip(self, hostname: str) -> Optional[str]:
-        """Get IP from hostname"""
+        """Get IP from hostname (cached)"""
         try:
-            return socket.gethostbyname(hostname)
-        except:
+            return self.dns.gethostbyname(hostname)
+        except Exception as e:
+            logger.error("Failed to resolve %s: %s", hostname, e)
             return None
     
+    def resolve_hosts(self, hostnames: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """Resolve many hostnames in parallel (cached)"""
+        return self.dns.resolve_many(hostnames)
+    
+    def dns_cache_stats(self) -> Dict:
+        """DNS cache hit/miss metrics"""
+        return self.dns.stats()
+    
     def port_open(self, host: str, port: int, timeout: int = 2) -> bool:
         """Check if port is open"""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0
-        except:
+            return port_scanner.run_sync(port_scanner.probe(host, port, timeout))['open']
+        except Exception:
             return False
     
-    def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[Dict]:
-        """Make HTTP request"""
-        try:
-            response = requests.request(method, url, timeout=10, **kwargs)
-            return {
-                'status_code': response.status_code,
-                'content': response.text,
-                'headers': dict(response.headers)
-            }
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return None
+    def scan_ports(self, targets: Iterable[Tuple[str, int]], concurrency: int = 256,
+                   timeout: float = 2.0) -> Iterator[Dict]:
+        """Probe many (host, port) pairs concurrently, streaming result dicts as probes finish"""
+        return port_scanner.scan(targets, concurrency, timeout)
+    
+    def scan_hosts(self, hosts: Iterable[str], ports: Iterable[int], concurrency: int = 256,
+                   timeout: float = 2.0) -> Dict[Tuple[str, int], bool]:
+        """Map every (host, port) of hosts x ports to whether it is open"""
+        targets = port_scanner.expand_targets(hosts, ports)
+        return port_scanner.run_sync(port_scanner.scan_async(targets, concurrency, timeout))
+    
+    def scan_ports_async(self, targets: Iterable[Tuple[str, int]], concurrency: int = 256,
+                         timeout: float = 2.0) -> AsyncIterator[Dict]:
+        """Async iterator of probe results for use inside an event loop"""
+        return port_scanner.iter_scan(targets, concurrency, timeout)
+    
+    def enable_response_cache(self, directory: str, max_bytes: int = 256 << 20, default_ttl: float = 0):
+        """Cache GET responses on disk (shared safely between processes using the same directory)"""
+        from modules.http_cache import HTTPCache
+        self.response_cache = HTTPCache(directory, max_bytes, default_ttl)
+        return self.response_cache
+    
+    def make_request(self, url: str, method: str = 'GET', timeout: float = 10, **kwargs) -> Optional[Dict]:
+        """Make HTTP request over a pooled keep-alive session
+        
+        GET requests go through the response cache when it is enabled, and the
+        result then also has 'cache': 'hit', 'revalidated' or 'miss'.
+        """
+        if self.response_cache is not None and method.upper() == 'GET':
+            return self.response_cache.fetch(self.http, url, timeout=timeout, **kwargs)
+        return self.http.fetch(method, url, timeout=timeout, **kwargs)
+    
+    def batch_requests(self, specs: Iterable[Union[str, Dict[str, Any]]],
+                       max_workers: Optional[int] = None) -> List[Optional[Dict]]:
+        """Make many requests concurrently (URLs or dicts of 'url', 'method' and request kwargs)"""
+        return self.http.batch(specs, max_workers)
+    
+    def download_file(self, url: str, filepath: str, chunk_size: int = 1 << 16) -> Optional[int]:
+        """Stream a URL to a file and return the number of bytes written"""
+        return self.http.download(url, filepath, chunk_size)
     
     def demo(self):
         """Demo network utilities"""
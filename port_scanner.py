@@ -0,0 +1,115 @@
+"""Asynchronous port scanner module"""
+
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, Iterator, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def expand_targets(hosts: Iterable[str], ports: Iterable[int]) -> Iterator[Tuple[str, int]]:
+    """Every (host, port) pair of hosts x ports"""
+    ports = list(ports)
+    for host in hosts:
+        for port in ports:
+            yield host, port
+
+async def probe(host: str, port: int, timeout: float = 2.0) -> Dict[str, Any]:
+    """Try a TCP connect and report whether the port accepted it
+    
+    Invalid targets (ports outside 0..65535, malformed hosts) are reported in
+    the result's 'error' instead of raising, so one bad pair never aborts a scan.
+    """
+    started = time.perf_counter()
+    result = {'host': host, 'port': port, 'open': False, 'latency': None, 'error': None}
+    if isinstance(port, int) and not 0 <= port <= 65535:
+        result['error'] = 'port must be in 0..65535'
+        return result
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        result['open'] = True
+        result['latency'] = time.perf_counter() - started
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    except asyncio.TimeoutError:
+        result['error'] = 'timeout'
+    except OSError as e:
+        result['error'] = e.strerror or str(e)
+    except (OverflowError, ValueError, TypeError) as e:
+        result['error'] = str(e)
+    return result
+
+async def iter_scan(targets: Iterable[Tuple[str, int]], concurrency: int = 256,
+                    timeout: float = 2.0) -> AsyncIterator[Dict[str, Any]]:
+    """Probe (host, port) pairs with at most concurrency probes in flight, yielding results as they finish
+    
+    Targets are pulled lazily, so arbitrarily long target iterators use memory
+    proportional to concurrency.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+    pending = set()
+    targets = iter(targets)
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                target = next(targets, None)
+                if target is None:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(probe(target[0], target[1], timeout)))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # Consumer stopped early: cancel the probes still in flight
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+async def scan_async(targets: Iterable[Tuple[str, int]], concurrency: int = 256,
+                     timeout: float = 2.0) -> Dict[Tuple[str, int], bool]:
+    """Probe all targets and map (host, port) -> open"""
+    return {(r['host'], r['port']): r['open'] async for r in iter_scan(targets, concurrency, timeout)}
+
+def run_sync(coro: Awaitable) -> Any:
+    """Run a coroutine to completion from sync code, even when called inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    outcome = {}
+    
+    def target():
+        try:
+            outcome['result'] = asyncio.run(coro)
+        except BaseException as e:
+            outcome['error'] = e
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+def scan(targets: Iterable[Tuple[str, int]], concurrency: int = 256, timeout: float = 2.0) -> Iterator[Dict[str, Any]]:
+    """Sync generator streaming iter_scan results from a private event loop"""
+    loop = asyncio.new_event_loop()
+    results = iter_scan(targets, concurrency, timeout)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
\ No newline at end of file
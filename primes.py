@@ -0,0 +1,144 @@
+"""Prime number engine module"""
+
+import math
+import threading
+from typing import Iterable, Iterator, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bases that make Miller-Rabin deterministic for n < 318665857834031151167461 (~3.2 * 10**23, covers all
+# 64-bit integers); that number is itself a strong pseudoprime to all twelve
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def miller_rabin(n: int) -> bool:
+    """Deterministic Miller-Rabin primality test for 64-bit integers (strong probable prime above)"""
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+class PrimeSieve:
+    """Cached odd-only sieve of Eratosthenes with segmented range queries
+    
+    Index i of the cached bytearray stands for the odd number 2*i + 1 and holds
+    1 when it is prime. The cache grows by doubling up to max_cached; numbers
+    above that go through Miller-Rabin, and ranges are sieved segment by segment.
+    """
+    
+    def __init__(self, initial_limit: int = 1 << 16, max_cached: int = 1 << 24,
+                 segment_size: int = 1 << 18):
+        self.max_cached = max_cached
+        self.segment_size = segment_size
+        self._lock = threading.Lock()
+        self.limit = 0
+        self._sieve = bytearray()
+        self._build(initial_limit)
+    
+    def _build(self, limit: int) -> None:
+        """Rebuild the cached sieve up to limit (inclusive)"""
+        size = (limit + 1) // 2
+        sieve = bytearray(b'\x01') * size
+        if size:
+            sieve[0] = 0
+        for i in range(1, (math.isqrt(limit) + 1) // 2):
+            if sieve[i]:
+                p = 2 * i + 1
+                start = p * p // 2
+                sieve[start::p] = bytes(len(range(start, size, p)))
+        self._sieve, self.limit = sieve, limit
+    
+    def ensure(self, limit: int) -> bool:
+        """Grow the cache to cover limit; False if limit exceeds max_cached"""
+        if limit <= self.limit:
+            return True
+        if limit > self.max_cached:
+            return False
+        with self._lock:
+            if limit > self.limit:
+                self._build(min(max(limit, 2 * self.limit), self.max_cached))
+        return True
+    
+    def is_prime(self, n: int) -> bool:
+        """Check primality: O(1) sieve lookup when cached, Miller-Rabin otherwise"""
+        if n < 2:
+            return False
+        if n % 2 == 0:
+            return n == 2
+        if n <= self.limit:
+            return self._sieve[n // 2] == 1
+        return miller_rabin(n)
+    
+    def is_prime_batch(self, values: Iterable[int]) -> List[bool]:
+        """Check primality of many values, sieving once when they are small enough"""
+        values = list(values)
+        if values:
+            self.ensure(max(values))
+        sieve, limit = self._sieve, self.limit
+        return [
+            (n == 2 if n % 2 == 0 else sieve[n // 2] == 1) if 0 <= n <= limit else self.is_prime(n)
+            for n in values
+        ]
+    
+    def _segments(self, start: int, stop: int) -> Iterator[tuple]:
+        """Yield (low, segment) pairs where segment[j] marks whether low + 2*j is prime"""
+        low = max(start, 3) | 1
+        if low >= stop:
+            return
+        self.ensure(min(math.isqrt(stop - 1) + 1, self.max_cached))
+        base_primes = list(self.primes(3, math.isqrt(stop - 1) + 1))
+        span = 2 * self.segment_size
+        while low < stop:
+            high = min(low + span, stop)
+            size = (high - low + 1) // 2
+            segment = bytearray(b'\x01') * size
+            for p in base_primes:
+                if p * p >= high:
+                    break
+                m = max(p * p, (low + p - 1) // p * p)
+                if m % 2 == 0:
+                    m += p
+                first = (m - low) // 2
+                if first < size:
+                    segment[first::p] = bytes(len(range(first, size, p)))
+            yield low, segment
+            low += span
+    
+    def primes(self, start: int, stop: int) -> Iterator[int]:
+        """Generate primes in [start, stop)"""
+        if start <= 2 < stop:
+            yield 2
+        if stop - 1 <= self.limit:
+            sieve = self._sieve
+            for i in range(max(start, 3) // 2, stop // 2):
+                if sieve[i]:
+                    yield 2 * i + 1
+            return
+        for low, segment in self._segments(start, stop):
+            index = segment.find(1)
+            while index != -1:
+                yield low + 2 * index
+                index = segment.find(1, index + 1)
+    
+    def count(self, start: int, stop: int) -> int:
+        """Count primes in [start, stop)"""
+        total = 1 if start <= 2 < stop else 0
+        if stop - 1 <= self.limit:
+            first, end = max(start, 3) // 2, stop // 2
+            return total + (self._sieve.count(1, first, end) if end > first else 0)
+        return total + sum(segment.count(1) for _, segment in self._segments(start, stop))
\ No newline at end of file
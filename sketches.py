@@ -0,0 +1,431 @@
+"""Streaming sketch module"""
+
+import base64
+import hashlib
+import heapq
+import math
+import random
+import sys
+from array import array
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _hash_bytes(item: Any) -> bytes:
+    """Stable byte encoding of an item (independent of PYTHONHASHSEED)"""
+    if isinstance(item, bytes):
+        return item
+    return repr(item).encode('utf-8')
+
+def hash64(item: Any) -> int:
+    """64-bit stable hash of an item"""
+    return int.from_bytes(hashlib.blake2b(_hash_bytes(item), digest_size=8).digest(), 'big')
+
+def _array_to_b64(values: array) -> str:
+    """Serialize an array as little-endian base64"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode('ascii')
+
+def _array_from_b64(typecode: str, data: str) -> array:
+    """Deserialize an array written by _array_to_b64"""
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+class HyperLogLog:
+    """HyperLogLog distinct counter using 2**precision one-byte registers"""
+    
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision must be between 4 and 18")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+        self._rank_bits = 64 - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+    
+    def add(self, item: Any) -> None:
+        """Add an item"""
+        h = hash64(item)
+        index = h >> self._rank_bits
+        rank = self._rank_bits - (h & self._rank_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def update(self, items: Iterable) -> 'HyperLogLog':
+        """Add many items"""
+        for item in items:
+            self.add(item)
+        return self
+    
+    def count(self) -> int:
+        """Estimate the number of distinct items"""
+        m = self.num_registers
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / math.fsum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+    
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Merge another sketch into this one"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict"""
+        return {
+            'type': 'hyperloglog',
+            'precision': self.precision,
+            'registers': base64.b64encode(bytes(self.registers)).decode('ascii')
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HyperLogLog':
+        """Deserialize from a dict produced by to_dict"""
+        sketch = cls(data['precision'])
+        sketch.registers = bytearray(base64.b64decode(data['registers']))
+        return sketch
+
+class CountMinSketch:
+    """Count-Min sketch for approximate item frequencies"""
+    
+    def __init__(self, width: int = 2048, depth: int = 5):
+        if width < 1 or depth < 1:
+            raise ValueError("Width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.table = array('q', bytes(8 * width * depth))
+    
+    @classmethod
+    def from_error(cls, epsilon: float = 0.001, delta: float = 0.01) -> 'CountMinSketch':
+        """Size a sketch so estimates exceed true counts by at most epsilon*total with probability 1-delta"""
+        return cls(int(math.ceil(math.e / epsilon)), int(math.ceil(math.log(1 / delta))))
+    
+    def _indexes(self, item: Any) -> List[int]:
+        """Row-major table indexes for an item (Kirsch-Mitzenmacher double hashing)"""
+        digest = hashlib.blake2b(_hash_bytes(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+    
+    def add(self, item: Any, count: int = 1) -> None:
+        """Add an item occurrence"""
+        table = self.table
+        for index in self._indexes(item):
+            table[index] += count
+        self.total += count
+    
+    def update(self, items: Iterable) -> 'CountMinSketch':
+        """Add many items"""
+        for item in items:
+            self.add(item)
+        return self
+    
+    def estimate(self, item: Any) -> int:
+        """Estimate an item's frequency (never underestimates)"""
+        table = self.table
+        return min(table[index] for index in self._indexes(item))
+    
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        """Merge another sketch into this one"""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge Count-Min sketches with different dimensions")
+        self.table = array('q', map(sum, zip(self.table, other.table)))
+        self.total += other.total
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict"""
+        return {
+            'type': 'countmin',
+            'width': self.width,
+            'depth': self.depth,
+            'total': self.total,
+            'table': _array_to_b64(self.table)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CountMinSketch':
+        """Deserialize from a dict produced by to_dict"""
+        sketch = cls(data['width'], data['depth'])
+        sketch.total = data['total']
+        sketch.table = _array_from_b64('q', data['table'])
+        return sketch
+
+class SpaceSaving:
+    """Space-Saving heavy hitters summary tracking at most `capacity` items"""
+    
+    def __init__(self, capacity: int = 100):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.counters: Dict[Hashable, List[int]] = {}
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._seq = 0
+    
+    def _push(self, item: Hashable, count: int) -> None:
+        """Record a (possibly stale) heap entry for an item"""
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+    
+    def _rebuild_heap(self) -> None:
+        """Drop stale heap entries"""
+        self._heap = [(c[0], i, item) for i, (item, c) in enumerate(self.counters.items())]
+        self._seq = len(self._heap)
+        heapq.heapify(self._heap)
+    
+    def _pop_min(self) -> Hashable:
+        """Remove and return the tracked item with the smallest count"""
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            counter = self.counters.get(item)
+            if counter is not None and counter[0] == count:
+                return item
+    
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Add an item occurrence"""
+        self.total += count
+        counter = self.counters.get(item)
+        if counter is not None:
+            counter[0] += count
+        elif len(self.counters) < self.capacity:
+            counter = self.counters[item] = [count, 0]
+        else:
+            evicted = self._pop_min()
+            floor = self.counters.pop(evicted)[0]
+            counter = self.counters[item] = [floor + count, floor]
+        self._push(item, counter[0])
+    
+    def update(self, items: Iterable) -> 'SpaceSaving':
+        """Add many items"""
+        for item in items:
+            self.add(item)
+        return self
+    
+    def top(self, k: Optional[int] = None) -> List[Tuple[Hashable, int, int]]:
+        """Top items as (item, count, max_overestimate) tuples"""
+        k = self.capacity if k is None else k
+        top = heapq.nlargest(k, self.counters.items(), key=lambda kv: kv[1][0])
+        return [(item, c[0], c[1]) for item, c in top]
+    
+    def _floor(self) -> int:
+        """Count any untracked item may have had"""
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(c[0] for c in self.counters.values())
+    
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """Merge another summary into this one"""
+        floor_self, floor_other = self._floor(), other._floor()
+        merged = {}
+        for item in self.counters.keys() | other.counters.keys():
+            c1 = self.counters.get(item, [floor_self, floor_self])
+            c2 = other.counters.get(item, [floor_other, floor_other])
+            merged[item] = [c1[0] + c2[0], c1[1] + c2[1]]
+        top = heapq.nlargest(self.capacity, merged.items(), key=lambda kv: kv[1][0])
+        self.counters = dict(top)
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict (items must be JSON-compatible)"""
+        return {
+            'type': 'spacesaving',
+            'capacity': self.capacity,
+            'total': self.total,
+            'counters': [[item, c[0], c[1]] for item, c in self.counters.items()]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SpaceSaving':
+        """Deserialize from a dict produced by to_dict"""
+        sketch = cls(data['capacity'])
+        sketch.total = data['total']
+        sketch.counters = {item: [count, error] for item, count, error in data['counters']}
+        sketch._rebuild_heap()
+        return sketch
+
+class QuantileSketch:
+    """KLL quantile sketch with rank error of roughly 1.7/k"""
+    
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.compactors: List[List[float]] = []
+        self._random = random.Random(seed)
+        self._size = 0
+        self._max_size = 0
+        self._grow()
+    
+    def _grow(self) -> None:
+        """Add a compactor level"""
+        self.compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+    
+    def _capacity(self, height: int) -> int:
+        """Capacity of the compactor at a level"""
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+    
+    def _compress(self) -> None:
+        """Halve full compactors into the next level until under budget"""
+        for height in range(len(self.compactors)):
+            compactor = self.compactors[height]
+            if len(compactor) >= self._capacity(height):
+                if height + 1 >= len(self.compactors):
+                    self._grow()
+                compactor.sort()
+                keep = compactor.pop() if len(compactor) % 2 else None
+                self.compactors[height + 1].extend(compactor[self._random.randint(0, 1)::2])
+                compactor.clear()
+                if keep is not None:
+                    compactor.append(keep)
+                self._size = sum(len(c) for c in self.compactors)
+                if self._size < self._max_size:
+                    break
+    
+    def add(self, value: float) -> None:
+        """Add a value"""
+        self.compactors[0].append(value)
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+    
+    def update(self, values: Iterable[float]) -> 'QuantileSketch':
+        """Add many values"""
+        for value in values:
+            self.add(value)
+        return self
+    
+    def _weighted(self) -> List[Tuple[float, int]]:
+        """Sorted (value, weight) pairs"""
+        return sorted((v, 1 << h) for h, c in enumerate(self.compactors) for v in c)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1)"""
+        return self.quantiles([q])[0]
+    
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Approximate several quantiles with one pass over the sketch"""
+        qs = list(qs)
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if not self.count:
+            return [None] * len(qs)
+        weighted = self._weighted()
+        total = sum(w for _, w in weighted)
+        results = []
+        for q in qs:
+            if q == 0:
+                results.append(self.min)
+                continue
+            if q == 1:
+                results.append(self.max)
+                continue
+            target, cumulative = q * total, 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    results.append(value)
+                    break
+            else:
+                results.append(self.max)
+        return results
+    
+    def rank(self, value: float) -> float:
+        """Approximate fraction of values <= value"""
+        if not self.count:
+            return 0.0
+        weighted = self._weighted()
+        total = sum(w for _, w in weighted)
+        return sum(w for v, w in weighted if v <= value) / total
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch into this one"""
+        if other.k != self.k:
+            raise ValueError("Cannot merge quantile sketches with different k")
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for height, compactor in enumerate(other.compactors):
+            self.compactors[height].extend(compactor)
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self._size = sum(len(c) for c in self.compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict"""
+        return {
+            'type': 'kll',
+            'k': self.k,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'compactors': [list(c) for c in self.compactors]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QuantileSketch':
+        """Deserialize from a dict produced by to_dict"""
+        sketch = cls(data['k'])
+        sketch.count = data['count']
+        sketch.min = data['min']
+        sketch.max = data['max']
+        sketch.compactors = []
+        for compactor in data['compactors']:
+            sketch._grow()
+            sketch.compactors[-1].extend(compactor)
+        sketch._size = sum(len(c) for c in sketch.compactors)
+        return sketch
+
+_SKETCH_TYPES = {
+    'hyperloglog': HyperLogLog,
+    'countmin': CountMinSketch,
+    'spacesaving': SpaceSaving,
+    'kll': QuantileSketch,
+}
+
+def sketch_from_dict(data: Dict):
+    """Deserialize any sketch produced by a to_dict method"""
+    sketch_type = _SKETCH_TYPES.get(data.get('type'))
+    if sketch_type is None:
+        raise ValueError(f"Unknown sketch type: {data.get('type')}")
+    try:
+        return sketch_type.from_dict(data)
+    except KeyError as e:
+        raise ValueError(f"Missing sketch field: {e.args[0]}") from e
\ No newline at end of file
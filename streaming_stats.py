@@ -0,0 +1,151 @@
+"""Streaming statistics module"""
+
+import math
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+class RunningStats:
+    """Single-pass count/mean/variance/min/max accumulator (Welford, merged with Chan et al.)
+    
+    Accumulators built on separate threads, processes or shards combine exactly
+    with merge(); to_dict/from_dict move them between processes.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[Number] = None
+        self.max: Optional[Number] = None
+    
+    def add(self, value: Number) -> None:
+        """Add one value (Welford update)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    def update(self, values: Iterable[Number], chunk_size: int = 4096) -> 'RunningStats':
+        """Add values from any iterable, consuming it once in chunks"""
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            n = len(chunk)
+            mean = math.fsum(chunk) / n
+            self._combine(n, mean, math.fsum((x - mean) ** 2 for x in chunk), min(chunk), max(chunk))
+    
+    def _combine(self, n: int, mean: float, m2: float, lo: Number, hi: Number) -> None:
+        """Fold a partial aggregate into this one (Chan et al. parallel update)"""
+        if not n:
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+    
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Merge another accumulator into this one"""
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+    
+    def variance(self, ddof: int = 0) -> float:
+        """Variance (ddof=0 for population, 1 for sample)"""
+        if self.count <= ddof:
+            return 0.0
+        return self.m2 / (self.count - ddof)
+    
+    def stdev(self, ddof: int = 0) -> float:
+        """Standard deviation (ddof=0 for population, 1 for sample)"""
+        return math.sqrt(self.variance(ddof))
+    
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict"""
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2, 'min': self.min, 'max': self.max}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RunningStats':
+        """Deserialize from a dict produced by to_dict"""
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data['count'], data['mean'], data['m2']
+        stats.min, stats.max = data['min'], data['max']
+        return stats
+
+class P2Quantile:
+    """P-square streaming quantile estimator (Jain & Chlamtac) in constant memory"""
+    
+    def __init__(self, q: float = 0.5):
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * q, 4 * q, 2 + 2 * q, 4]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+    
+    def add(self, value: Number) -> None:
+        """Add one value"""
+        self.count += 1
+        h = self._heights
+        if self.count <= 5:
+            h.append(value)
+            h.sort()
+            return
+        
+        n = self._positions
+        if value < h[0]:
+            h[0] = value
+            k = 0
+        elif value >= h[4]:
+            h[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= h[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+        
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = h[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not h[i - 1] < height < h[i + 1]:
+                    height = h[i] + d * (h[i + d] - h[i]) / (n[i + d] - n[i])
+                h[i] = height
+                n[i] += d
+    
+    def update(self, values: Iterable[Number]) -> 'P2Quantile':
+        """Add values from any iterable"""
+        for value in values:
+            self.add(value)
+        return self
+    
+    def value(self) -> Optional[float]:
+        """Current quantile estimate (exact while five or fewer values have been seen)"""
+        if not self.count:
+            return None
+        if self.count <= 5:
+            return self._heights[min(int(round(self.q * (self.count - 1))), self.count - 1)]
+        return self._heights[2]
\ No newline at end of file
@@ -2,11 +2,29 @@
 
 import re
 import string
-from typing import List
+from collections import Counter
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 import logging
+from modules.fuzzy_index import AnagramIndex, NGramIndex
+from modules.keyword_matcher import KeywordMatcher
+from modules.text_stream import WordCounter, count_words_in_files, scan_file_parallel
 
 logger = logging.getLogger(__name__)
 
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+NUMBER_PATTERN = re.compile(r'\d+')
+# Byte-level twins for scanning raw files; offsets are byte offsets and \d is ASCII-only
+EMAIL_BYTES_PATTERN = re.compile(EMAIL_PATTERN.pattern.encode())
+NUMBER_BYTES_PATTERN = re.compile(NUMBER_PATTERN.pattern.encode())
+
+# Translation tables equivalent to the transform regexes on ASCII input; bytes.translate
+# runs these as a single C-level pass, several times faster than re.sub
+_ASCII = [chr(i) for i in range(128)]
+SLUG_DELETE = ''.join(c for c in _ASCII if not re.match(r'[\w\s-]', c)).encode('ascii')
+SPECIAL_CHARS_DELETE = ''.join(c for c in _ASCII if not re.match(r'[a-zA-Z0-9\s]', c)).encode('ascii')
+LOWER_TABLE = bytes.maketrans(string.ascii_uppercase.encode('ascii'), string.ascii_lowercase.encode('ascii'))
+SNAKE_TABLE = {ord(c): '_' + c for c in string.ascii_uppercase}
+
 class StringUtils:
     """String manipulation utilities"""
     
@@ -14,6 +32,8 @@ class StringUtils:
         """Reverse a string"""
         return text[::-1]
     
+    _TRANSFORMS = ('slug_format', 'snake_case', 'camel_case', 'remove_special_chars', 'capitalize_words')
+    
     def capitalize_words(self, text: str) -> str:
         """Capitalize first letter of each word"""
         return ' '.join(word.capitalize() for word in text.split())
@@ -37,18 +57,45 @@ class StringUtils:
     
     def extract_numbers(self, text: str) -> List[str]:
         """Extract all numbers from string"""
-        return re.findall(r'\d+', text)
+        return NUMBER_PATTERN.findall(text)
     
     def extract_emails(self, text: str) -> List[str]:
         """Extract emails from string"""
-        return re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        return EMAIL_PATTERN.findall(text)
+    
+    def iter_emails_in_file(self, filepath: str, workers: Optional[int] = 1,
+                            chunk_size: int = 1 << 20) -> Iterator[Tuple[int, str]]:
+        """Lazily yield (byte_offset, email) from a file of any size (workers > 1 or None uses a process pool)"""
+        for offset, match in scan_file_parallel(filepath, EMAIL_BYTES_PATTERN, workers, chunk_size=chunk_size,
+                                                max_match=512):
+            yield offset, match.decode('ascii')
+    
+    def iter_numbers_in_file(self, filepath: str, workers: Optional[int] = 1,
+                             chunk_size: int = 1 << 20) -> Iterator[Tuple[int, str]]:
+        """Lazily yield (byte_offset, number) from a file of any size (workers > 1 or None uses a process pool)"""
+        for offset, match in scan_file_parallel(filepath, NUMBER_BYTES_PATTERN, workers, chunk_size=chunk_size):
+            yield offset, match.decode('ascii')
+    
+    def build_keyword_matcher(self, keywords: Iterable[str], case_insensitive: bool = False,
+                              whole_word: bool = False) -> KeywordMatcher:
+        """Build a reusable multi-keyword matcher (Aho-Corasick automaton)"""
+        return KeywordMatcher(keywords, case_insensitive, whole_word)
+    
+    def find_keywords(self, text: str, keywords: Iterable[str], case_insensitive: bool = False,
+                      whole_word: bool = False) -> List[Tuple[int, int, str]]:
+        """Find every (start, end, keyword) occurrence of many keywords in one pass"""
+        return self.build_keyword_matcher(keywords, case_insensitive, whole_word).find_all(text)
     
     def remove_special_chars(self, text: str) -> str:
         """Remove special characters"""
+        if text.isascii():
+            return text.encode('ascii').translate(None, SPECIAL_CHARS_DELETE).decode('ascii')
         return re.sub(r'[^a-zA-Z0-9\s]', '', text)
     
     def slug_format(self, text: str) -> str:
         """Convert to slug format"""
+        if text.isascii():
+            return text.encode('ascii').translate(LOWER_TABLE, SLUG_DELETE).decode('ascii').strip().replace(' ', '-')
         return re.sub(r'[^\w\s-]', '', text).strip().lower().replace(' ', '-')
     
     def truncate_string(self, text: str, length: int, suffix: str = "...") -> str:
@@ -61,10 +108,37 @@ class StringUtils:
         """Check if two strings are anagrams"""
         return sorted(text1.replace(" ", "").lower()) == sorted(text2.replace(" ", "").lower())
     
+    def build_fuzzy_index(self, strings: Iterable[str], n: int = 3, case_insensitive: bool = True) -> NGramIndex:
+        """Build an n-gram index for repeated fuzzy lookups"""
+        return NGramIndex(strings, n, case_insensitive)
+    
+    def fuzzy_search(self, query: str, candidates: Iterable[str], k: int = 5,
+                     max_distance: int = 2) -> List[Tuple[str, int]]:
+        """Find the k candidates closest to query by edit distance (one-off; reuse build_fuzzy_index for many queries)"""
+        return NGramIndex(candidates).search(query, k, max_distance)
+    
+    def group_anagrams(self, words: Iterable[str], min_size: int = 2) -> List[List[str]]:
+        """Group words that are anagrams of each other"""
+        return AnagramIndex(words).anagram_groups(min_size)
+    
     def word_frequency(self, text: str) -> dict:
         """Get word frequency"""
-        words = text.lower().split()
-        return {word: words.count(word) for word in set(words)}
+        return dict(Counter(text.lower().split()))
+    
+    def top_words(self, source: Union[str, Iterable[str]], k: int = 10, pattern: Optional[str] = None,
+                  fold_case: Optional[str] = 'lower') -> List[Tuple[str, int]]:
+        """Get the k most frequent words of a string or an iterable of lines (e.g. an open file)"""
+        counter = WordCounter(pattern, fold_case)
+        if isinstance(source, str):
+            counter.update_text(source)
+        else:
+            counter.update_lines(source)
+        return counter.most_common(k)
+    
+    def word_frequency_files(self, filepaths: Iterable[str], k: Optional[int] = None, pattern: Optional[str] = None,
+                             fold_case: Optional[str] = 'lower', workers: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Get word frequencies (top k, or all) across files, counted in parallel per file"""
+        return count_words_in_files(filepaths, pattern, fold_case, workers).most_common(k)
     
     def camel_case(self, text: str) -> str:
         """Convert to camelCase"""
@@ -73,7 +147,27 @@ class StringUtils:
     
     def snake_case(self, text: str) -> str:
         """Convert to snake_case"""
-        return re.sub(r'(?<!^)(?=[A-Z])', '_', text).lower()
+        return (text[:1] + text[1:].translate(SNAKE_TABLE)).lower()
+    
+    def transform_many(self, texts: Iterable[str], transform: str, cache_size: int = 65536) -> Iterator[str]:
+        """Lazily apply a transform (e.g. 'slug_format') to many strings, memoizing repeated inputs
+        
+        cache_size bounds the memo (it is cleared when full); 0 disables it.
+        """
+        if transform not in self._TRANSFORMS:
+            raise ValueError(f"Unknown transform: {transform}")
+        func = getattr(self, transform)
+        if not cache_size:
+            yield from map(func, texts)
+            return
+        cache = {}
+        for text in texts:
+            result = cache.get(text)
+            if result is None:
+                if len(cache) >= cache_size:
+                    cache.clear()
+                result = cache[text] = func(text)
+            yield result
     
     def demo(self):
         """Demo string utilities"""
@@ -4,13 +4,20 @@ import os
 import platform
 import psutil
 import socket
+from typing import Dict, Optional
 import logging
+from modules.metrics_sampler import MetricsSampler
 
 logger = logging.getLogger(__name__)
 
 class SystemUtils:
     """System utilities"""
     
+    def __init__(self):
+        self.sampler: Optional[MetricsSampler] = None
+        # Prime the CPU counters so non-blocking reads measure from here on
+        psutil.cpu_percent(interval=None)
+    
     def get_os_name(self) -> str:
         """Get operating system name"""
         return platform.system()
@@ -31,9 +38,36 @@ class SystemUtils:
         """Get CPU count"""
         return os.cpu_count()
     
-    def get_cpu_percent(self) -> float:
-        """Get CPU usage percentage"""
-        return psutil.cpu_percent(interval=1)
+    def get_cpu_percent(self, interval: Optional[float] = None) -> float:
+        """Get CPU usage percentage
+        
+        Without an interval this never blocks: it returns the sampler's latest
+        value when one is running, else the usage since the previous call.
+        """
+        if interval is not None:
+            return psutil.cpu_percent(interval=interval)
+        latest = self.sampler.latest() if self.sampler is not None and self.sampler.running else None
+        if latest is not None:
+            return latest['cpu_percent']
+        return psutil.cpu_percent(interval=None)
+    
+    def start_sampler(self, interval: float = 1.0, capacity: int = 600, disk_path: str = '/',
+                      top_processes: int = 0) -> MetricsSampler:
+        """Start (or return the running) background metrics sampler"""
+        if self.sampler is None or not self.sampler.running:
+            self.sampler = MetricsSampler(interval, capacity, disk_path, top_processes).start()
+        return self.sampler
+    
+    def stop_sampler(self) -> None:
+        """Stop the background metrics sampler"""
+        if self.sampler is not None:
+            self.sampler.stop()
+    
+    def get_metrics_summary(self, window: Optional[float] = 60.0) -> Dict[str, Dict[str, float]]:
+        """min/mean/max/p50/p95 of sampled metrics over the last window seconds"""
+        if self.sampler is None:
+            return {}
+        return self.sampler.summary(window)
     
     def get_memory_info(self) -> Dict:
         """Get memory information"""
@@ -81,4 +115,8 @@ class SystemUtils:
         print(f"✓ Memory: {mem['used_gb']:.2f}/{mem['total_gb']:.2f}GB")
         disk = self.get_disk_info()
         print(f"✓ Disk: {disk['used_gb']:.2f}/{disk['total_gb']:.2f}GB")
-        print(f"✓ Processes: {self.get_process_count()}")
\ No newline at end of file
+        print(f"✓ Processes: {self.get_process_count()}")
+        sample = MetricsSampler().sample_now()
+        # Process stats are left out of the sample when psutil cannot read them
+        if 'process_rss_mb' in sample and 'process_threads' in sample:
+            print(f"✓ Sampled process: {sample['process_rss_mb']:.1f}MB RSS, {sample['process_threads']} threads")
\ No newline at end of file
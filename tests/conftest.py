@@ -0,0 +1,15 @@
+"""Test configuration: import the repository root as the modules package"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The sources import each other as modules.<name>, whatever the checkout directory is called
+if 'modules' not in sys.modules:
+    spec = importlib.util.spec_from_file_location('modules', ROOT / '__init__.py',
+                                                  submodule_search_locations=[str(ROOT)])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules['modules'] = package
+    spec.loader.exec_module(package)
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""Tests for benchmark measurement and regression checks"""
+
+import time
+
+from modules import benchmarks
+
+def test_measure_loops_short_cases_to_the_minimum_round_time():
+    calls = []
+    result = benchmarks.measure(lambda: calls.append(1), repeat=3, min_time=0.01, items=1)
+    assert result['loops'] > 1
+    assert len(calls) >= 1 + 3 * result['loops']
+    assert {'seconds', 'items_per_sec', 'peak_bytes', 'retained_blocks'} <= set(result)
+
+def test_retained_blocks_counts_what_the_call_keeps():
+    kept = []
+    result = benchmarks.measure(lambda: kept.append([object() for _ in range(1000)]), repeat=1, min_time=0)
+    assert result['retained_blocks'] >= 1000
+
+def test_compare_results_noise_floor():
+    baseline = [{'name': 'tiny', 'size': 1, 'seconds': 1e-6}, {'name': 'big', 'size': 1, 'seconds': 1e-3}]
+    results = [{'name': 'tiny', 'size': 1, 'seconds': 2e-6}, {'name': 'big', 'size': 1, 'seconds': 2e-3}]
+    flagged = {r['name']: r['regression'] for r in benchmarks.compare_results(results, baseline)}
+    assert flagged == {'tiny': False, 'big': True}
+
+def test_main_confirms_real_regressions(tmp_path, monkeypatch, capsys):
+    delay = {'value': 0.0}
+    
+    def bench_sleep(sizes=(1,)):
+        return [{'name': 'sleep', 'size': size, **benchmarks.measure(time.sleep, delay['value'], repeat=2)}
+                for size in sizes]
+    monkeypatch.setitem(benchmarks.BENCHMARKS, 'sleep', bench_sleep)
+    baseline = str(tmp_path / 'baseline.json')
+    assert benchmarks.main(['sleep', '--save', baseline]) == 0
+    assert benchmarks.main(['sleep', '--baseline', baseline, '--threshold', '100']) == 0
+    delay['value'] = 0.002
+    assert benchmarks.main(['sleep', '--baseline', baseline, '--confirm', '1']) == 1
+    assert 'REGRESSION' in capsys.readouterr().out
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""Tests for batch execution and the Unix-socket command daemon"""
+
+import io
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from modules.command_server import CommandExecutor, CommandServer, send_commands
+
+class _Echo:
+    """Minimal utility for the executor"""
+    
+    def echo(self, value):
+        return value
+    
+    def sleep(self, seconds):
+        time.sleep(seconds)
+        return seconds
+    
+    def demo(self):
+        print("demo output")
+
+class _Utility:
+    echo = _Echo()
+
+@pytest.fixture
+def executor():
+    return CommandExecutor(_Utility(), ['echo'])
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # AF_UNIX paths are limited to ~108 bytes, so keep it short
+    path = f"/tmp/cmd-test-{os.getpid()}-{threading.get_ident()}.sock"
+    yield path
+    if os.path.lexists(path):
+        os.remove(path)
+
+def _start(socket_path, executor, workers):
+    server = CommandServer(socket_path, executor, workers)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return server
+
+def _stop(server):
+    server.shutdown()
+    server.server_close()
+
+def test_demo_is_not_callable_and_batch_output_stays_ndjson(executor, capsys):
+    lines = io.StringIO('{"id": 1, "command": "echo.demo"}\n{"id": 2, "command": "echo.echo", "args": [3]}\n')
+    out = io.StringIO()
+    assert executor.run_batch(lines, out) == 2
+    assert out.getvalue() == ('{"id":1,"ok":false,"error":"ValueError: Invalid method: demo"}\n'
+                              '{"id":2,"ok":true,"result":3}\n')
+    assert capsys.readouterr().out == ''
+
+def test_socket_is_private_whatever_the_umask(socket_path, executor):
+    previous = os.umask(0)
+    try:
+        server = _start(socket_path, executor, 1)
+    finally:
+        os.umask(previous)
+    try:
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    finally:
+        _stop(server)
+
+def test_refuses_to_replace_a_regular_file(tmp_path, executor):
+    path = tmp_path / 'important.txt'
+    path.write_text('keep me')
+    with pytest.raises(FileExistsError):
+        CommandServer(str(path), executor)
+    assert path.read_text() == 'keep me'
+
+def test_refuses_a_live_daemon_and_replaces_a_stale_socket(socket_path, executor):
+    server = _start(socket_path, executor, 1)
+    try:
+        with pytest.raises(FileExistsError):
+            CommandServer(socket_path, executor)
+    finally:
+        _stop(server)
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    server = _start(socket_path, executor, 1)
+    try:
+        assert list(send_commands(socket_path, [{'id': 1, 'command': 'echo.echo', 'args': [5]}])) == [
+            {'id': 1, 'ok': True, 'result': 5}]
+    finally:
+        _stop(server)
+
+def test_idle_connection_does_not_block_others(socket_path, executor):
+    server = _start(socket_path, executor, 1)
+    idle = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        idle.connect(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(5)
+            client.connect(socket_path)
+            # Request/response without closing the write side
+            client.sendall(b'{"id": 1, "command": "echo.echo", "args": ["hi"]}\n')
+            assert client.makefile('rb').readline() == b'{"id":1,"ok":true,"result":"hi"}\n'
+    finally:
+        idle.close()
+        _stop(server)
+
+def test_responses_keep_command_order(socket_path, executor):
+    server = _start(socket_path, executor, 4)
+    commands = [{'id': i, 'command': 'echo.sleep', 'args': [0.02 if i % 2 else 0]} for i in range(20)]
+    try:
+        assert [r['id'] for r in send_commands(socket_path, commands)] == list(range(20))
+    finally:
+        _stop(server)
+
+def test_lazy_utilities_are_created_once_under_concurrency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    from modules import date_time_utils
+    from modules.main import BigUtility
+    created = []
+    
+    class SlowDateTimeUtils(date_time_utils.DateTimeUtils):
+        def __init__(self):
+            time.sleep(0.05)
+            created.append(self)
+    monkeypatch.setattr(date_time_utils, 'DateTimeUtils', SlowDateTimeUtils)
+    lines = ['{"id": %d, "command": "date_time_utils.is_leap_year", "args": [2024]}' % i for i in range(16)]
+    responses = list(BigUtility().command_executor().iter_responses(lines, workers=8))
+    assert len(responses) == 16
+    assert len(created) == 1
\ No newline at end of file
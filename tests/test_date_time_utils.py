@@ -0,0 +1,21 @@
+"""Tests for DateTimeUtils"""
+
+import pytest
+
+from modules.date_time_utils import DateTimeUtils
+
+def test_days_in_month():
+    date_time = DateTimeUtils()
+    assert [date_time.get_days_in_month(2024, m) for m in range(1, 13)] == [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    assert date_time.get_days_in_month(2023, 2) == 28
+
+@pytest.mark.parametrize('month', [0, -1, 13])
+def test_days_in_month_rejects_invalid_month(month):
+    with pytest.raises(ValueError):
+        DateTimeUtils().get_days_in_month(2024, month)
+
+def test_parse_column_fast_and_fallback_formats():
+    date_time = DateTimeUtils()
+    assert list(date_time.parse_column(['1970-01-02', '1970-01-02'])) == [86400, 86400]
+    assert list(date_time.parse_column(['1970-01-01 00:01:00'], '%Y-%m-%d %H:%M:%S')) == [60]
+    assert list(date_time.parse_column(['02/01/1970'], '%d/%m/%Y')) == [86400]
\ No newline at end of file
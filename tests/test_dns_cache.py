@@ -0,0 +1,72 @@
+"""Tests for the DNS cache with a stubbed resolver"""
+
+import socket
+import threading
+
+import pytest
+
+from modules.dns_cache import DNSCache
+from modules.network_utils import NetworkUtils
+
+class _Resolver:
+    """getaddrinfo stand-in counting calls; raises `error` while it is set"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+        self.release = threading.Event()
+        self.release.set()
+    
+    def __call__(self, host, *args, **kwargs):
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        if host == 'missing.test':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.0.2.1', 0))]
+
+@pytest.fixture
+def resolver(monkeypatch):
+    stub = _Resolver()
+    monkeypatch.setattr(socket, 'getaddrinfo', stub)
+    return stub
+
+def test_positive_and_negative_caching(resolver):
+    cache = DNSCache()
+    assert cache.resolve('host.test') == ['192.0.2.1']
+    assert cache.resolve('HOST.test') == ['192.0.2.1']
+    assert cache.resolve('missing.test') is None
+    assert cache.resolve('missing.test') is None
+    assert resolver.calls == 2
+    assert cache.stats()['negative_hits'] == 1
+
+def test_concurrent_lookups_are_coalesced(resolver):
+    cache = DNSCache()
+    resolver.release.clear()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.resolve('host.test'))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    resolver.release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [['192.0.2.1']] * 10
+    assert resolver.calls == 1
+
+def test_unexpected_error_is_not_cached(resolver):
+    cache = DNSCache()
+    resolver.error = RuntimeError('resolver bug')
+    with pytest.raises(RuntimeError):
+        cache.resolve('host.test')
+    resolver.error = None
+    assert cache.resolve('host.test') == ['192.0.2.1']
+    assert resolver.calls == 2
+
+def test_network_utils_keeps_baseline_failure_values(resolver):
+    network = NetworkUtils()
+    resolver.error = RuntimeError('resolver bug')
+    assert network.get_host_ip('host.test') is None
+    assert network.ping_host('host.test') is False
+    resolver.error = None
+    assert network.get_host_ip('host.test') == '192.0.2.1'
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Tests for bounded edit distance and n-gram candidate pruning against brute force"""
+
+import random
+
+import pytest
+
+from modules.fuzzy_index import NGramIndex, bounded_levenshtein
+
+def _levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+def _random_strings(rng, count, alphabet='abcdA', max_length=9):
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length))) for _ in range(count)]
+
+def test_bounded_levenshtein_matches_full_dp():
+    rng = random.Random(11)
+    words = _random_strings(rng, 120)
+    for a in words[:60]:
+        for b in words[60:]:
+            distance = _levenshtein(a, b)
+            for max_distance in range(5):
+                expected = distance if distance <= max_distance else None
+                assert bounded_levenshtein(a, b, max_distance) == expected
+                assert bounded_levenshtein(b, a, max_distance) == expected
+
+@pytest.mark.parametrize('n', [1, 2, 3])
+def test_search_matches_brute_force(n):
+    rng = random.Random(n)
+    strings = _random_strings(rng, 300)
+    index = NGramIndex(strings, n=n)
+    keys = [s.lower() for s in strings]
+    for query in _random_strings(rng, 40):
+        scored = sorted((_levenshtein(query.lower(), key), i) for i, key in enumerate(keys))
+        for max_distance in (0, 1, 2, 3):
+            for k in (1, 3, 10):
+                expected = [(strings[i], d) for d, i in scored if d <= max_distance][:k]
+                assert index.search(query, k, max_distance) == expected
+
+def test_short_queries_scan_everything():
+    index = NGramIndex(['a', 'ab', 'b', 'xyz', ''], n=3)
+    # One-character queries have fewer grams than a single edit can destroy, so required <= 0
+    assert index.search('a', k=10, max_distance=1) == [('a', 0), ('ab', 1), ('b', 1), ('', 1)]
+    assert index.search('', k=2, max_distance=1) == [('', 0), ('a', 1)]
+    assert index.search('q', k=10, max_distance=0) == []
+
+@pytest.mark.parametrize('min_similarity', [0.2, 0.5, 0.8, 1.0])
+def test_search_jaccard_matches_brute_force(min_similarity):
+    rng = random.Random(int(min_similarity * 10))
+    strings = _random_strings(rng, 300, max_length=12)
+    index = NGramIndex(strings, n=2)
+    for query in _random_strings(rng, 40, max_length=12):
+        query_grams = index.grams(query.lower())
+        scored = []
+        for i, text in enumerate(strings):
+            grams = index.grams(text.lower())
+            shared = len(query_grams & grams)
+            similarity = shared / (len(query_grams) + len(grams) - shared)
+            if similarity >= min_similarity:
+                scored.append((-similarity, i))
+        for k in (1, 5):
+            expected = [(strings[i], -s) for s, i in sorted(scored)[:k]]
+            assert index.search_jaccard(query, k, min_similarity) == expected
+
+def test_search_jaccard_rejects_bad_thresholds():
+    with pytest.raises(ValueError):
+        NGramIndex(['abc']).search_jaccard('abc', min_similarity=0)
\ No newline at end of file
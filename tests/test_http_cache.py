@@ -0,0 +1,130 @@
+"""Tests for the on-disk HTTP response cache against a local http.server"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from modules.http_cache import HTTPCache, freshness_lifetime
+from modules.http_pool import HTTPClient
+
+class _Handler(BaseHTTPRequestHandler):
+    """Echoes the path (and selected request headers) with caching headers chosen by the path"""
+    
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1
+    
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        with self.server.lock:
+            self.server.hits[path] = self.server.hits.get(path, 0) + 1
+        headers = {'Cache-Control': 'max-age=60'}
+        body = self.path
+        if path == '/vary':
+            headers['Vary'] = 'Accept-Language'
+            body = self.headers.get('Accept-Language', '')
+        elif path == '/star':
+            headers['Vary'] = '*'
+        elif path == '/auth':
+            body = self.headers.get('Authorization') or self.headers.get('Cookie') or 'anonymous'
+        elif path == '/shared':
+            headers['Cache-Control'] = 's-maxage=60'
+        elif path == '/etag':
+            headers = {'Cache-Control': 'max-age=0', 'ETag': '"v1"'}
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+        data = body.encode()
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.hits, httpd.lock = {}, threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def client():
+    with HTTPClient() as http:
+        yield http
+
+def test_params_are_part_of_the_key(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    first = cache.fetch(client, server + '/q', params={'x': 1})
+    second = cache.fetch(client, server + '/q', params={'x': 2})
+    again = cache.fetch(client, server + '/q', params={'x': 1})
+    assert (first['content'], second['content']) == ('/q?x=1', '/q?x=2')
+    assert (first['cache'], second['cache'], again['cache']) == ('miss', 'miss', 'hit')
+    assert again['content'] == '/q?x=1'
+
+def test_vary_headers_must_match(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    english = cache.fetch(client, server + '/vary', headers={'Accept-Language': 'en'})
+    german = cache.fetch(client, server + '/vary', headers={'Accept-Language': 'de'})
+    assert (english['content'], german['content']) == ('en', 'de')
+    assert german['cache'] == 'miss'
+    assert cache.fetch(client, server + '/vary', headers={'Accept-Language': 'de'})['cache'] == 'hit'
+
+def test_vary_star_is_not_stored(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    cache.fetch(client, server + '/star')
+    assert cache.fetch(client, server + '/star')['cache'] == 'miss'
+
+def test_authorized_requests_bypass_the_cache(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    private = cache.fetch(client, server + '/auth', headers={'Authorization': 'Bearer secret'})
+    assert (private['content'], private['cache']) == ('Bearer secret', 'bypass')
+    public = cache.fetch(client, server + '/auth')
+    assert (public['content'], public['cache']) == ('anonymous', 'miss')
+
+def test_auth_and_cookie_arguments_bypass_the_cache(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    private = cache.fetch(client, server + '/auth', auth=('alice', 'secret'))
+    assert private['cache'] == 'bypass' and private['content'].startswith('Basic ')
+    cookie = cache.fetch(client, server + '/auth', cookies={'session': 'alice'})
+    assert (cookie['content'], cookie['cache']) == ('session=alice', 'bypass')
+    public = cache.fetch(client, server + '/auth')
+    assert (public['content'], public['cache']) == ('anonymous', 'miss')
+    assert cache.fetch(client, server + '/auth')['content'] == 'anonymous'
+
+def test_s_maxage_is_ignored_in_a_private_cache(server, client, tmp_path):
+    assert freshness_lifetime({'Cache-Control': 's-maxage=60'}) == 0
+    cache = HTTPCache(str(tmp_path))
+    cache.fetch(client, server + '/shared')
+    assert cache.fetch(client, server + '/shared')['cache'] == 'miss'
+
+def test_stale_entries_are_revalidated(server, client, tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    assert cache.fetch(client, server + '/etag')['cache'] == 'miss'
+    revalidated = cache.fetch(client, server + '/etag')
+    assert (revalidated['cache'], revalidated['content']) == ('revalidated', '/etag')
+
+def test_eviction_runs_only_over_the_size_bound(tmp_path, monkeypatch):
+    cache = HTTPCache(str(tmp_path), max_bytes=16384)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, 'evict', lambda: scans.append(1) or evict())
+    for i in range(5):
+        cache.store(f'http://example.test/{i}', 200, {}, b'x' * 100)
+    assert len(scans) == 1
+    for i in range(5, 200):
+        cache.store(f'http://example.test/{i}', 200, {}, b'x' * 100)
+    total = sum(p.stat().st_size for p in tmp_path.glob('*.entry'))
+    assert total <= 16384
+    assert 1 < len(scans) < 40
\ No newline at end of file
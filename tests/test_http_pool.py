@@ -0,0 +1,89 @@
+"""Tests for the pooled HTTP client against a local http.server"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib3.util.retry import Retry
+
+from modules.http_pool import HTTPClient
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves /ok, /flaky (503 on the first hit per method) and /echo?...; counts hits per method and path"""
+    
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1  # one write per response, so keep-alive requests don't stall on delayed ACKs
+    
+    def _respond(self):
+        key = (self.command, self.path.split('?')[0])
+        with self.server.lock:
+            self.server.hits[key] = hits = self.server.hits.get(key, 0) + 1
+            self.server.connections.add(self.client_address)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        status = 503 if key[1] == '/flaky' and hits == 1 else 200
+        body = self.path.encode()
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_GET = do_POST = _respond
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.hits, httpd.connections, httpd.lock = {}, set(), threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+def test_fetch_reuses_pooled_connection(server):
+    with HTTPClient() as client:
+        for _ in range(5):
+            assert client.fetch('GET', _url(server, '/ok'))['status_code'] == 200
+    assert server.hits[('GET', '/ok')] == 5
+    assert len(server.connections) == 1
+
+def test_idempotent_request_is_retried(server):
+    with HTTPClient(backoff_factor=0) as client:
+        assert client.fetch('GET', _url(server, '/flaky'))['status_code'] == 200
+    assert server.hits[('GET', '/flaky')] == 2
+
+def test_post_is_not_retried_by_default(server):
+    with HTTPClient(backoff_factor=0) as client:
+        assert client.fetch('POST', _url(server, '/flaky'), data=b'x')['status_code'] == 503
+    assert server.hits[('POST', '/flaky')] == 1
+
+def test_post_retries_are_opt_in(server):
+    with HTTPClient(backoff_factor=0, retry_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'}) as client:
+        assert client.fetch('POST', _url(server, '/flaky'), data=b'x')['status_code'] == 200
+    assert server.hits[('POST', '/flaky')] == 2
+
+def test_batch_keeps_input_order(server):
+    urls = [_url(server, f'/echo?{i}') for i in range(20)]
+    with HTTPClient() as client:
+        results = client.batch(urls, max_workers=4)
+    assert [r['content'] for r in results] == [f'/echo?{i}' for i in range(20)]
+
+def test_iter_batch_bounds_in_flight_requests(server):
+    pulled = []
+    
+    def specs():
+        for i in range(100):
+            pulled.append(i)
+            yield _url(server, f'/echo?{i}')
+    with HTTPClient() as client:
+        batch = client.iter_batch(specs(), max_workers=2)
+        next(batch)
+        assert len(pulled) <= 4
+        assert len(list(batch)) == 99
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Tests for per-method instrumentation and the metrics command line options"""
+
+import atexit
+import logging
+import sys
+import tracemalloc
+
+import pytest
+
+from modules import benchmarks
+from modules import main as main_module
+from modules.crypto_utils import CryptoUtils
+from modules.file_operations import FileOps
+from modules.instrumentation import Instrumentation
+from modules.json_utils import JSONUtils
+from modules.math_utils import MathUtils
+
+@pytest.fixture(autouse=True)
+def no_log_files(monkeypatch):
+    # main() configures file logging under ./logs; keep test runs out of the working tree
+    monkeypatch.setattr(main_module, 'setup_logger', logging.getLogger)
+
+def test_nested_calls_are_recorded_once():
+    instrumentation = Instrumentation()
+    math_utils = instrumentation.instrument(MathUtils(), 'math_utils')
+    math_utils.standard_deviation([1.0, 2.0, 3.0, 4.0])
+    assert instrumentation.stats[('math_utils', 'standard_deviation')].calls == 1
+    assert instrumentation.stats[('math_utils', 'running_stats')].calls == 0
+    math_utils.running_stats([1.0])
+    assert instrumentation.stats[('math_utils', 'running_stats')].calls == 1
+
+def test_uninstrument_removes_wrappers():
+    instrumentation = Instrumentation()
+    math_utils = instrumentation.instrument(MathUtils(), 'math_utils')
+    assert 'standard_deviation' in vars(math_utils)
+    instrumentation.uninstrument_all()
+    assert 'standard_deviation' not in vars(math_utils)
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        instrumentation = Instrumentation(trace_memory=True)
+        math_utils = instrumentation.instrument(MathUtils(), 'math_utils')
+        math_utils.standard_deviation([float(n) for n in range(1000)])
+        assert instrumentation.stats[('math_utils', 'standard_deviation')].peak_samples == 1
+        instrumentation.uninstrument_all()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    instrumentation = Instrumentation(trace_memory=True)
+    instrumentation.uninstrument_all()
+    assert not tracemalloc.is_tracing()
+
+def test_bytes_count_content_and_files_processed(tmp_path):
+    instrumentation = Instrumentation()
+    file_ops = instrumentation.instrument(FileOps(), 'file_ops')
+    crypto = instrumentation.instrument(CryptoUtils(), 'crypto_utils')
+    json_utils = instrumentation.instrument(JSONUtils(), 'json_utils')
+    source, copy = str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')
+    file_ops.create_file(source, 'h\u00e9llo')
+    file_ops.read_file(source)
+    file_ops.copy_file(source, copy)
+    file_ops.move_file(copy, str(tmp_path / 'c.txt'))
+    file_ops.read_file(str(tmp_path / 'missing.txt'))
+    crypto.sha256_hash('x' * 1000)
+    crypto.hash_file(source)
+    json_utils.save_json(str(tmp_path / 'd.json'), {'key': [1, 2, 3]})
+    size = (tmp_path / 'd.json').stat().st_size
+    
+    def processed(utility, method):
+        return instrumentation.stats[(utility, method)].bytes
+    assert processed('file_ops', 'create_file') == 6
+    assert processed('file_ops', 'read_file') == 6
+    assert processed('file_ops', 'copy_file') == 6
+    assert processed('file_ops', 'move_file') == 6
+    assert processed('crypto_utils', 'sha256_hash') == 1000
+    assert processed('crypto_utils', 'hash_file') == 6
+    assert processed('json_utils', 'save_json') == size
+    output = instrumentation.prometheus()
+    assert 'bigutility_method_bytes_total{utility="file_ops",method="read_file"} 6' in output
+    assert 'method="file_exists"' not in output
+    header, *rows = instrumentation.report().splitlines()
+    assert 'bytes' in header
+    assert any(row.startswith('crypto_utils.sha256_hash') and '1,000' in row for row in rows)
+
+def test_unmeasured_methods_have_no_bytes_metric():
+    instrumentation = Instrumentation()
+    instrumentation.instrument(MathUtils(), 'math_utils').average([1, 2, 3])
+    output = instrumentation.prometheus()
+    assert 'bigutility_method_calls_total{utility="math_utils",method="average"} 1' in output
+    assert 'bigutility_method_bytes_total{' not in output
+
+def test_metrics_options_are_stripped_before_dispatch(monkeypatch):
+    seen = {}
+    
+    def run_benchmarks(argv):
+        seen['argv'] = argv
+        return 0
+    monkeypatch.setattr(benchmarks, 'main', run_benchmarks)
+    monkeypatch.setattr(atexit, 'register', lambda func: func)
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--bench', 'flatten', '--metrics', 'text', '--trace-memory',
+                                      '--sizes', '10'])
+    with pytest.raises(SystemExit) as exit_info:
+        main_module.main()
+    assert exit_info.value.code == 0
+    assert seen['argv'] == ['flatten', '--sizes', '10']
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def test_metrics_first_runs_the_demo(monkeypatch):
+    ran = []
+    monkeypatch.setattr(main_module.BigUtility, 'demo_all_features', lambda self: ran.append(True))
+    monkeypatch.setattr(atexit, 'register', lambda func: func)
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--metrics', 'prometheus'])
+    main_module.main()
+    assert ran == [True]
+
+def test_unknown_metrics_format_exits(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--metrics', 'json'])
+    with pytest.raises(SystemExit) as exit_info:
+        main_module.main()
+    assert exit_info.value.code == 2
+    assert 'Unknown metrics format' in capsys.readouterr().err
\ No newline at end of file
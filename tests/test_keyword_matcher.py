@@ -0,0 +1,71 @@
+"""Tests for the Aho-Corasick keyword matcher against a regex reference"""
+
+import random
+import re
+
+import pytest
+
+from modules.keyword_matcher import KeywordMatcher
+
+def _reference(keywords, text, case_insensitive=False, whole_word=False):
+    """Every (start, end, keyword) occurrence, overlapping ones included, found with one regex per keyword"""
+    flags = re.IGNORECASE if case_insensitive else 0
+    matches = []
+    for keyword in keywords:
+        body = f'(?=({re.escape(keyword)}))'
+        if whole_word:
+            body = f'(?<!\\w)(?=({re.escape(keyword)})(?!\\w))'
+        for match in re.finditer(body, text, flags):
+            matches.append((match.start(1), match.end(1), keyword))
+    return sorted(matches)
+
+def _sorted_by_end(matches):
+    # The automaton reports matches by end offset, longest first
+    return sorted(matches, key=lambda match: (match[1], match[0]))
+
+def _random_case(rng, keywords):
+    return [''.join(rng.choice((c, c.upper())) for c in keyword) for keyword in keywords]
+
+@pytest.mark.parametrize('case_insensitive', [False, True])
+@pytest.mark.parametrize('whole_word', [False, True])
+def test_matches_regex_reference(case_insensitive, whole_word):
+    rng = random.Random(3)
+    for _ in range(200):
+        keywords = list({''.join(rng.choice('abc') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 8))})
+        text = ''.join(rng.choice('abcAB _-') for _ in range(rng.randint(0, 60)))
+        if case_insensitive:
+            keywords = _random_case(rng, keywords)
+        matcher = KeywordMatcher(keywords, case_insensitive, whole_word)
+        matches = matcher.find_all(text)
+        assert sorted(matches) == _reference(keywords, text, case_insensitive, whole_word)
+        assert [end for _, end, _ in matches] == sorted(end for _, end, _ in matches)
+        assert matcher.contains_any(text) == bool(matches)
+
+def test_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(['he', 'she', 'his', 'hers', 'e'])
+    assert matcher.find_all('ushers') == [(1, 4, 'she'), (2, 4, 'he'), (3, 4, 'e'), (2, 6, 'hers')]
+    assert matcher.count('she said hers') == {'she': 1, 'he': 2, 'e': 2, 'hers': 1}
+
+def test_case_insensitive_whole_words():
+    matcher = KeywordMatcher(['Äpfel', 'cat'], case_insensitive=True, whole_word=True)
+    assert matcher.find_all('ÄPFEL, concat, CAT_x, cat.') == [(0, 5, 'Äpfel'), (22, 25, 'cat')]
+
+def test_keywords_added_later_rebuild_the_automaton():
+    matcher = KeywordMatcher(['ab'])
+    assert matcher.find_all('xabc') == [(1, 3, 'ab')]
+    matcher.add('bc')
+    assert matcher.find_all('xabc') == [(1, 3, 'ab'), (2, 4, 'bc')]
+    with pytest.raises(ValueError):
+        matcher.add('')
+
+def test_round_trip_through_a_file(tmp_path):
+    keywords = ['he', 'she', 'his', 'hers', 'Hi']
+    matcher = KeywordMatcher(keywords, case_insensitive=True)
+    path = str(tmp_path / 'matcher.json')
+    assert matcher.save(path)
+    restored = KeywordMatcher.load(path)
+    assert (restored.case_insensitive, restored.whole_word, restored.keywords) == (True, False, keywords)
+    text = 'Ushers and HIS history'
+    assert restored.find_all(text) == matcher.find_all(text) == _sorted_by_end(_reference(keywords, text, True))
+    restored.add('story')
+    assert (17, 22, 'story') in restored.find_all(text)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Tests for rotating, compressed log files"""
+
+import gzip
+import shutil
+import time
+
+import pytest
+
+from modules.logger_setup import setup_logger, shutdown_logging
+
+@pytest.mark.parametrize('use_queue', [True, False])
+def test_size_rotation_keeps_every_line(tmp_path, monkeypatch, use_queue):
+    copy = shutil.copyfileobj
+    
+    def slow_copy(*args, **kwargs):
+        # Slow compression down so overlapping rollovers would show up
+        time.sleep(0.005)
+        return copy(*args, **kwargs)
+    monkeypatch.setattr(shutil, 'copyfileobj', slow_copy)
+    log_file = tmp_path / 'app.log'
+    logger = setup_logger(f'test_rotation_{use_queue}', log_file=str(log_file), use_queue=use_queue,
+                          rotation='size', max_bytes=2000, backup_count=1000)
+    for i in range(3000):
+        logger.debug("line %s", i)
+    shutdown_logging()
+    for handler in list(logger.handlers):
+        handler.close()
+        logger.removeHandler(handler)
+    lines = log_file.read_text().splitlines()
+    for backup in tmp_path.glob('app.log.*.gz'):
+        with gzip.open(backup, 'rt') as f:
+            lines.extend(f.read().splitlines())
+    assert sorted(int(line.rsplit(' ', 1)[1]) for line in lines) == list(range(3000))
+    assert not list(tmp_path.glob('.rotating-*'))
\ No newline at end of file
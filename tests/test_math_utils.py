@@ -0,0 +1,52 @@
+"""Tests for MathUtils statistics and memoization"""
+
+import math
+from array import array
+
+import pytest
+
+from modules.math_utils import MEMO_MAX_FACTORIAL, MEMO_MAX_FIBONACCI, MathUtils
+
+def test_python_backend_sums_floats_exactly():
+    math_utils = MathUtils()
+    values = array('d', [1e16, 1.0, -1e16])
+    assert math_utils.average(memoryview(values), backend='python') == 1 / 3
+
+def test_python_backend_keeps_integers_exact():
+    math_utils = MathUtils()
+    assert math_utils.sum_of_squares([10 ** 200] * 2, backend='python') == 2 * 10 ** 400
+    assert math_utils.sum_of_squares([1, 2, 3], backend='python') == 14
+    assert math_utils.average([1, 2, 3, 4], backend='python') == 2.5
+
+def test_small_ndarrays_use_the_python_path():
+    np = pytest.importorskip('numpy')
+    math_utils = MathUtils()
+    assert math_utils.average(np.arange(10.)) == 4.5
+    assert math_utils.average(np.array([], dtype=float)) == 0
+
+def test_integer_ndarrays_do_not_overflow():
+    np = pytest.importorskip('numpy')
+    math_utils = MathUtils()
+    assert math_utils.sum_of_squares(np.array([2 ** 32] * 200)) == 200 * 2 ** 64
+    assert math_utils.sum_of_squares(np.array([2 ** 32] * 3), backend='python') == 3 * 2 ** 64
+    assert math_utils.average(np.array([2 ** 62] * 4), backend='python') == 2 ** 62
+
+def test_memo_keys_are_typed():
+    math_utils = MathUtils()
+    math_utils.clear_caches()
+    assert math_utils.fibonacci_number(7) == 13
+    math_utils.fibonacci_number(7)
+    assert math_utils.cache_stats()['math_utils.fibonacci']['hits'] == 1
+    with pytest.raises(TypeError):
+        math_utils.fibonacci_number(7.0)
+    assert math_utils.is_prime(7.0) is True
+    assert math_utils.is_prime(7.5) is False
+
+def test_large_results_are_not_cached():
+    math_utils = MathUtils()
+    math_utils.clear_caches()
+    assert math_utils.factorial(MEMO_MAX_FACTORIAL + 1) == math.factorial(MEMO_MAX_FACTORIAL + 1)
+    assert math_utils.fibonacci_number(MEMO_MAX_FIBONACCI + 1) > 0
+    stats = math_utils.cache_stats()
+    assert stats['math_utils.factorial']['size'] == 0
+    assert stats['math_utils.fibonacci']['size'] == 0
\ No newline at end of file
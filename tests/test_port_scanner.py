@@ -0,0 +1,37 @@
+"""Tests for the async port scanner against local sockets"""
+
+import socket
+
+import pytest
+
+from modules.port_scanner import scan
+
+@pytest.fixture
+def listening_port():
+    with socket.socket() as server:
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        yield server.getsockname()[1]
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def test_scan_reports_open_and_closed_ports(listening_port):
+    closed = _closed_port()
+    results = {r['port']: r for r in scan([('127.0.0.1', listening_port), ('127.0.0.1', closed)], timeout=1)}
+    assert results[listening_port]['open'] is True
+    assert results[closed]['open'] is False
+
+@pytest.mark.parametrize('port', [70000, -1])
+def test_invalid_port_is_recorded_not_raised(listening_port, port):
+    results = {r['port']: r for r in scan([('127.0.0.1', port), ('127.0.0.1', listening_port)], timeout=1)}
+    assert results[port]['open'] is False
+    assert results[port]['error'] == 'port must be in 0..65535'
+    assert results[listening_port]['open'] is True
+
+def test_malformed_host_is_recorded_not_raised(listening_port):
+    results = list(scan([('bad\x00host', 80), ('127.0.0.1', listening_port)], timeout=1))
+    assert len(results) == 2
+    assert any(r['open'] for r in results)
\ No newline at end of file
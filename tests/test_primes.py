@@ -0,0 +1,57 @@
+"""Tests for the segmented prime sieve and deterministic Miller-Rabin"""
+
+import pytest
+
+from modules.math_utils import MathUtils
+from modules.primes import PrimeSieve, miller_rabin
+
+def _naive_primes(start, stop):
+    return [n for n in range(max(start, 2), stop) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+
+@pytest.fixture
+def small_sieve():
+    # A tiny cache and segments force the segmented paths on small numbers
+    return PrimeSieve(initial_limit=50, max_cached=200, segment_size=16)
+
+def test_count_primes_matches_pi():
+    math_utils = MathUtils()
+    assert math_utils.count_primes(0, 10 ** 6) == 78498
+    assert math_utils.count_primes(0, 10 ** 7) == 664579
+    assert math_utils.count_primes(10 ** 6, 10 ** 7) == 664579 - 78498
+
+@pytest.mark.parametrize('start, stop', [
+    (0, 2), (0, 3), (2, 3), (3, 4), (4, 5), (0, 1000), (97, 98), (98, 98), (100, 50), (-10, 10),
+    (64, 96), (65, 97), (33, 65), (200, 233), (201, 233), (999, 1034), (1000, 1033), (1001, 1001),
+])
+def test_segmented_ranges_match_naive(small_sieve, start, stop):
+    expected = _naive_primes(start, stop)
+    assert list(small_sieve.primes(start, stop)) == expected
+    assert small_sieve.count(start, stop) == len(expected)
+
+def test_every_range_over_segment_edges(small_sieve):
+    expected = _naive_primes(0, 400)
+    for start in range(0, 140, 3):
+        for stop in range(start, 400, 31):
+            assert list(small_sieve.primes(start, stop)) == [p for p in expected if start <= p < stop]
+            assert small_sieve.count(start, stop) == len([p for p in expected if start <= p < stop])
+
+def test_is_prime_batch_with_negatives_and_uncached_values(small_sieve):
+    values = [-7, -2, -1, 0, 1, 2, 3, 4, 97, 199, 211, 221, 10 ** 9 + 7]
+    assert small_sieve.is_prime_batch(values) == [False] * 5 + [True, True, False, True, True, True, False, True]
+    assert small_sieve.is_prime_batch([]) == []
+
+@pytest.mark.parametrize('n', [2 ** 31 - 1, 2 ** 61 - 1, 1000000000000000003, 2 ** 64 - 59])
+def test_known_64_bit_primes(n):
+    assert miller_rabin(n)
+    assert PrimeSieve(initial_limit=100).is_prime(n)
+
+@pytest.mark.parametrize('n', [
+    561,                    # Carmichael number
+    2047,                   # strong pseudoprime to base 2
+    3215031751,             # strong pseudoprime to bases 2, 3, 5 and 7
+    3825123056546413051,    # strong pseudoprime to bases 2 through 23
+    2 ** 64 - 1,
+    (2 ** 32 - 5) * (2 ** 32 - 17),
+])
+def test_pseudoprimes_and_composites(n):
+    assert not miller_rabin(n)
\ No newline at end of file
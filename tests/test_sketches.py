@@ -0,0 +1,21 @@
+"""Tests for sketch serialization"""
+
+import pytest
+
+from modules.sketches import HyperLogLog, sketch_from_dict
+
+def test_round_trip():
+    sketch = HyperLogLog()
+    for i in range(1000):
+        sketch.add(i)
+    assert sketch_from_dict(sketch.to_dict()).count() == sketch.count()
+
+def test_unknown_type():
+    with pytest.raises(ValueError, match="Unknown sketch type: nope"):
+        sketch_from_dict({'type': 'nope'})
+
+def test_missing_field_is_not_reported_as_unknown_type():
+    data = HyperLogLog().to_dict()
+    del data['registers']
+    with pytest.raises(ValueError, match="Missing sketch field: registers"):
+        sketch_from_dict(data)
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Tests for mergeable running statistics and the P-square quantile estimator"""
+
+import json
+import random
+import statistics
+
+import pytest
+
+from modules.streaming_stats import P2Quantile, RunningStats
+
+@pytest.fixture
+def values():
+    rng = random.Random(5)
+    return [rng.gauss(1e6, 250.0) for _ in range(10000)] + [rng.randint(-50, 50) for _ in range(999)]
+
+def test_single_pass_matches_exact_statistics(values):
+    stats = RunningStats().update(values, chunk_size=1000)
+    assert stats.count == len(values)
+    assert (stats.min, stats.max) == (min(values), max(values))
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-14)
+    assert stats.variance() == pytest.approx(statistics.pvariance(values), rel=1e-12)
+    assert stats.stdev(ddof=1) == pytest.approx(statistics.stdev(values), rel=1e-12)
+
+@pytest.mark.parametrize('cuts', [(0, 1, 5000), (3333, 3334, 7000), (10998, 10999, 10999)])
+def test_merged_shards_match_a_single_pass(values, cuts):
+    single = RunningStats().update(values)
+    bounds = (0,) + cuts + (len(values),)
+    shards = [RunningStats().update(values[lo:hi]) for lo, hi in zip(bounds, bounds[1:])]
+    merged = RunningStats()
+    for shard in shards:
+        merged.merge(shard)
+    assert (merged.count, merged.min, merged.max) == (single.count, single.min, single.max)
+    assert merged.mean == pytest.approx(single.mean, rel=1e-14)
+    assert merged.variance() == pytest.approx(single.variance(), rel=1e-12)
+
+def test_add_and_update_agree():
+    data = [3, 1, 4, 1, 5, 9, 2, 6]
+    one_by_one = RunningStats()
+    for x in data:
+        one_by_one.add(x)
+    chunked = RunningStats().update(data, chunk_size=3)
+    assert (one_by_one.count, one_by_one.min, one_by_one.max) == (chunked.count, chunked.min, chunked.max)
+    assert one_by_one.mean == pytest.approx(chunked.mean) == statistics.fmean(data)
+    assert one_by_one.variance(ddof=1) == pytest.approx(chunked.variance(ddof=1)) == pytest.approx(statistics.variance(data))
+
+def test_empty_and_single_value():
+    empty = RunningStats()
+    assert (empty.count, empty.min, empty.variance(), empty.stdev(ddof=1)) == (0, None, 0.0, 0.0)
+    assert RunningStats().merge(empty).count == 0
+    one = RunningStats().merge(RunningStats().update([7]))
+    assert (one.count, one.mean, one.min, one.max, one.variance()) == (1, 7.0, 7, 7, 0.0)
+
+def test_dict_round_trip_through_json(values):
+    stats = RunningStats().update(values)
+    restored = RunningStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+    assert restored.to_dict() == stats.to_dict()
+    assert restored.merge(stats).count == 2 * len(values)
+
+@pytest.mark.parametrize('q', [0.1, 0.5, 0.9, 0.99])
+def test_p2_quantile_accuracy(q):
+    rng = random.Random(int(q * 100))
+    uniform = [rng.random() for _ in range(20000)]
+    assert P2Quantile(q).update(uniform).value() == pytest.approx(q, abs=0.01)
+    normal = [rng.gauss(0, 1) for _ in range(20000)]
+    expected = statistics.NormalDist().inv_cdf(q)
+    assert P2Quantile(q).update(normal).value() == pytest.approx(expected, abs=0.05)
+
+def test_p2_quantile_is_exact_for_few_values():
+    assert P2Quantile(0.5).value() is None
+    assert P2Quantile(0.5).update([5, 1, 3]).value() == 3
+    assert P2Quantile(0.0).update([5, 1, 3, 2]).value() == 1
+    assert P2Quantile(1.0).update([5, 1, 3, 2, 4]).value() == 5
+    with pytest.raises(ValueError):
+        P2Quantile(1.5)
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Tests for SystemUtils CPU readings and the metrics sampler"""
+
+import psutil
+
+from modules.metrics_sampler import MetricsSampler
+from modules.system_utils import SystemUtils
+
+def test_sampler_keeps_its_own_cpu_baseline(monkeypatch):
+    def shared_baseline(*args, **kwargs):
+        raise AssertionError("sampler must not touch psutil.cpu_percent's shared baseline")
+    monkeypatch.setattr(psutil, 'cpu_percent', shared_baseline)
+    sampler = MetricsSampler(interval=0.01)
+    sampler.sample_now()
+    sum(range(200000))
+    assert 0.0 <= sampler.sample_now()['cpu_percent'] <= 100.0
+
+def test_stopped_sampler_is_not_used_for_cpu_percent(monkeypatch):
+    system = SystemUtils()
+    sampler = system.start_sampler(interval=0.01)
+    sampler.sample_now()
+    system.stop_sampler()
+    sampler.latest()['cpu_percent'] = -1.0
+    monkeypatch.setattr(psutil, 'cpu_percent', lambda interval=None: 42.0)
+    assert system.get_cpu_percent() == 42.0
+    assert system.get_metrics_summary(window=None)
+
+def test_demo_survives_unreadable_process_stats(monkeypatch, capsys):
+    def denied(self, interval=None):
+        raise psutil.AccessDenied()
+    monkeypatch.setattr(psutil.Process, 'cpu_percent', denied)
+    SystemUtils().demo()
+    out = capsys.readouterr().out
+    assert '✓ Processes:' in out
+    assert 'Sampled process' not in out
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""Tests for chunked and sharded regex scanning of files"""
+
+import random
+
+import pytest
+
+from modules.string_utils import EMAIL_BYTES_PATTERN
+from modules.text_stream import scan_file, scan_file_parallel
+
+def _whole_file(data):
+    return [(match.start(), match.group()) for match in EMAIL_BYTES_PATTERN.finditer(data)]
+
+@pytest.fixture
+def fuzz_files(tmp_path):
+    rng = random.Random(7)
+    files = []
+    while len(files) < 300:
+        data = bytes(rng.choice(b'ax._@mecom -') for _ in range(rng.randint(20, 400)))
+        # Keep to scan_file's contract: no match longer than max_match
+        if any(len(match) > 16 for _, match in _whole_file(data)):
+            continue
+        path = tmp_path / f'{len(files)}.txt'
+        path.write_bytes(data)
+        files.append((str(path), data))
+    return files
+
+def test_chunk_boundaries_match_whole_file_finditer(fuzz_files):
+    for path, data in fuzz_files:
+        expected = _whole_file(data)
+        for chunk_size in (17, 19, 23, 29, 64):
+            assert list(scan_file(path, EMAIL_BYTES_PATTERN, chunk_size=chunk_size, max_match=16)) == expected
+
+def test_match_right_after_a_chunk_boundary(tmp_path):
+    # The second match starts where the first, deferred one ends; resuming one byte early lost it
+    data = b'e .@cmoc_ ae_a@o.mem-@m.xx.x e_  _emo ccm'
+    path = tmp_path / 'boundary.txt'
+    path.write_bytes(data)
+    expected = _whole_file(data)
+    assert expected == [(10, b'ae_a@o.mem'), (20, b'-@m.xx')]
+    for chunk_size in range(17, 48):
+        assert list(scan_file(str(path), EMAIL_BYTES_PATTERN, chunk_size=chunk_size, max_match=16)) == expected
+
+def test_shards_match_whole_file_finditer(fuzz_files):
+    for path, data in fuzz_files[:10]:
+        expected = _whole_file(data)
+        for shard_size in (37, 100):
+            assert list(scan_file_parallel(path, EMAIL_BYTES_PATTERN, workers=2, shard_size=shard_size,
+                                           chunk_size=29, max_match=16)) == expected
+
+def test_match_straddling_a_shard_start_is_not_split(tmp_path):
+    # The second shard starts at 'ef@me.com', which is a match on its own
+    data = b' ' * 990 + b'ab.cd.ef@me.com' + b' ' * 100 + b'q@me.com '
+    path = tmp_path / 'straddle.txt'
+    path.write_bytes(data)
+    expected = [(990, b'ab.cd.ef@me.com'), (1105, b'q@me.com')]
+    assert _whole_file(data) == expected
+    assert list(scan_file_parallel(str(path), EMAIL_BYTES_PATTERN, workers=2, shard_size=996,
+                                   chunk_size=129, max_match=64)) == expected
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Tests for streaming tumbling and sliding window aggregation"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from modules.date_time_utils import DateTimeUtils
+from modules.time_windows import TimeWindowAggregator, aggregate_windows, parse_duration
+
+def _brute_force(records, size, slide):
+    """Windows [start, start + size), starts aligned to slide, holding each in-order record"""
+    windows = {}
+    for t, value in records:
+        start = t - t % slide
+        while start > t - size:
+            windows.setdefault(start, []).append(value)
+            start -= slide
+    return [{'start': start, 'end': start + size, 'key': None, 'count': len(values), 'sum': sum(values),
+             'min': min(values), 'max': max(values), 'mean': sum(values) / len(values)}
+            for start, values in sorted(windows.items())]
+
+def test_tumbling_windows_close_as_the_watermark_passes():
+    aggregator = TimeWindowAggregator(60)
+    assert aggregator.add(0, 1) == []
+    assert aggregator.add(10, 2) == []
+    assert aggregator.add(59, 3) == []
+    closed = aggregator.add(60, 4)
+    assert closed == [{'start': 0, 'end': 60, 'key': None, 'count': 3, 'sum': 6, 'min': 1, 'max': 3, 'mean': 2.0}]
+    assert [w['start'] for w in aggregator.add(125, 5)] == [60]
+    assert aggregator.open_windows == 1
+    assert [(w['start'], w['count']) for w in aggregator.flush()] == [(120, 1)]
+    assert aggregator.open_windows == 0
+
+@pytest.mark.parametrize('size, slide', [(60, 60), (60, 20), (60, 7), (10, 1)])
+def test_windows_match_brute_force(size, slide):
+    rng = random.Random(size * 100 + slide)
+    records = sorted((rng.randrange(1000), rng.randrange(100)) for _ in range(300))
+    result = list(aggregate_windows(({'t': t, 'v': v} for t, v in records), 't', size, 'v', slide=slide))
+    assert sorted(result, key=lambda w: w['start']) == _brute_force(records, size, slide)
+
+def test_sliding_record_lands_in_every_covering_window():
+    aggregator = TimeWindowAggregator('1m', slide='20s')
+    aggregator.add(65, 1)
+    assert sorted(w['start'] for w in aggregator.flush()) == [20, 40, 60]
+
+def test_late_records_within_and_beyond_allowed_lateness():
+    aggregator = TimeWindowAggregator(10, allowed_lateness=5)
+    aggregator.add(12, 1)
+    assert aggregator.watermark == 7
+    assert aggregator.add(8, 1) == []
+    closed = aggregator.add(16, 1)
+    assert [(w['start'], w['count']) for w in closed] == [(0, 1)]
+    assert aggregator.add(3, 1) == []
+    assert aggregator.late_records == 1
+    aggregator.add(11, 1)
+    assert aggregator.stats() == {'watermark': 11, 'open_windows': 1, 'late_records': 1}
+    assert [(w['start'], w['count']) for w in aggregator.flush()] == [(10, 3)]
+
+def test_partially_late_sliding_record_keeps_its_open_windows():
+    aggregator = TimeWindowAggregator(30, slide=10)
+    aggregator.add(45)
+    # 25 belongs to [0, 30), [10, 40) and [20, 50); only the first two are closed
+    assert aggregator.add(25) == []
+    assert aggregator.late_records == 0
+    assert [(w['start'], w['count']) for w in aggregator.flush()] == [(20, 2), (30, 1), (40, 1)]
+
+def test_groups_and_none_values():
+    records = [{'t': 1, 'k': 'a', 'v': 2}, {'t': 2, 'k': 'b', 'v': None}, {'t': 3, 'k': 'a', 'v': 4}]
+    windows = list(aggregate_windows(records, 't', 10, 'v', 'k'))
+    assert sorted((w['key'], w['count'], w['sum'], w['mean']) for w in windows) == [('a', 2, 6, 3.0), ('b', 1, 0, None)]
+
+def test_naive_timestamps_are_utc():
+    records = [{'time': '2025-01-01 10:05:00', 'value': 1}, {'time': datetime(2025, 1, 1, 10, 59), 'value': 2}]
+    windows = list(DateTimeUtils().aggregate_by_window(records, 'time', '1h', value_key='value'))
+    assert [(w['start'], w['count']) for w in windows] == [(datetime(2025, 1, 1, 10, tzinfo=timezone.utc).timestamp(), 2)]
+
+def test_durations():
+    assert (parse_duration('90s'), parse_duration('1.5m'), parse_duration('2w')) == (90, 90, 1209600)
+    assert parse_duration(0, allow_zero=True) == 0
+    for bad in ('0s', -1):
+        with pytest.raises(ValueError):
+            parse_duration(bad)
+    with pytest.raises(ValueError):
+        TimeWindowAggregator(10, slide=20)
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""Streaming text processing module"""
+
+import heapq
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def iter_text_chunks(filepath: str, chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> Iterator[str]:
+    """Read a text file in chunks that never split a whitespace-delimited token"""
+    with open(filepath, 'r', encoding=encoding, errors='replace') as f:
+        carry = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            chunk = carry + chunk
+            cut = len(chunk)
+            while cut and not chunk[cut - 1].isspace():
+                cut -= 1
+            if cut:
+                carry = chunk[cut:]
+                yield chunk[:cut]
+            else:
+                carry = chunk
+        if carry:
+            yield carry
+
+class WordCounter:
+    """Linear-time, mergeable word frequency counter
+    
+    pattern is a token regex (default: split on whitespace); fold_case is
+    'lower', 'casefold' or None.
+    """
+    
+    def __init__(self, pattern: Optional[str] = None, fold_case: Optional[str] = 'lower'):
+        if fold_case not in ('lower', 'casefold', None):
+            raise ValueError(f"Unknown fold_case: {fold_case}")
+        self.pattern = pattern
+        self.fold_case = fold_case
+        self.counts: Counter = Counter()
+        self._tokenize = re.compile(pattern).findall if pattern else str.split
+    
+    def update_text(self, text: str) -> 'WordCounter':
+        """Count the words in a string"""
+        if self.fold_case == 'lower':
+            text = text.lower()
+        elif self.fold_case == 'casefold':
+            text = text.casefold()
+        self.counts.update(self._tokenize(text))
+        return self
+    
+    def update_lines(self, lines: Iterable[str], batch_size: int = 1000) -> 'WordCounter':
+        """Count the words in an iterable of lines, tokenizing them in batches"""
+        iterator = iter(lines)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return self
+            self.update_text('\n'.join(batch))
+    
+    def update_file(self, filepath: str, chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> 'WordCounter':
+        """Count the words in a file, reading it chunk by chunk"""
+        for chunk in iter_text_chunks(filepath, chunk_size, encoding):
+            self.update_text(chunk)
+        return self
+    
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Top-k words by count (heap selection, all words sorted when k is None)"""
+        if k is None:
+            return sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)
+        return heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1])
+    
+    def merge(self, other: 'WordCounter') -> 'WordCounter':
+        """Merge counts from another counter (e.g. from a worker on another shard)"""
+        self.counts.update(other.counts)
+        return self
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Get plain word -> count dict"""
+        return dict(self.counts)
+
+def _count_file(args: Tuple[str, Optional[str], Optional[str]]) -> WordCounter:
+    """Process pool worker counting one file shard"""
+    filepath, pattern, fold_case = args
+    return WordCounter(pattern, fold_case).update_file(filepath)
+
+def count_words_in_files(filepaths: Iterable[str], pattern: Optional[str] = None,
+                         fold_case: Optional[str] = 'lower', workers: Optional[int] = None) -> WordCounter:
+    """Count words across file shards in parallel worker processes and merge the results"""
+    filepaths = list(filepaths)
+    total = WordCounter(pattern, fold_case)
+    if len(filepaths) <= 1 or workers == 1:
+        for filepath in filepaths:
+            total.update_file(filepath)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counter in pool.map(_count_file, [(path, pattern, fold_case) for path in filepaths]):
+            total.merge(counter)
+    return total
+
+def scan_file(filepath: str, pattern: 're.Pattern', start: int = 0, end: Optional[int] = None,
+              chunk_size: int = 1 << 20, max_match: int = 1024) -> Iterator[Tuple[int, bytes]]:
+    """Lazily yield (byte_offset, match) for matches of a bytes pattern starting in [start, end)
+    
+    Matches are the ones pattern.finditer would find on the whole file searching
+    from start. The file is read in chunks; the search resumes where it left
+    off, with the previous max_match bytes kept as context so word boundaries
+    and lookbehinds see the real preceding bytes. A match starting in the last
+    max_match bytes of the buffer is deferred to the next read, so matches up
+    to max_match bytes long are never split or lost at chunk boundaries.
+    """
+    if chunk_size <= max_match:
+        raise ValueError("chunk_size must be larger than max_match")
+    with open(filepath, 'rb') as f:
+        base = max(start - max_match, 0)
+        f.seek(base)
+        buffer = b''
+        pos = start
+        empty_at = None
+        while True:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            if not eof and len(buffer) - (pos - base) <= max_match:
+                continue
+            limit = len(buffer) if eof else len(buffer) - max_match
+            resume = limit
+            for match in pattern.finditer(buffer, pos - base):
+                match_start, match_end = match.span()
+                if match_start >= limit or (not eof and match_end == len(buffer)):
+                    resume = min(match_start, limit)
+                    break
+                offset = base + match_start
+                if match_start == match_end and offset == empty_at:
+                    # finditer never repeats an empty match where the last read's search stopped
+                    continue
+                if end is not None and offset >= end:
+                    return
+                yield offset, match.group()
+                pos = base + match_end
+                empty_at = pos if match_start == match_end else None
+            if eof:
+                return
+            pos = max(pos, base + resume)
+            if end is not None and pos >= end:
+                return
+            keep = pos - max_match - base
+            if keep > 0:
+                base += keep
+                buffer = buffer[keep:]
+
+def _scan_shard(args: Tuple) -> List[Tuple[int, bytes]]:
+    """Process pool worker scanning one byte range of a file"""
+    return list(scan_file(*args))
+
+def _resync(filepath: str, pattern: 're.Pattern', frontier: int, end: int, matches: List[Tuple[int, bytes]],
+            chunk_size: int, max_match: int) -> List[Tuple[int, bytes]]:
+    """Rescan a shard from the end of the previous shard's last match until the two scans agree"""
+    rescanned = []
+    index = {(offset, match): i for i, (offset, match) in enumerate(matches)}
+    for offset, match in scan_file(filepath, pattern, frontier, end, chunk_size, max_match):
+        if (offset, match) in index:
+            return rescanned + matches[index[offset, match]:]
+        rescanned.append((offset, match))
+    return rescanned
+
+def scan_file_parallel(filepath: str, pattern: 're.Pattern', workers: Optional[int] = None,
+                       shard_size: int = 64 << 20, chunk_size: int = 1 << 20,
+                       max_match: int = 1024) -> Iterator[Tuple[int, bytes]]:
+    """Like scan_file, but scans shard_size byte ranges in worker processes, yielding in file order
+    
+    Each shard searches from its first byte. When the previous shard's last
+    match runs past that byte, the shard's start is rescanned from the end of
+    that match (usually a few bytes) until it agrees with the worker's results.
+    """
+    size = os.path.getsize(filepath)
+    if size <= shard_size or workers == 1:
+        yield from scan_file(filepath, pattern, chunk_size=chunk_size, max_match=max_match)
+        return
+    shards = [(filepath, pattern, start, min(start + shard_size, size), chunk_size, max_match)
+              for start in range(0, size, shard_size)]
+    frontier = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard, matches in zip(shards, pool.map(_scan_shard, shards)):
+            if frontier > shard[2]:
+                matches = _resync(filepath, pattern, frontier, shard[3], matches, chunk_size, max_match)
+            for offset, match in matches:
+                yield offset, match
+                frontier = offset + len(match)
\ No newline at end of file
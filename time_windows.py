@@ -0,0 +1,185 @@
+"""Time-windowed aggregation module"""
+
+import heapq
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Union
+import logging
+from modules.calendar_tables import SECONDS_PER_DAY, epoch_from_datetime
+from modules.date_parsing import DEFAULT_DATETIME_FORMAT, parse_datetime
+
+logger = logging.getLogger(__name__)
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': SECONDS_PER_DAY, 'w': 7 * SECONDS_PER_DAY}
+
+def parse_duration(duration: Union[int, float, str], allow_zero: bool = False) -> Union[int, float]:
+    """Seconds in a duration given as seconds or as a string like '30s', '5m', '1h', '1d', '2w'"""
+    if isinstance(duration, str):
+        text = duration.strip().lower()
+        if text and text[-1] in DURATION_UNITS:
+            amount = float(text[:-1])
+            seconds = amount * DURATION_UNITS[text[-1]]
+        else:
+            seconds = float(text)
+        seconds = int(seconds) if seconds == int(seconds) else seconds
+    else:
+        seconds = duration
+    if seconds < 0 or (seconds == 0 and not allow_zero):
+        raise ValueError(f"Duration must be positive: {duration!r}")
+    return seconds
+
+def to_epoch(timestamp: Union[int, float, str, datetime], fmt: str = DEFAULT_DATETIME_FORMAT) -> Union[int, float]:
+    """Epoch seconds of a number, datetime or formatted string (naive values are read as UTC)"""
+    if isinstance(timestamp, (int, float)):
+        return timestamp
+    if isinstance(timestamp, str):
+        timestamp = parse_datetime(timestamp, fmt)
+    return epoch_from_datetime(timestamp)
+
+class WindowAggregate:
+    """count/sum/min/max/mean of the values in one window"""
+    
+    __slots__ = ('count', 'values', 'total', 'minimum', 'maximum')
+    
+    def __init__(self):
+        self.count = 0
+        self.values = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+    
+    def add(self, value: Optional[float] = None) -> None:
+        """Add a record; None values are counted but not aggregated"""
+        self.count += 1
+        if value is None:
+            return
+        self.values += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+    
+    def merge(self, other: 'WindowAggregate') -> 'WindowAggregate':
+        """Merge another aggregate into this one"""
+        self.count += other.count
+        self.values += other.values
+        self.total += other.total
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+        return self
+    
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the aggregated values"""
+        return self.total / self.values if self.values else None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the aggregates as a dict"""
+        return {'count': self.count, 'sum': self.total, 'min': self.minimum, 'max': self.maximum, 'mean': self.mean}
+
+class TimeWindowAggregator:
+    """Streaming tumbling/sliding window aggregator with bounded lateness
+    
+    Windows are [start, start + size) with starts aligned to multiples of slide
+    since the epoch (slide == size gives tumbling windows). The watermark trails
+    the newest timestamp seen by allowed_lateness; windows ending at or before it
+    are emitted and forgotten, and records that only fall into such windows are
+    dropped as late. Memory is proportional to the number of open windows.
+    """
+    
+    def __init__(self, size: Union[int, float, str], slide: Optional[Union[int, float, str]] = None,
+                 allowed_lateness: Union[int, float, str] = 0, fmt: str = DEFAULT_DATETIME_FORMAT):
+        self.size = parse_duration(size)
+        self.slide = parse_duration(slide) if slide is not None else self.size
+        if self.slide > self.size:
+            raise ValueError("slide must not be larger than size")
+        self.allowed_lateness = parse_duration(allowed_lateness, allow_zero=True)
+        self.fmt = fmt
+        self.watermark: Optional[Union[int, float]] = None
+        self.late_records = 0
+        self._open: Dict[Union[int, float], Dict[Hashable, WindowAggregate]] = {}
+        self._starts: List[Union[int, float]] = []
+    
+    def _window_starts(self, epoch: Union[int, float]) -> Iterator[Union[int, float]]:
+        """Starts of the windows containing epoch that are still open, newest first"""
+        start = epoch - epoch % self.slide
+        lowest = epoch - self.size
+        if self.watermark is not None:
+            lowest = max(lowest, self.watermark - self.size)
+        while start > lowest:
+            yield start
+            start -= self.slide
+    
+    def add(self, timestamp: Union[int, float, str, datetime], value: Optional[float] = None,
+            key: Hashable = None) -> List[Dict[str, Any]]:
+        """Add a record and return the windows closed by the advancing watermark"""
+        epoch = to_epoch(timestamp, self.fmt)
+        accepted = False
+        for start in self._window_starts(epoch):
+            groups = self._open.get(start)
+            if groups is None:
+                groups = self._open[start] = {}
+                heapq.heappush(self._starts, start)
+            aggregate = groups.get(key)
+            if aggregate is None:
+                aggregate = groups[key] = WindowAggregate()
+            aggregate.add(value)
+            accepted = True
+        if not accepted:
+            self.late_records += 1
+            return []
+        watermark = epoch - self.allowed_lateness
+        if self.watermark is None or watermark > self.watermark:
+            self.watermark = watermark
+            return self._close(watermark)
+        return []
+    
+    def _close(self, watermark: Optional[Union[int, float]]) -> List[Dict[str, Any]]:
+        """Emit and drop the windows ending at or before watermark (all windows when None)"""
+        closed = []
+        starts = self._starts
+        while starts and (watermark is None or starts[0] + self.size <= watermark):
+            start = heapq.heappop(starts)
+            for key, aggregate in self._open.pop(start).items():
+                result = {'start': start, 'end': start + self.size, 'key': key}
+                result.update(aggregate.to_dict())
+                closed.append(result)
+        return closed
+    
+    def update(self, records: Iterable, time_key: str, value_key: Optional[str] = None,
+               group_key: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Feed dict records, lazily yielding windows as they close (call flush() at the end)"""
+        for record in records:
+            value = record.get(value_key) if value_key is not None else None
+            key = record.get(group_key) if group_key is not None else None
+            yield from self.add(record[time_key], value, key)
+    
+    def flush(self) -> List[Dict[str, Any]]:
+        """Emit all open windows (end of stream)"""
+        return self._close(None)
+    
+    @property
+    def open_windows(self) -> int:
+        """Number of open (start, key) windows"""
+        return sum(len(groups) for groups in self._open.values())
+    
+    def stats(self) -> Dict[str, Any]:
+        """Aggregator state summary"""
+        return {
+            'watermark': self.watermark,
+            'open_windows': self.open_windows,
+            'late_records': self.late_records
+        }
+
+def aggregate_windows(records: Iterable, time_key: str, size: Union[int, float, str], value_key: Optional[str] = None,
+                      group_key: Optional[str] = None, slide: Optional[Union[int, float, str]] = None,
+                      allowed_lateness: Union[int, float, str] = 0,
+                      fmt: str = DEFAULT_DATETIME_FORMAT) -> Iterator[Dict[str, Any]]:
+    """Lazily aggregate a stream of dict records into closed windows, flushing at the end"""
+    aggregator = TimeWindowAggregator(size, slide, allowed_lateness, fmt)
+    yield from aggregator.update(records, time_key, value_key, group_key)
+    yield from aggregator.flush()
+    if aggregator.late_records:
+        logger.warning("Dropped %s late records", aggregator.late_records)
\ No newline at end of file
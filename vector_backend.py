@@ -0,0 +1,114 @@
+"""Vectorized statistics backend module"""
+
+import importlib.util
+import math
+import sys
+from typing import Any, Iterable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# numpy is only imported the first time a NumPy path actually runs (it costs
+# tens of milliseconds at startup)
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+np = None
+
+def _numpy():
+    """Import numpy on first use"""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+# Smallest input size at which NumPy beats the pure-Python path, per operation,
+# for (buffer-like input, plain sequence input). None means Python always wins
+# for that kind of input, since converting a list costs more than the sum itself.
+# Re-measure with `python -m modules.benchmarks statistics`.
+CROSSOVER = {
+    'average': (500, None),
+    'median': (500, 1000),
+    'standard_deviation': (100, 100),
+    'sum_of_squares': (100, 100),
+}
+
+def fsum(numbers: Iterable[Any]) -> Any:
+    """Pure-Python sum: floats through math.fsum, ints (and other exact types) kept exact"""
+    exact = 0
+    seen_float = False
+    
+    def floats():
+        nonlocal exact, seen_float
+        for x in numbers:
+            if isinstance(x, float):
+                seen_float = True
+                yield x
+            else:
+                exact += x
+    inexact = math.fsum(floats())
+    return exact + inexact if seen_float else exact
+
+def to_python(numbers: Any) -> Any:
+    """Python scalars of an ndarray (NumPy integer scalars wrap around on overflow); other inputs unchanged"""
+    # An ndarray can only exist if its caller already imported numpy
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        return numbers.ravel().tolist()
+    return numbers
+
+def is_buffer(obj: Any) -> bool:
+    """Check if obj exposes the buffer protocol (array.array, memoryview, bytes, ndarray...)"""
+    try:
+        memoryview(obj)
+        return True
+    except TypeError:
+        return False
+
+def select_backend(operation: str, numbers: Any, backend: str = 'auto') -> str:
+    """Pick 'numpy' or 'python' for an operation on numbers"""
+    if backend == 'python':
+        return 'python'
+    if backend == 'numpy':
+        if not HAS_NUMPY:
+            raise ImportError("NumPy backend requested but numpy is not installed")
+        return 'numpy'
+    if backend != 'auto':
+        raise ValueError(f"Unknown backend: {backend}")
+    if not HAS_NUMPY or not hasattr(numbers, '__len__'):
+        return 'python'
+    buffer_min, sequence_min = CROSSOVER[operation]
+    threshold = buffer_min if is_buffer(numbers) else sequence_min
+    return 'numpy' if threshold is not None and len(numbers) >= threshold else 'python'
+
+def to_array(numbers: Any) -> 'np.ndarray':
+    """View numbers as a 1-D ndarray, sharing memory with buffers instead of copying"""
+    np = _numpy()
+    if isinstance(numbers, np.ndarray):
+        return numbers.ravel()
+    if is_buffer(numbers):
+        return np.asarray(memoryview(numbers)).ravel()
+    return np.asarray(numbers)
+
+def average(numbers: Any) -> float:
+    """Vectorized mean"""
+    values = to_array(numbers)
+    return float(values.mean()) if values.size else 0
+
+def median(numbers: Any) -> float:
+    """Vectorized median (partition based, no full sort)"""
+    values = to_array(numbers)
+    if not values.size:
+        raise ValueError("median of empty data")
+    return float(_numpy().median(values))
+
+def standard_deviation(numbers: Any) -> float:
+    """Vectorized population standard deviation"""
+    values = to_array(numbers)
+    return float(values.std()) if values.size else 0.0
+
+def sum_of_squares(numbers: Any) -> Optional[float]:
+    """Vectorized sum of squares; None for integer data, which must stay exact in Python"""
+    values = to_array(numbers)
+    if values.dtype.kind != 'f':
+        return None
+    return float(_numpy().dot(values, values))
\ No newline at end of file